@@ -13,6 +13,7 @@ try:
     from systemrdl.node import (  # type: ignore
         AddrmapNode,
         FieldNode,
+        MemNode,
         Node,
         RegfileNode,
         RegNode,
@@ -30,6 +31,7 @@ from peakrdl_python_simple.regif.spec import (
     AddressableNodeSpec,
     AddrmapNodeSpec,
     FieldNodeSpec,
+    MemNodeSpec,
     NodeSpec,
     RegfileNodeSpec,
     RegNodeSpec,
@@ -325,6 +327,8 @@ class PythonExporter:  # pylint: disable=too-few-public-methods
                 output = self._add_reg(child, msg)
                 gen += output.generated_code
                 members.append(output)
+            elif isinstance(child, MemNode):
+                members.append(self._add_mem(child, msg))
             else:
                 msg.warning(
                     f"Unsupported type of node ({child.__class__.__name__}) "
@@ -401,6 +405,46 @@ class PythonExporter:  # pylint: disable=too-few-public-methods
             gen + gen_node,
         )
 
+    def _add_mem(
+        self,
+        node: MemNode,
+        msg: MessageHandler,  # pylint: disable=unused-argument
+    ) -> GenStageOutput:
+        """Generate memory.
+
+        Virtual registers of the memory are not generated. The memory content
+        is accessed as a whole (see `MemAccess`).
+
+        Arguments:
+            node -- MemNode.
+            msg -- message handler from top-level.
+
+        Returns:
+            Generated memory output.
+        """
+        return PythonExporter.GenStageOutput(
+            node,
+            "access.MemAccess",
+            MemNodeSpec(
+                node.inst_name,
+                node.type_name,
+                node.orig_type_name,
+                node.external,
+                node.raw_address_offset,
+                node.address_offset,
+                node.raw_absolute_address,
+                node.absolute_address,
+                node.size,
+                node.total_size,
+                node.is_array,
+                node.array_dimensions,
+                node.array_stride,
+                node.is_sw_writable,
+                node.is_sw_readable,
+            ),
+            "",
+        )
+
     def _add_field(
         self,
         node: FieldNode,
@@ -421,6 +465,9 @@ class PythonExporter:  # pylint: disable=too-few-public-methods
         enum: Optional[UserEnumMeta] = node.get_property("encode", default=None)
         if enum is not None:
             encode_type, gen = self._add_enum(enum, msg)
+        # Without default, so `onread` implied by e.g. `rclr` is returned.
+        onread = node.get_property("onread")
+        onwrite = node.get_property("onwrite")
         return PythonExporter.GenStageOutput(
             node,
             "access.FieldAccess",
@@ -444,6 +491,8 @@ class PythonExporter:  # pylint: disable=too-few-public-methods
                 node.is_up_counter,
                 node.is_down_counter,
                 encode_type,
+                onread.name if onread is not None else None,
+                onwrite.name if onwrite is not None else None,
             ),
             gen,
         )
@@ -1,16 +1,37 @@
 """Register and field access Pythonic interface."""
 
+# pylint: disable=too-many-lines
+
 __authors__ = ["Marek Pikuła <marek.pikula at embevity.com>"]
 
-import itertools
+import functools
+import operator
 from abc import ABC
-from typing import Any, Generic, Optional, Type, TypeVar
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
-from .regif import RegisterInterface
+from .async_regif import AsyncRegisterInterface
+from .metrics import AccessStats
+from .regif import CompiledField, RegisterInterface, RegisterTransaction
 from .spec import (
     AddressableNodeSpec,
     AddrmapNodeSpec,
     FieldNodeSpec,
+    MemNodeSpec,
     NodeSpec,
     RegfileNodeSpec,
     RegNodeSpec,
@@ -19,6 +40,9 @@ from .spec import (
 SpecT = TypeVar("SpecT", bound=NodeSpec)
 """Node specification generic type."""
 
+AnyRegisterInterface = Union[RegisterInterface, AsyncRegisterInterface]
+"""Synchronous or asynchronous register interface."""
+
 
 class SpecMixin(Generic[SpecT]):  # pylint: disable=too-few-public-methods
     """Specification mixin.
@@ -65,6 +89,10 @@ class FieldAccess(Generic[T], SpecMixin[FieldNodeSpec], ABC):
     Field type is set as generic, but it needs to be castable to and from
     `int` to work with the register interface. This means it can be, e.g.,
     `int` or any `IntEnum`.
+
+    Everything known from the specification is computed once, so a field
+    attribute access is a single call of the accessor compiled for the
+    register instance (see `RegisterInterface.compile_field()`).
     """
 
     def __init__(self, specification: FieldNodeSpec, field_type: Type[T]):
@@ -77,11 +105,123 @@ class FieldAccess(Generic[T], SpecMixin[FieldNodeSpec], ABC):
         super().__init__(specification)
         self._type = field_type
 
+        spec = self.spec
+        self.lsb = spec.lsb
+        """Position of the field in the register (counting from LSB)."""
+        self.width = spec.width
+        """Width of the field in bits."""
+        self.mask = ((1 << spec.width) - 1) << spec.lsb
+        """Mask of the field bits in the register."""
+        self.readable = spec.is_sw_readable
+        """The field is software-readable."""
+        self.writable = spec.is_sw_writable
+        """The field is software-writable."""
+        self._convert = self._converter(field_type)
+
+    @staticmethod
+    def _converter(field_type: Type[T]) -> Callable[[int], T]:
+        """Get function converting raw field value to the field type.
+
+        Enumerations are converted with a lookup table instead of the
+        (relatively slow) enumeration constructor.
+        """
+        if not issubclass(field_type, Enum):
+            return field_type
+        members: Dict[int, T] = {int(member): member for member in field_type}
+
+        def convert(value: int) -> T:
+            member = members.get(value)
+            return field_type(value) if member is None else member
+
+        return convert
+
+    def _value_property(self) -> property:
+        """Create property decoding the field from a `RegValue`."""
+        lsb = self.lsb
+        mask = (1 << self.width) - 1
+        convert = self._convert
+
+        def decode(value: int) -> T:
+            return convert((value >> lsb) & mask)
+
+        return property(decode, doc=f"Value of field {self.spec.inst_name}.")
+
+    def __set_name__(self, owner: Any, name: str) -> None:
+        """Check the owner class when the field is declared.
+
+        Raises:
+            TypeError: the owner isn't a `RegAccess` class.
+        """
+        if not issubclass(owner, RegAccess):
+            raise TypeError(
+                f"FieldAccess {name} needs to be used as a member of RegAccess."
+            )
+
+    def _check_readable(self) -> None:
+        """Raise RuntimeError if the field is not software-readable."""
+        if not self.readable:
+            raise RuntimeError(f"Field {self.spec.inst_name} is not SW readable.")
+
+    def _check_writable(self) -> None:
+        """Raise RuntimeError if the field is not software-writable."""
+        if not self.writable:
+            raise RuntimeError(f"Field {self.spec.inst_name} is not SW writable.")
+
+    def _cast(self, value: Any) -> T:
+        """Cast value to the field type (e.g., to check values of IntEnum)."""
+        if not isinstance(value, self._type):
+            value = self._type(value)
+        return value
+
+    def _compiled(self, instance: "RegAccess") -> CompiledField:
+        """Get the field accessor compiled for the register interface of `instance`.
+
+        It's created on first use and cached in the register instance until
+        its register interface changes.
+        """
+        # pylint: disable=protected-access
+        regif = instance._bound_regif
+        if regif is None or regif is not instance._binding.regif:
+            regif = instance._bind(instance.regif)
+        compiled = instance._compiled_fields.get(self)
+        if compiled is None:
+            compiled = regif.compile_field(
+                instance.spec.absolute_address, self.lsb, self.width
+            )
+            instance._compiled_fields[self] = compiled
+        return compiled
+
+    def _reader(self, instance: "RegAccess") -> Callable[[], int]:
+        """Get and cache the field read function of `instance`.
+
+        Raises:
+            RuntimeError: field is not software-readable.
+        """
+        self._check_readable()
+        read = self._compiled(instance).read
+        instance._field_readers[self] = read  # pylint: disable=protected-access
+        return read
+
+    def _writer(self, instance: "RegAccess") -> Callable[[int], None]:
+        """Get and cache the field write function of `instance`.
+
+        Raises:
+            RuntimeError: field is not software-writable.
+        """
+        self._check_writable()
+        write = functools.partial(
+            self._compiled(instance).write,
+            ignore_other_fields=instance.spec.field_count == 1,
+        )
+        instance._field_writers[self] = write  # pylint: disable=protected-access
+        return write
+
     def __get__(self, instance: Any, owner: Any) -> T:
         """Field getter.
 
         Arguments:
-            instance -- parent class instance. Needs to be `RegAccess`.
+            instance -- parent class instance. Needs to be `RegAccess`. If None
+                (access through the class), the field access object is returned.
 
         Raises:
             RuntimeError: field is not software-readable.
@@ -89,18 +229,12 @@ class FieldAccess(Generic[T], SpecMixin[FieldNodeSpec], ABC):
         Returns:
             Field value got from register interface.
         """
-        assert isinstance(
-            instance, RegAccess
-        ), "FieldAccess needs to be used as a member of RegAccess."
-
-        if not self.spec.is_sw_readable:
-            raise RuntimeError(f"Field {self.spec.inst_name} is not SW readable.")
-
-        return self._type(
-            instance.regif.get_field(
-                instance.spec.absolute_address, self.spec.lsb, self.spec.width
-            )
-        )
+        if instance is None:
+            return self  # type: ignore
+        read = instance._field_readers.get(self)
+        if read is None or instance._bound_regif is not instance._binding.regif:
+            read = self._reader(instance)
+        return self._convert(read())
 
     def __set__(self, instance: Any, value: T):
         """Field setter.
@@ -114,30 +248,36 @@ class FieldAccess(Generic[T], SpecMixin[FieldNodeSpec], ABC):
         Raises:
             RuntimeError: field is not software-writable.
         """
-        assert isinstance(
-            instance, RegAccess
-        ), "FieldAccess needs to be used as a member of RegAccess."
+        value = self._cast(value)
+        write = instance._field_writers.get(self)
+        if write is None or instance._bound_regif is not instance._binding.regif:
+            write = self._writer(instance)
+        write(int(value))
 
-        # Check if value is correct (e.g., for IntEnum).
-        if not isinstance(value, self._type):
-            value = self._type(value)
 
-        if not self.spec.is_sw_writable:
-            raise RuntimeError(f"Field {self.spec.inst_name} is not SW writable.")
+class _RegifBinding:  # pylint: disable=too-few-public-methods
+    """Register interface shared by a node and its descendants."""
 
-        instance.regif.set_field(
-            instance.spec.absolute_address,
-            self.spec.lsb,
-            self.spec.width,
-            int(value),
-            instance.spec.field_count == 1,
-        )
+    __slots__ = ("regif",)
+
+    def __init__(self, regif: Optional[AnyRegisterInterface]):
+        """Initialize the binding.
+
+        Arguments:
+            regif -- register interface.
+        """
+        self.regif = regif
 
 
 class AccessWithRegifMixin:  # pylint: disable=too-few-public-methods
-    """Generic access class with register interface and specification."""
+    """Generic access class with register interface and specification.
+
+    The register interface is held by a binding shared by the node and its
+    descendants, so changing it doesn't need to visit the descendants, which
+    weren't instantiated or given their own register interface.
+    """
 
-    def __init__(self, register_interface: Optional[RegisterInterface]):
+    def __init__(self, register_interface: Optional[AnyRegisterInterface]):
         """Initialize access interface.
 
         Arguments:
@@ -145,33 +285,52 @@ class AccessWithRegifMixin:  # pylint: disable=too-few-public-methods
             register_interface -- register interface. Can be set also by
                 setting the `regif` property. Propagates to all members.
         """
-        self._regif = None
-
-        if register_interface is not None:
-            self.regif = register_interface
+        self._binding = _RegifBinding(register_interface)
+        self._owns_binding = True
 
     @property
-    def regif(self) -> RegisterInterface:
+    def regif(self) -> AnyRegisterInterface:
         """Get register interface."""
+        regif = self._binding.regif
         assert (
-            self._regif is not None
+            regif is not None
         ), "RegisterInterface should be set in constructor or by constructor of parent."
-        return self._regif
+        return regif
 
     @regif.setter
-    def regif(self, regif: RegisterInterface):
-        """Set register interface and propagate to members.
+    def regif(self, regif: AnyRegisterInterface):
+        """Set register interface of the node and all its descendants.
 
-        Members need to be instances of AccessWithRegif itself.
+        If the binding is shared with the parent, the node gets its own one
+        first, which is passed to the already instantiated descendants.
+        Descendants with their own binding (e.g., with register interface set
+        explicitly or attached as instance members) are set one by one.
         """
-        self._regif = regif
+        if not self._owns_binding:
+            self._rebind(self._binding, _RegifBinding(regif))
+            self._owns_binding = True
+        self._binding.regif = regif
+        self._propagate(regif)
 
-        for member in itertools.chain(
-            self.__class__.__dict__.values(), self.__dict__.values()
-        ):
-            if isinstance(member, AccessWithRegifMixin):
+    def _propagate(self, regif: AnyRegisterInterface) -> None:
+        """Set register interface of instance members with their own binding."""
+        # pylint: disable=protected-access
+        for member in list(vars(self).values()):
+            if not isinstance(member, AccessWithRegifMixin):
+                continue
+            if member._binding is self._binding:
+                member._propagate(regif)
+            else:
                 member.regif = regif
 
+    def _rebind(self, old: _RegifBinding, new: _RegifBinding) -> None:
+        """Replace the binding of the node and its instantiated descendants."""
+        # pylint: disable=protected-access
+        self._binding = new
+        for member in self.__dict__.values():
+            if isinstance(member, AccessWithRegifMixin) and member._binding is old:
+                member._rebind(old, new)
+
 
 AddressableSpecT = TypeVar("AddressableSpecT", bound=AddressableNodeSpec)
 """Addressable node specification generic type."""
@@ -182,13 +341,20 @@ class HierarchicalAccess(
 ):
     """Hierarchical block access interface.
 
+    Child nodes declared as class members are templates shared by all the
+    instances of the class. On first access through an instance, a child
+    node instance sharing the register interface binding of the parent is
+    created and cached in the parent instance. This way only the accessed
+    part of the hierarchy is instantiated and instances of the same class
+    can use different register interfaces.
+
     Arguments:
         AddressableSpecT -- Node specification.
     """
 
     def __init__(
         self,
-        register_interface: Optional[RegisterInterface] = None,
+        register_interface: Optional[AnyRegisterInterface] = None,
         specification: Optional[AddressableSpecT] = None,
     ):
         """Initialize the hierarchical access block.
@@ -204,6 +370,280 @@ class HierarchicalAccess(
         AccessWithRegifMixin.__init__(self, register_interface)
         # TODO: Figure out why mypy doesn't like it:
         SpecMixin.__init__(self, specification)  # type: ignore
+        self._name: Optional[str] = None
+
+    def __set_name__(self, owner: Any, name: str) -> None:
+        """Remember the member name of the child node template."""
+        self._name = name
+
+    def __get__(self, instance: Any, owner: Any) -> Any:
+        """Get child node instance of the parent instance.
+
+        It's created from the template on first access and cached in the
+        parent instance, so next accesses don't reach the descriptor.
+
+        Arguments:
+            instance -- parent node instance. If None (access through the
+                class), the template is returned.
+
+        Raises:
+            TypeError: the template isn't a member of the parent class.
+        """
+        if instance is None:
+            return self
+        if self._name is None:
+            # Attached to the class after its creation, so `__set_name__()`
+            # wasn't called.
+            self._name = next(
+                (
+                    name
+                    for cls in type(instance).__mro__
+                    for name, member in vars(cls).items()
+                    if member is self
+                ),
+                None,
+            )
+            if self._name is None:
+                raise TypeError(
+                    f"Node {self.spec.inst_name} is not a member of "
+                    f"{type(instance).__name__}."
+                )
+        node = object.__new__(self.__class__)
+        node.__dict__.update(
+            (key, value)
+            for key, value in self.__dict__.items()
+            if not isinstance(value, HierarchicalAccess)
+        )
+        node._binding = instance._binding
+        node._owns_binding = False
+        node._init_instance_state()
+        instance.__dict__[self._name] = node
+        return node
+
+    def _init_instance_state(self) -> None:
+        """Initialize state which can't be shared with the template."""
+
+    def _children(self) -> Iterator[Tuple[str, "HierarchicalAccess"]]:
+        """Iterate over (member name, child node) pairs.
+
+        Children which weren't accessed through this instance yet are
+        represented by their templates (e.g., for looking up specification)
+        instead of being instantiated.
+        """
+        members = dict(self.__class__.__dict__)
+        members.update(self.__dict__)
+        for name, member in members.items():
+            if isinstance(member, HierarchicalAccess):
+                yield name, member
+
+    def collect_metrics(self, path: Optional[str] = None) -> Dict[str, AccessStats]:
+        """Roll up access metrics of the register interface by hierarchy path.
+
+        Requires `metrics_enabled` to be set on the register interface.
+
+        Keyword Arguments:
+            path -- hierarchy path of this node. Defaults to the instance name.
+
+        Returns:
+            Statistics of this node and all its descendants keyed by their
+            hierarchy paths (e.g., "top.block.reg").
+
+        Raises:
+            RuntimeError: metrics collection is not enabled.
+        """
+        regif = self.regif
+        metrics = regif.metrics if isinstance(regif, RegisterInterface) else None
+        if metrics is None:
+            raise RuntimeError("Metrics collection is not enabled.")
+        per_address = metrics.per_address()
+
+        def collect(node: HierarchicalAccess, node_path: str) -> AccessStats:
+            stats = AccessStats()
+            if isinstance(node, RegAccess):
+                if node.spec.absolute_address in per_address:
+                    stats.merge(per_address[node.spec.absolute_address])
+            else:
+                for name, child in node._children():  # pylint: disable=protected-access
+                    stats.merge(collect(child, f"{node_path}.{name}"))
+            ret[node_path] = stats
+            return stats
+
+        ret: Dict[str, AccessStats] = {}
+        collect(self, self.spec.inst_name if path is None else path)
+        return ret
+
+    def transaction(
+        self, sort_by_address: bool = False
+    ) -> ContextManager[RegisterTransaction]:
+        """Coalesce field writes into a single write per register.
+
+        Usage::
+
+            with regmap.transaction():
+                regmap.reg.field0 = 1
+                regmap.reg.field1 = 2  # Both fields written with one `set()`.
+
+        See `RegisterInterface.transaction()` for details.
+
+        Keyword Arguments:
+            sort_by_address -- commit registers in the address order instead of
+                the order in which they were first touched.
+
+        Returns:
+            Transaction context manager.
+        """
+        regif = self.regif
+        if not isinstance(regif, RegisterInterface):
+            raise TypeError("Transactions require synchronous register interface.")
+        return regif.transaction(sort_by_address)
+
+    def _array_layout(
+        self, regif: RegisterInterface, name: Optional[str]
+    ) -> Tuple[int, List[int], int, int]:
+        """Get layout of a register array or the whole node in registers.
+
+        Arguments:
+            regif -- register interface to get the register width from.
+            name -- instance name of the register array. If None, the whole
+                node is taken.
+
+        Returns:
+            Tuple of (start address, array shape, element stride, element size).
+
+        Raises:
+            AttributeError: there is no register array with the name.
+        """
+        data_bytes = regif.data_width // 8
+        if name is None:
+            return self.spec.absolute_address, [self.spec.size // data_bytes], 1, 1
+        for _, child in self._children():
+            spec = child.spec
+            if (
+                isinstance(child, RegAccess)
+                and spec.inst_name == name
+                and spec.is_array
+            ):
+                assert (
+                    spec.array_dimensions is not None and spec.array_stride is not None
+                )
+                return (
+                    spec.raw_absolute_address,
+                    list(spec.array_dimensions),
+                    spec.array_stride // data_bytes,
+                    spec.size // data_bytes,
+                )
+        raise AttributeError(
+            f"Node {self.spec.inst_name} doesn't have register array {name}."
+        )
+
+    def _numpy_regif(self) -> RegisterInterface:
+        """Get register interface for NumPy access.
+
+        Raises:
+            TypeError: the register interface is asynchronous.
+        """
+        regif = self.regif
+        if not isinstance(regif, RegisterInterface):
+            raise TypeError("NumPy access requires synchronous register interface.")
+        return regif
+
+    def to_numpy(self, name: Optional[str] = None) -> Any:
+        """Read a register array or the whole node into a NumPy array.
+
+        Contiguous blocks are read with `RegisterInterface.read_array()`, which
+        is a single memory copy for memory mapped register interfaces.
+
+        Keyword Arguments:
+            name -- instance name of a register array member (e.g., "reg" for
+                "reg_0", "reg_1", ...). The result has shape of the register
+                array (with additional dimension if a register is wider than
+                the register interface). If None, the whole node is read as a
+                flat array of registers.
+
+        Returns:
+            NumPy array of register values.
+
+        Raises:
+            AttributeError: there is no register array with the name.
+            RuntimeError: NumPy is not installed.
+            TypeError: the register interface is asynchronous.
+        """
+        regif = self._numpy_regif()
+        start, shape, stride, size = self._array_layout(regif, name)
+        count = functools.reduce(operator.mul, shape, 1)
+        if stride == size:
+            data = regif.read_array(start, count * size)
+        else:
+            data = regif.read_array(start, count * stride).reshape(count, stride)
+            data = data[:, :size]
+        return data.reshape(shape + ([size] if size > 1 else []))
+
+    def from_numpy(self, values: Any, name: Optional[str] = None) -> None:
+        """Write a NumPy array to a register array or the whole node.
+
+        It's the counterpart of `to_numpy()`.
+
+        Arguments:
+            values -- NumPy array of register values. Only the number of
+                elements needs to match, they're written in C (row-major) order.
+
+        Keyword Arguments:
+            name -- instance name of a register array member. If None, the whole
+                node is written.
+
+        Raises:
+            AttributeError: there is no register array with the name.
+            ValueError: the number of values doesn't match.
+            RuntimeError: NumPy is not installed.
+            TypeError: the register interface is asynchronous.
+        """
+        regif = self._numpy_regif()
+        start, shape, stride, size = self._array_layout(regif, name)
+        count = functools.reduce(operator.mul, shape, 1)
+        if values.size != count * size:
+            raise ValueError(
+                f"Expected {count * size} values, got {values.size} "
+                f"(array shape {values.shape})."
+            )
+        if stride == size:
+            regif.write_array(start, values)
+            return
+        data_bytes = regif.data_width // 8
+        reg_addresses = [
+            start + (i * stride + j) * data_bytes
+            for i in range(count)
+            for j in range(size)
+        ]
+        regif.set_many(zip(reg_addresses, (int(value) for value in values.ravel())))
+
+
+class RegValue(int):
+    """Immutable snapshot of a register value.
+
+    It's the raw register value (so it can be used as `int`) with fields
+    decoded on attribute access. `RegAccess.read()` returns an instance of a
+    subclass generated for the register class with a property for each
+    readable field.
+    """
+
+    __slots__ = ()
+
+    _field_names: Tuple[str, ...] = ()
+    """Names of the decoded fields."""
+
+    def _asdict(self) -> Dict[str, Any]:
+        """Get decoded field values by field name."""
+        return {name: getattr(self, name) for name in self._field_names}
+
+    def __repr__(self) -> str:
+        """Represent the raw value and the decoded fields."""
+        fields = []
+        for name in self._field_names:
+            try:
+                fields.append(f"{name}={getattr(self, name)!r}")
+            except ValueError:
+                fields.append(f"{name}=<invalid>")
+        return f"{self.__class__.__name__}({', '.join([f'0x{int(self):X}'] + fields)})"
 
 
 class RegAccess(HierarchicalAccess[RegNodeSpec], ABC):
@@ -213,6 +653,341 @@ class RegAccess(HierarchicalAccess[RegNodeSpec], ABC):
     as members and `_spec` set to instance of RegNodeSpec.
     """
 
+    _value_class: Type[RegValue]
+    """`RegValue` subclass of the register class (see `_value_type()`)."""
+
+    def __init__(
+        self,
+        register_interface: Optional[AnyRegisterInterface] = None,
+        specification: Optional[RegNodeSpec] = None,
+    ):
+        """Initialize the register access.
+
+        Keyword Arguments:
+            register_interface -- register interface. Can be set also by
+                setting the `regif` property.
+            specification -- node specification. Can be also set by setting
+                `_spec` child class member.
+        """
+        self._init_instance_state()
+        super().__init__(register_interface, specification)
+
+    def _init_instance_state(self) -> None:
+        """Create empty caches of field accessors."""
+        self._compiled_fields: Dict[FieldAccess, CompiledField] = {}
+        self._field_readers: Dict[FieldAccess, Callable[[], int]] = {}
+        self._field_writers: Dict[FieldAccess, Callable[[int], None]] = {}
+        self._bound_regif: Optional[RegisterInterface] = None
+        self._declared_regif: Optional[AnyRegisterInterface] = None
+
+    @classmethod
+    def _fields(cls) -> Iterator[Tuple[str, FieldAccess]]:
+        """Iterate over (name, field) pairs declared in the register class."""
+        seen: Set[str] = set()
+        for klass in cls.__mro__:
+            for name, member in klass.__dict__.items():
+                if isinstance(member, FieldAccess) and name not in seen:
+                    seen.add(name)
+                    yield name, member
+
+    @classmethod
+    def _value_type(cls) -> Type[RegValue]:
+        """Get `RegValue` subclass of the register class.
+
+        It's created on first use with a property decoding each readable
+        field and cached in the register class.
+        """
+        value_type = cls.__dict__.get("_value_class")
+        if value_type is None:
+            fields = [(name, field) for name, field in cls._fields() if field.readable]
+            namespace: Dict[str, Any] = {
+                "__slots__": (),
+                "_field_names": tuple(name for name, _ in fields),
+            }
+            for name, field in fields:
+                # pylint: disable-next=protected-access
+                namespace[name] = field._value_property()
+            value_type = type(f"{cls.__name__}Value", (RegValue,), namespace)
+            cls._value_class = value_type
+        return value_type
+
+    @property
+    def is_volatile(self) -> bool:
+        """Check if the register value can change without software access.
+
+        It's the case if any of the fields is volatile, doesn't implement
+        storage or has side effects of software access (e.g., clear on read
+        or write one to clear), so the written value isn't the stored one.
+        """
+        return any(
+            field.spec.is_volatile
+            or not field.spec.implements_storage
+            or field.spec.has_side_effects
+            for _, field in self._fields()
+        )
+
+    def _bind(self, regif: AnyRegisterInterface) -> RegisterInterface:
+        """Prepare the register for access with a new register interface.
+
+        Drops accessors compiled for the previous register interface and
+        registers volatility of the register (see
+        `RegisterInterface.register_volatility()`).
+
+        Returns:
+            The bound register interface.
+
+        Raises:
+            TypeError: field attribute access was attempted with an
+                asynchronous register interface.
+        """
+        if not isinstance(regif, RegisterInterface):
+            raise TypeError(
+                "Field attributes require synchronous register interface. "
+                "Use `read_field()` and `write_field()` instead."
+            )
+        self._unbind()
+        self._bound_regif = regif
+        self._declare_volatility(regif)
+        return regif
+
+    def _declare_volatility(self, regif: AnyRegisterInterface) -> None:
+        """Register volatility of the register on first use of the register interface.
+
+        See `RegisterInterface.register_volatility()`.
+        """
+        if regif is not self._declared_regif:
+            if isinstance(regif, RegisterInterface):
+                regif.register_volatility(self.spec.absolute_address, self.is_volatile)
+            self._declared_regif = regif
+
+    def _access_regif(self) -> AnyRegisterInterface:
+        """Get register interface for a register access.
+
+        All the access paths use it, so the register interface knows
+        volatility of the register before it's accessed.
+        """
+        regif = self.regif
+        if regif is not self._declared_regif:
+            self._declare_volatility(regif)
+        return regif
+
+    def _unbind(self) -> None:
+        """Drop field accessors compiled for the bound register interface."""
+        self._compiled_fields.clear()
+        self._field_readers.clear()
+        self._field_writers.clear()
+        self._bound_regif = None
+
+    def _field(self, name: str) -> FieldAccess:
+        """Get field access object by name."""
+        field = getattr(self.__class__, name, None)
+        if not isinstance(field, FieldAccess):
+            raise AttributeError(
+                f"Register {self.spec.inst_name} doesn't have field {name}."
+            )
+        return field
+
+    def _encode_fields(self, fields: Dict[str, Any], write: bool) -> Tuple[int, int]:
+        """Encode field values into register bits.
+
+        Arguments:
+            fields -- field values by field name.
+            write -- check if the fields are software-writable instead of
+                software-readable.
+
+        Returns:
+            Mask of the fields and the shifted field values.
+
+        Raises:
+            AttributeError: the register doesn't have one of the fields.
+            RuntimeError: one of the fields is not software-accessible.
+            ValueError: one of the values doesn't fit in its field.
+        """
+        # pylint: disable=protected-access
+        mask = 0
+        value = 0
+        for name, field_value in fields.items():
+            field = self._field(name)
+            if write:
+                field._check_writable()
+            else:
+                field._check_readable()
+            field_value = int(field._cast(field_value))
+            if field_value >> field.width or field_value < 0:
+                raise ValueError(
+                    f"Value 0x{field_value:X} wider than field {name} "
+                    f"width ({field.width})."
+                )
+            mask |= field.mask
+            value |= field_value << field.lsb
+        return mask, value
+
+    def read(self) -> Any:
+        """Read the whole register value.
+
+        The value is read with a single register access, so all the fields
+        decoded from it are consistent.
+
+        Returns:
+            Register value snapshot (`RegValue`) with fields decoded on
+            attribute access. If the register interface is asynchronous, an
+            awaitable resolving to the snapshot.
+        """
+        regif = self._access_regif()
+        if isinstance(regif, AsyncRegisterInterface):
+            return self._async_read(regif)
+        return self._value_type()(regif.get(self.spec.absolute_address))
+
+    def write(self, _value: int = 0, **fields: Any) -> Any:
+        """Write the whole register value with a single register access.
+
+        Arguments:
+            _value -- new register value. Bits of the fields given by name are
+                replaced. Underscored, so it doesn't collide with field names.
+
+        Keyword Arguments:
+            fields -- new field values by field name.
+
+        Returns:
+            None. If the register interface is asynchronous, an awaitable
+            which needs to be awaited to perform the write.
+
+        Raises:
+            AttributeError: the register doesn't have one of the fields.
+            RuntimeError: one of the fields is not software-writable.
+            ValueError: one of the values doesn't fit in its field.
+        """
+        if len(fields) > 0:
+            mask, bits = self._encode_fields(fields, True)
+            _value = (_value & ~mask) | bits
+        return self._access_regif().set(self.spec.absolute_address, _value)
+
+    def modify(self, **fields: Any) -> Any:
+        """Change the fields with a single register read-modify-write.
+
+        Other fields keep their current values.
+
+        Keyword Arguments:
+            fields -- new field values by field name.
+
+        Returns:
+            New register value snapshot (`RegValue`). If the register
+            interface is asynchronous, an awaitable resolving to the snapshot.
+
+        Raises:
+            AttributeError: the register doesn't have one of the fields.
+            RuntimeError: one of the fields is not software-writable.
+            ValueError: one of the values doesn't fit in its field.
+        """
+        mask, bits = self._encode_fields(fields, True)
+        regif = self._access_regif()
+        if isinstance(regif, AsyncRegisterInterface):
+            return self._async_modify(regif, mask, bits)
+        return self._value_type()(regif.modify(self.spec.absolute_address, mask, bits))
+
+    def wait_until(
+        self, _timeout: float = 1.0, _interval: float = 0.01, **fields: Any
+    ) -> Any:
+        """Wait until the fields have the given values.
+
+        Polling is done by `wait_for()` of the register interface, so it's
+        performed natively if the implementation allows (e.g., on the server
+        side of a socket register interface).
+
+        Keyword Arguments:
+            _timeout -- maximum time to wait in seconds.
+            _interval -- maximum polling interval in seconds.
+            fields -- expected field values by field name.
+
+        The control arguments are underscored, so they don't collide with
+        field names.
+
+        Returns:
+            Register value matching the condition. If the register interface
+            is asynchronous, an awaitable resolving to the value.
+
+        Raises:
+            AttributeError: the register doesn't have one of the fields.
+            RuntimeError: one of the fields is not software-readable.
+            ValueError: one of the values doesn't fit in its field.
+            WaitTimeoutError: the condition wasn't met before the timeout.
+        """
+        mask, value = self._encode_fields(fields, False)
+        return self._access_regif().wait_for(
+            self.spec.absolute_address, mask, value, _timeout, _interval
+        )
+
+    def read_field(self, name: str) -> Any:
+        """Read field value by name.
+
+        Arguments:
+            name -- field name.
+
+        Returns:
+            Field value. If the register interface is asynchronous, an
+            awaitable resolving to the value.
+        """
+        field = self._field(name)
+        regif = self._access_regif()
+        if isinstance(regif, AsyncRegisterInterface):
+            return self._async_read_field(regif, field)
+        return getattr(self, name)
+
+    def write_field(self, name: str, value: Any) -> Any:
+        """Write field value by name.
+
+        Arguments:
+            name -- field name.
+            value -- new value of the field.
+
+        Returns:
+            None. If the register interface is asynchronous, an awaitable
+            which needs to be awaited to perform the write.
+        """
+        field = self._field(name)
+        regif = self._access_regif()
+        if isinstance(regif, AsyncRegisterInterface):
+            return self._async_write_field(regif, field, value)
+        setattr(self, name, value)
+        return None
+
+    async def _async_read(self, regif: AsyncRegisterInterface) -> RegValue:
+        """Read register value snapshot with asynchronous register interface."""
+        return self._value_type()(await regif.get(self.spec.absolute_address))
+
+    async def _async_modify(
+        self, regif: AsyncRegisterInterface, mask: int, value: int
+    ) -> RegValue:
+        """Read-modify-write register with asynchronous register interface."""
+        return self._value_type()(
+            await regif.modify(self.spec.absolute_address, mask, value)
+        )
+
+    async def _async_read_field(
+        self, regif: AsyncRegisterInterface, field: FieldAccess
+    ) -> Any:
+        """Read field value with asynchronous register interface."""
+        # pylint: disable=protected-access
+        field._check_readable()
+        return field._convert(
+            await regif.get_field(self.spec.absolute_address, field.lsb, field.width)
+        )
+
+    async def _async_write_field(
+        self, regif: AsyncRegisterInterface, field: FieldAccess, value: Any
+    ) -> None:
+        """Write field value with asynchronous register interface."""
+        # pylint: disable=protected-access
+        value = field._cast(value)
+        field._check_writable()
+        await regif.set_field(
+            self.spec.absolute_address,
+            field.lsb,
+            field.width,
+            int(value),
+            self.spec.field_count == 1,
+        )
+
 
 class AddrmapAccess(HierarchicalAccess[AddrmapNodeSpec], ABC):
     """Address map access Python interface.
@@ -230,3 +1005,35 @@ class RegfileAccess(HierarchicalAccess[RegfileNodeSpec], ABC):
     RegAccess or AddrmapAccess) set as members and `_spec` set to instance of
     RegfileSpec.
     """
+
+
+class MemAccess(HierarchicalAccess[MemNodeSpec], ABC):
+    """Memory access Python interface.
+
+    The memory content is accessed as a whole with `to_numpy()` and
+    `from_numpy()`. It's organized in words of the register interface width.
+    """
+
+    def to_numpy(self, name: Optional[str] = None) -> Any:
+        """Read the memory into a NumPy array.
+
+        See `HierarchicalAccess.to_numpy()` for details.
+
+        Raises:
+            RuntimeError: the memory is not software-readable.
+        """
+        if not self.spec.is_sw_readable:
+            raise RuntimeError(f"Memory {self.spec.inst_name} is not SW readable.")
+        return super().to_numpy(name)
+
+    def from_numpy(self, values: Any, name: Optional[str] = None) -> None:
+        """Write a NumPy array to the memory.
+
+        See `HierarchicalAccess.from_numpy()` for details.
+
+        Raises:
+            RuntimeError: the memory is not software-writable.
+        """
+        if not self.spec.is_sw_writable:
+            raise RuntimeError(f"Memory {self.spec.inst_name} is not SW writable.")
+        super().from_numpy(values, name)
@@ -0,0 +1,238 @@
+"""Asynchronous (asyncio) register interface abstraction."""
+
+__authors__ = ["Marek Pikuła <marek.pikula at embevity.com>"]
+
+import asyncio
+import time
+from abc import abstractmethod
+from typing import Iterable, List, Sequence, Tuple
+
+from .regif import RegisterInterfaceBase
+
+
+class AsyncRegisterInterface(RegisterInterfaceBase):
+    """Asynchronous register interface abstraction.
+
+    Counterpart of `RegisterInterface` for asyncio-based applications. A basic
+    implementation requires overriding `_get()` and `_set()` coroutines. The
+    default bulk operations issue all the single register operations
+    concurrently, so implementations able to keep many requests in flight
+    benefit from them without overriding.
+    """
+
+    @abstractmethod
+    async def _get(self, reg_address: int) -> int:
+        """Read register value abstraction."""
+        return 0
+
+    @abstractmethod
+    async def _set(self, reg_address: int, value: int) -> None:
+        """Write register value abstraction."""
+
+    async def _modify(self, reg_address: int, mask: int, value: int) -> int:
+        """Read-modify-write register value abstraction.
+
+        The default implementation awaits `_get()` and `_set()`, so it's not
+        atomic against other coroutines. Should be overridden if the
+        underlying hardware can modify a register in a single operation.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            mask -- mask of the register bits to modify.
+            value -- new value of the masked bits (already shifted).
+
+        Returns:
+            New register value.
+        """
+        new_value = (await self._get(reg_address) & ~mask) | value
+        await self._set(reg_address, new_value)
+        return new_value
+
+    async def _wait_for(  # pylint: disable=too-many-arguments
+        self, reg_address: int, mask: int, value: int, timeout: float, interval: float
+    ) -> int:
+        """Poll register until masked bits are equal to the value.
+
+        The default implementation polls with `_get()` using exponential
+        backoff from `WAIT_MIN_INTERVAL` up to `interval`.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            mask -- mask of the register bits to compare.
+            value -- expected value of the masked bits (already shifted).
+            timeout -- maximum time to wait in seconds.
+            interval -- maximum polling interval in seconds.
+
+        Returns:
+            Last read register value (not matching if the timeout occurred).
+        """
+        deadline = time.monotonic() + timeout
+        current = await self._get(reg_address)
+        for delay in self._poll_delays(deadline, interval):
+            if current & mask == value:
+                break
+            await asyncio.sleep(delay)
+            current = await self._get(reg_address)
+        return current
+
+    async def _get_many(self, reg_addresses: Sequence[int]) -> List[int]:
+        """Read multiple registers abstraction.
+
+        The default implementation runs `_get()` for all addresses concurrently.
+        """
+        return list(
+            await asyncio.gather(
+                *(self._get(reg_address) for reg_address in reg_addresses)
+            )
+        )
+
+    async def _set_many(
+        self, reg_addresses: Sequence[int], values: Sequence[int]
+    ) -> None:
+        """Write multiple registers abstraction.
+
+        The default implementation runs `_set()` for all addresses concurrently.
+        """
+        await asyncio.gather(
+            *(
+                self._set(reg_address, value)
+                for reg_address, value in zip(reg_addresses, values)
+            )
+        )
+
+    async def get(self, reg_address: int) -> int:
+        """Read register value abstraction.
+
+        Arguments:
+            reg_address -- absolute address of register to read.
+
+        Returns:
+            Data from the register.
+        """
+        self._sanitize_field_args(reg_address)
+        ret = await self._get(reg_address)
+        self._trace(self._Operation.GET, reg_address, ret)
+        return ret
+
+    async def set(self, reg_address: int, value: int) -> None:
+        """Write register value abstraction.
+
+        Arguments:
+            reg_address -- absolute address of register to write to.
+            value -- value to write to the register.
+        """
+        self._sanitize_field_args(reg_address, value=value)
+        self._trace(self._Operation.SET, reg_address, value)
+        await self._set(reg_address, value)
+
+    async def modify(self, reg_address: int, mask: int, value: int) -> int:
+        """Read-modify-write register value abstraction.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            mask -- mask of the register bits to modify.
+            value -- new value of the masked bits (already shifted).
+
+        Returns:
+            New register value.
+
+        Raises:
+            ValueError: value has bits set outside of the mask.
+        """
+        self._sanitize_masked_args(reg_address, mask, value)
+        ret = await self._modify(reg_address, mask, value)
+        self._trace(self._Operation.SET, reg_address, ret)
+        return ret
+
+    async def wait_for(  # pylint: disable=too-many-arguments
+        self,
+        reg_address: int,
+        mask: int,
+        value: int,
+        timeout: float = 1.0,
+        interval: float = 0.01,
+    ) -> int:
+        """Wait until masked register bits are equal to the value.
+
+        See `RegisterInterface.wait_for()` for the arguments.
+
+        Raises:
+            ValueError: value has bits set outside of the mask or timeout or
+                interval is NaN.
+            WaitTimeoutError: the condition wasn't met before the timeout.
+        """
+        self._sanitize_wait_args(reg_address, mask, value, timeout, interval)
+        ret = await self._wait_for(reg_address, mask, value, timeout, interval)
+        return self._check_wait_result(reg_address, mask, value, ret)
+
+    async def get_many(self, reg_addresses: Iterable[int]) -> List[int]:
+        """Read multiple registers at once.
+
+        Arguments:
+            reg_addresses -- absolute addresses of registers to read.
+
+        Returns:
+            Data from the registers in the order of `reg_addresses`.
+        """
+        reg_addresses = list(reg_addresses)
+        self._sanitize_bulk_args(reg_addresses)
+        ret = await self._get_many(reg_addresses)
+        self._trace_many(self._Operation.GET, reg_addresses, ret)
+        return ret
+
+    async def set_many(self, pairs: Iterable[Tuple[int, int]]) -> None:
+        """Write multiple registers at once.
+
+        Arguments:
+            pairs -- (absolute register address, value) pairs to write.
+        """
+        reg_addresses, values = self._split_pairs(pairs)
+        self._trace_many(self._Operation.SET, reg_addresses, values)
+        await self._set_many(reg_addresses, values)
+
+    async def get_field(
+        self, reg_address: int, field_pos: int, field_width: int
+    ) -> int:
+        """Read register field abstraction.
+
+        Arguments:
+            reg_address -- absolute address of register to write to.
+            field_pos -- field position in the register (counting from LSB).
+            field_width -- width of the field in bits.
+
+        Returns:
+            Value in given field in given register.
+        """
+        field = self._field_spec(reg_address, field_pos, field_width)
+        return self._decode_field(reg_address, await self._get(reg_address), field)
+
+    async def set_field(  # pylint: disable=too-many-arguments
+        self,
+        reg_address: int,
+        field_pos: int,
+        field_width: int,
+        value: int,
+        ignore_other_fields: bool = False,
+    ) -> None:
+        """Write register field abstraction.
+
+        Arguments:
+            reg_address -- absolute address of register to write to.
+            field_pos -- field position in the register (counting from LSB).
+            field_width -- width of the field in bits.
+            value -- new value of the field.
+
+        Keyword Arguments:
+            ignore_other_fields -- if set to True, other fields current values are ignored.
+        """
+        field = self._field_spec(reg_address, field_pos, field_width, value)
+
+        self._trace(self._Operation.SET, reg_address, value, field)
+        if ignore_other_fields:
+            new_reg_value = value << field_pos
+            await self._set(reg_address, new_reg_value)
+        else:
+            new_reg_value = await self._modify(
+                reg_address, field.shifted_mask, value << field_pos
+            )
+        self._trace(self._Operation.SET, reg_address, new_reg_value)
@@ -0,0 +1,350 @@
+"""Asynchronous client of the socket register interface protocol."""
+
+__authors__ = ["Marek Pikuła <marek.pikula at embevity.com>"]
+
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..async_regif import AsyncRegisterInterface
+from ..regif import LOGURU_ACTIVE
+from .socket import (
+    BINARY_PROTOCOL_VERSION,
+    OPERATION_VERSIONS,
+    PROTOCOL_VERSION,
+    SocketRegIfClient,
+    SocketRegIfPacket,
+    decode_packet,
+    encode_packet,
+)
+from .socket_transport import (
+    _FRAME_HEADER,
+    _FRAME_LONG_HEADER,
+    SHARED_MEMORY_PREFIX,
+    SocketAddress,
+    _address_str,
+    _frame,
+)
+
+if LOGURU_ACTIVE:
+    from loguru import logger
+
+
+class AsyncSocketRegIfClient(  # pylint: disable=too-many-instance-attributes
+    AsyncRegisterInterface
+):
+    """Asynchronous socket register interface client.
+
+    Talks to `SocketRegIfServer` without blocking the event loop. Requests are
+    sent without waiting for previous responses, so many operations (e.g.,
+    issued with `asyncio.gather()` or `get_many()`) can be in flight at the
+    same time. Responses are matched to requests by the operation ID.
+
+    The protocol version is negotiated at connect time. Operations unsupported
+    by an older server are emulated with the operations it supports. Servers
+    supporting protocol version 6 are talked to in the binary wire format,
+    older ones with pickle.
+
+    Use `connect()` to create a connected client.
+    """
+
+    def __init__(
+        self,
+        data_width: int,
+        address_bounds: Optional[range] = None,
+        trace: bool = False,
+        allow_pickle: bool = False,
+    ):
+        """Initialize the unconnected client.
+
+        Arguments:
+            data_width -- width of data in bits, should be divisible by 8.
+
+        Keyword Arguments:
+            address_bounds -- address range, which is allowed by this register
+                interface. If not defined, addresses are not validated if they
+                are in range.
+            trace -- activate operation tracing (uses `loguru.trace()` under the hood).
+            allow_pickle -- fall back to pickle for servers not supporting the
+                binary wire format.
+        """
+        super().__init__(data_width, address_bounds, trace)
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._receiver: Optional["asyncio.Task[None]"] = None
+        self._allow_pickle = allow_pickle
+        self._protocol_version = PROTOCOL_VERSION
+        self._binary = not allow_pickle
+        self._operation_id = 1
+        self._pending: Dict[int, "asyncio.Future[SocketRegIfPacket]"] = {}
+
+    @classmethod
+    async def connect(  # pylint: disable=too-many-arguments
+        cls,
+        socket_tuple: SocketAddress,
+        data_width: int,
+        address_bounds: Optional[range] = None,
+        trace: bool = False,
+        allow_pickle: bool = False,
+    ) -> "AsyncSocketRegIfClient":
+        """Create a client connected to the server.
+
+        Arguments:
+            socket_tuple -- server address: (host, port) pair or Unix domain
+                socket path. The shared memory transport is not supported.
+            data_width -- width of data in bits, should be divisible by 8.
+
+        Keyword Arguments:
+            address_bounds -- address range, which is allowed by this register
+                interface. If not defined, addresses are not validated if they
+                are in range.
+            trace -- activate operation tracing (uses `loguru.trace()` under the hood).
+            allow_pickle -- fall back to pickle for servers not supporting the
+                binary wire format. If False, the negotiation itself is done
+                in the binary format.
+
+        Returns:
+            Connected client.
+
+        Raises:
+            ValueError: shared memory address given.
+            RuntimeError: the protocol negotiation failed.
+        """
+        client = cls(data_width, address_bounds, trace, allow_pickle)
+        if isinstance(socket_tuple, str):
+            if socket_tuple.startswith(SHARED_MEMORY_PREFIX):
+                raise ValueError(
+                    "Shared memory transport is not supported by the asynchronous client."
+                )
+            client._reader, client._writer = await asyncio.open_unix_connection(
+                socket_tuple
+            )
+        else:
+            client._reader, client._writer = await asyncio.open_connection(
+                *socket_tuple
+            )
+        # pylint: disable=protected-access
+        await client._send(SocketRegIfClient._negotiation_request())
+        try:
+            response = await client._recv()
+        except (asyncio.IncompleteReadError, ConnectionError) as exc:
+            await client.close()
+            raise RuntimeError(
+                "Connection closed during protocol negotiation."
+            ) from exc
+        client._protocol_version = SocketRegIfClient._negotiated_version(response)
+        client._binary = client._protocol_version >= BINARY_PROTOCOL_VERSION
+        if not client._binary and not allow_pickle:
+            await client.close()
+            raise RuntimeError(
+                "The server doesn't support binary wire format and pickle is not allowed."
+            )
+        # pylint: enable=protected-access
+        client._receiver = asyncio.ensure_future(client._receive())
+        if LOGURU_ACTIVE:
+            logger.info("Connected to {conn}", conn=_address_str(socket_tuple))
+        return client
+
+    async def close(self) -> None:
+        """Close the connection."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._receiver is not None:
+            await asyncio.gather(self._receiver, return_exceptions=True)
+            self._receiver = None
+
+    @property
+    def protocol_version(self) -> int:
+        """Get protocol version negotiated with the server."""
+        return self._protocol_version
+
+    def _supports(self, operation: SocketRegIfPacket.Operation) -> bool:
+        """Check whether the negotiated protocol version supports the operation."""
+        return OPERATION_VERSIONS[operation] <= self._protocol_version
+
+    async def _send(self, packet: SocketRegIfPacket) -> None:
+        """Send a single packet."""
+        assert self._writer is not None
+        self._writer.write(
+            _frame(encode_packet(packet, self._binary, self._data_bytes))
+        )
+        await self._writer.drain()
+
+    async def _recv(self) -> SocketRegIfPacket:
+        """Receive a single packet.
+
+        Raises:
+            ValueError: the packet is malformed.
+            RuntimeError: the received object isn't a packet.
+        """
+        assert self._reader is not None
+        (size,) = _FRAME_HEADER.unpack(
+            await self._reader.readexactly(_FRAME_HEADER.size)
+        )
+        if size == -1:
+            (size,) = _FRAME_LONG_HEADER.unpack(
+                await self._reader.readexactly(_FRAME_LONG_HEADER.size)
+            )
+        # Only legacy servers not supporting the binary format respond with
+        # pickle.
+        return decode_packet(
+            await self._reader.readexactly(size),
+            self._allow_pickle and not self._binary,
+        )
+
+    async def __aenter__(self) -> "AsyncSocketRegIfClient":
+        """Use the client as an async context manager closing it on exit."""
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        """Close the connection."""
+        await self.close()
+
+    async def _receive(self) -> None:
+        """Receive responses and resolve futures of the matching requests."""
+        error: Exception = RuntimeError("Connection closed.")
+        try:
+            while True:
+                response = await self._recv()
+                future = self._pending.pop(response.operation[1], None)
+                if future is not None and not future.done():
+                    future.set_result(response)
+        except (asyncio.IncompleteReadError, ConnectionError) as exc:
+            error = RuntimeError(f"Connection closed: {exc}")
+        except Exception as exc:  # pylint: disable=broad-except
+            error = exc
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            self._pending.clear()
+
+    async def _request(
+        self, operation: SocketRegIfPacket.Operation, *args: Any, **kwargs: Any
+    ) -> SocketRegIfPacket:
+        """Send a request to the server and wait for the validated response.
+
+        Arguments:
+            operation -- requested operation.
+            args, kwargs -- other arguments of `SocketRegIfPacket.request()`.
+
+        Raises:
+            RuntimeError: the client isn't connected, the response is invalid or
+                reports an error.
+        """
+        if self._writer is None or self._receiver is None or self._receiver.done():
+            raise RuntimeError("The client is not connected.")
+
+        request = SocketRegIfPacket.request(
+            self._protocol_version, operation, self._operation_id, *args, **kwargs
+        )
+        operation_id = self._operation_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[operation_id] = future
+        self._operation_id += 1
+
+        try:
+            await self._send(request)
+        except BaseException:
+            # No response will come for the request.
+            self._pending.pop(operation_id, None)
+            raise
+
+        # pylint: disable-next=protected-access
+        return SocketRegIfClient._check_response(request, await future)
+
+    async def _get(self, reg_address: int) -> int:
+        """Read register value over the socket.
+
+        Arguments:
+            reg_address -- absolute address of register to read.
+
+        Returns:
+            Data from the register.
+        """
+        response = await self._request(SocketRegIfPacket.Operation.GET, reg_address)
+        if response.value is None:
+            raise RuntimeError("Get response doesn't have a value.")
+        return response.value
+
+    async def _set(self, reg_address: int, value: int) -> None:
+        """Write register over socket.
+
+        Arguments:
+            reg_address -- absolute address of register to write to.
+            value -- value to write to the register.
+        """
+        await self._request(SocketRegIfPacket.Operation.SET, reg_address, value)
+
+    async def _modify(self, reg_address: int, mask: int, value: int) -> int:
+        """Read-modify-write register on the server side in a single request.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            mask -- mask of the register bits to modify.
+            value -- new value of the masked bits (already shifted).
+
+        Returns:
+            New register value.
+        """
+        if not self._supports(SocketRegIfPacket.Operation.MODIFY):
+            return await super()._modify(reg_address, mask, value)
+        response = await self._request(
+            SocketRegIfPacket.Operation.MODIFY, reg_address, value, mask=mask
+        )
+        if response.value is None:
+            raise RuntimeError("Modify response doesn't have a value.")
+        return response.value
+
+    async def _wait_for(  # pylint: disable=too-many-arguments
+        self, reg_address: int, mask: int, value: int, timeout: float, interval: float
+    ) -> int:
+        """Poll register on the server side in a single request.
+
+        See `SocketRegIfClient._wait_for()` for the arguments.
+        """
+        if not self._supports(SocketRegIfPacket.Operation.WAIT_FOR):
+            return await super()._wait_for(reg_address, mask, value, timeout, interval)
+        operation = SocketRegIfPacket.Operation.WAIT_FOR
+        response = await self._request(
+            operation, reg_address, value, mask=mask, timeout=timeout, interval=interval
+        )
+        if response.value is None:
+            raise RuntimeError("Wait response doesn't have a value.")
+        return response.value
+
+    async def _get_many(self, reg_addresses: Sequence[int]) -> List[int]:
+        """Read multiple registers over the socket in a single request.
+
+        Arguments:
+            reg_addresses -- absolute addresses of registers to read.
+
+        Returns:
+            Data from the registers.
+        """
+        if not self._supports(SocketRegIfPacket.Operation.GET_MANY):
+            return await super()._get_many(reg_addresses)
+        response = await self._request(
+            SocketRegIfPacket.Operation.GET_MANY, reg_addresses=list(reg_addresses)
+        )
+        if response.values is None or len(response.values) != len(reg_addresses):
+            raise RuntimeError("Bulk get response doesn't have matching values.")
+        return response.values
+
+    async def _set_many(
+        self, reg_addresses: Sequence[int], values: Sequence[int]
+    ) -> None:
+        """Write multiple registers over the socket in a single request.
+
+        Arguments:
+            reg_addresses -- absolute addresses of registers to write to.
+            values -- values to write to the registers.
+        """
+        if not self._supports(SocketRegIfPacket.Operation.SET_MANY):
+            await super()._set_many(reg_addresses, values)
+            return
+        await self._request(
+            SocketRegIfPacket.Operation.SET_MANY,
+            reg_addresses=list(reg_addresses),
+            values=list(values),
+        )
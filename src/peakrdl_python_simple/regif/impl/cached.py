@@ -0,0 +1,189 @@
+"""Register interface with a shadow copy of non-volatile registers."""
+
+__authors__ = ["Marek Pikuła <marek.pikula at embevity.com>"]
+
+from typing import Dict, List, Optional, Sequence
+
+from ..regif import RegisterInterface, WaitTimeoutError
+
+
+class CachedRegIf(RegisterInterface):
+    """Register interface wrapper keeping a shadow copy of registers.
+
+    Non-volatile registers are read from the hardware only once. Subsequent
+    reads (including the ones in field read-modify-write) are served from the
+    shadow copy. Writes always go to the hardware and update the shadow copy.
+
+    Volatility of registers is declared with `register_volatility()`, which is
+    called by register access classes when they are bound to the register
+    interface. Registers with unknown volatility are treated according to the
+    `default_volatile` setting.
+    """
+
+    def __init__(
+        self,
+        regif: RegisterInterface,
+        default_volatile: bool = True,
+        trace: bool = False,
+    ):
+        """Initialize the cached register interface.
+
+        Arguments:
+            regif -- underlying register interface to access the hardware with.
+
+        Keyword Arguments:
+            default_volatile -- treat registers with unknown volatility as
+                volatile, i.e., never cache them.
+            trace -- activate operation tracing (uses `loguru.trace()` under the hood).
+        """
+        super().__init__(regif.data_width, regif.address_bounds, trace)
+        self._regif = regif
+        self._default_volatile = default_volatile
+        self._volatile: Dict[int, bool] = {}
+        self._shadow: Dict[int, int] = {}
+
+    def register_volatility(self, reg_address: int, volatile: bool) -> None:
+        """Declare whether register value can change without software access.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            volatile -- True if the register needs to be always accessed in hardware.
+        """
+        self._volatile[reg_address] = volatile
+        if volatile:
+            self._shadow.pop(reg_address, None)
+        self._regif.register_volatility(reg_address, volatile)
+
+    def _is_cacheable(self, reg_address: int) -> bool:
+        """Check if the register value can be served from the shadow copy."""
+        return not self._volatile.get(reg_address, self._default_volatile)
+
+    def invalidate(self, address_range: Optional[range] = None) -> None:
+        """Drop shadow copy of registers.
+
+        Keyword Arguments:
+            address_range -- range of absolute addresses to invalidate. If None
+                the whole shadow copy is invalidated.
+        """
+        if address_range is None:
+            self._shadow.clear()
+            return
+        for reg_address in [
+            reg_address for reg_address in self._shadow if reg_address in address_range
+        ]:
+            del self._shadow[reg_address]
+
+    def sync(self) -> None:
+        """Refresh the shadow copy from the hardware with a single bulk read."""
+        reg_addresses = list(self._shadow)
+        if len(reg_addresses) > 0:
+            self._shadow.update(zip(reg_addresses, self._regif.get_many(reg_addresses)))
+
+    def _get(self, reg_address: int) -> int:
+        """Get register value from the shadow copy or the hardware.
+
+        Arguments:
+            reg_address -- absolute register address.
+
+        Returns:
+            Register value.
+        """
+        if reg_address in self._shadow:
+            return self._shadow[reg_address]
+        value = self._regif.get(reg_address)
+        if self._is_cacheable(reg_address):
+            self._shadow[reg_address] = value
+        return value
+
+    def _set(self, reg_address: int, value: int):
+        """Set register value in the hardware and the shadow copy.
+
+        Arguments:
+            reg_address -- absolute register address.
+            value -- value to write to the register.
+        """
+        self._regif.set(reg_address, value)
+        if self._is_cacheable(reg_address):
+            self._shadow[reg_address] = value
+
+    def _modify(self, reg_address: int, mask: int, value: int) -> int:
+        """Read-modify-write register value.
+
+        If the register is in the shadow copy, only the write goes to the
+        hardware. Otherwise the underlying register interface performs the
+        read-modify-write (possibly natively).
+
+        Arguments:
+            reg_address -- absolute register address.
+            mask -- mask of the register bits to modify.
+            value -- new value of the masked bits (already shifted).
+
+        Returns:
+            New register value.
+        """
+        if reg_address in self._shadow:
+            new_value = (self._shadow[reg_address] & ~mask) | value
+            self._regif.set(reg_address, new_value)
+        else:
+            new_value = self._regif.modify(reg_address, mask, value)
+        if self._is_cacheable(reg_address):
+            self._shadow[reg_address] = new_value
+        return new_value
+
+    def _wait_for(  # pylint: disable=too-many-arguments
+        self, reg_address: int, mask: int, value: int, timeout: float, interval: float
+    ) -> int:
+        """Wait for register value in the hardware.
+
+        The shadow copy is bypassed, since waiting for a value only makes sense
+        if the register can change. It's updated with the last read value.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            mask -- mask of the register bits to compare.
+            value -- expected value of the masked bits (already shifted).
+            timeout -- maximum time to wait in seconds.
+            interval -- maximum polling interval in seconds.
+
+        Returns:
+            Last read register value (not matching if the timeout occurred).
+        """
+        try:
+            current = self._regif.wait_for(reg_address, mask, value, timeout, interval)
+        except WaitTimeoutError as exc:
+            current = exc.value
+        if self._is_cacheable(reg_address):
+            self._shadow[reg_address] = current
+        return current
+
+    def _get_many(self, reg_addresses: Sequence[int]) -> List[int]:
+        """Get values of multiple registers reading only missing ones from the hardware.
+
+        Arguments:
+            reg_addresses -- absolute register addresses.
+
+        Returns:
+            Register values.
+        """
+        shadow = self._shadow
+        missing = [address for address in reg_addresses if address not in shadow]
+        values = dict(zip(missing, self._regif.get_many(missing)))
+        for reg_address in missing:
+            if self._is_cacheable(reg_address):
+                shadow[reg_address] = values[reg_address]
+        return [
+            shadow[address] if address in shadow else values[address]
+            for address in reg_addresses
+        ]
+
+    def _set_many(self, reg_addresses: Sequence[int], values: Sequence[int]):
+        """Set values of multiple registers in the hardware and the shadow copy.
+
+        Arguments:
+            reg_addresses -- absolute register addresses.
+            values -- values to write to the registers.
+        """
+        self._regif.set_many(zip(reg_addresses, values))
+        for reg_address, value in zip(reg_addresses, values):
+            if self._is_cacheable(reg_address):
+                self._shadow[reg_address] = value
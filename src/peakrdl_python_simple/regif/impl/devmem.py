@@ -2,21 +2,35 @@
 
 __authors__ = ["Marek Pikuła <marek.pikula at embevity.com>"]
 
+import shlex
 import subprocess
-from typing import List, Optional, Union
+import threading
+import uuid
+from typing import IO, List, Optional, Sequence, Set, Tuple, Union
 
 from ..regif import RegisterInterface
 
+_VERIFIED_COMMANDS: Set[Tuple[str, ...]] = set()
+"""`devmem` commands, which already passed the execution check."""
+
 
 class DevmemRegIf(RegisterInterface):
-    """Register interface using `devmem` command."""
+    """Register interface using `devmem` command.
+
+    By default every access spawns a new `devmem` process. In the persistent
+    mode a single long-lived shell is kept as a coprocess and `devmem`
+    invocations are streamed to its standard input, which avoids spawning the
+    shell for every access and batch.
+    """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         data_width: int,
         address_bounds: Optional[range] = None,
         devmem_command: Union[str, List[str]] = "devmem",
         trace: bool = False,
+        persistent: bool = False,
+        shell: Union[str, List[str]] = "sh",
     ):
         """Initialize the UIO region register interface.
 
@@ -29,6 +43,10 @@ class DevmemRegIf(RegisterInterface):
 
         Keyword Arguments:
             trace -- activate operation tracing (uses `loguru.trace()` under the hood).
+            persistent -- execute `devmem` commands in a persistent shell
+                coprocess. It's started on first access.
+            shell -- shell command used in the persistent mode (e.g.,
+                `["busybox", "sh"]`).
 
         Raises:
             ValueError: raised if sanity check on the arguments doesn't pass.
@@ -38,13 +56,47 @@ class DevmemRegIf(RegisterInterface):
             self._cmd = [devmem_command]
         else:
             self._cmd = devmem_command
+        self._shell: Optional[List[str]] = None
+        if persistent:
+            self._shell = [shell] if isinstance(shell, str) else shell
+        self._process: Optional["subprocess.Popen[bytes]"] = None
+        self._process_lock = threading.Lock()
+        self._delimiter = f"__devmem_{uuid.uuid4().hex}__"
 
-        try:
-            subprocess.run([*self._cmd, "--help"], capture_output=True, check=True)
-        except subprocess.CalledProcessError as exc:
-            raise RuntimeError(
-                f"Execution check of devmem command ({devmem_command}) failed."
-            ) from exc
+        # The check is cached, since it costs a process spawn.
+        if tuple(self._cmd) not in _VERIFIED_COMMANDS:
+            try:
+                subprocess.run([*self._cmd, "--help"], capture_output=True, check=True)
+            except subprocess.CalledProcessError as exc:
+                raise RuntimeError(
+                    f"Execution check of devmem command ({devmem_command}) failed."
+                ) from exc
+            _VERIFIED_COMMANDS.add(tuple(self._cmd))
+
+    def __del__(self):
+        """Ensure the coprocess is stopped."""
+        if hasattr(self, "_process"):
+            self.close()
+
+    def close(self) -> None:
+        """Stop the persistent shell coprocess (if running).
+
+        It's started again on the next access.
+        """
+        process = self._process
+        self._process = None
+        if process is not None:
+            assert process.stdin is not None and process.stdout is not None
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+            try:
+                process.wait(1)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+            process.stdout.close()
 
     def _get(self, reg_address: int) -> int:
         """Read register value with `devmem`.
@@ -58,18 +110,23 @@ class DevmemRegIf(RegisterInterface):
             Data from the register.
         """
         try:
-            return int(
-                subprocess.run(
-                    [*self._cmd, f"0x{reg_address:X}", str(self._data_width)],
-                    capture_output=True,
-                    check=True,
-                ).stdout.strip(),
-                0,
-            )
-        except subprocess.CalledProcessError as exc:
+            if self._shell is not None:
+                output = self._run_script([self._command_line(reg_address)])[0]
+            else:
+                output = (
+                    subprocess.run(
+                        [*self._cmd, f"0x{reg_address:X}", str(self._data_width)],
+                        capture_output=True,
+                        check=True,
+                    )
+                    .stdout.decode()
+                    .strip()
+                )
+        except (subprocess.CalledProcessError, IndexError) as exc:
             raise RuntimeError(
                 f"Failed to execute devmem get command for register 0x{reg_address:X}."
             ) from exc
+        return self._parse_values([output])[0]
 
     def _set(self, reg_address: int, value: int) -> None:
         """Write register using `devmem`.
@@ -81,6 +138,9 @@ class DevmemRegIf(RegisterInterface):
             value -- value to write to the register.
         """
         try:
+            if self._shell is not None:
+                self._run_script([self._command_line(reg_address, value)])
+                return
             subprocess.run(
                 [
                     *self._cmd,
@@ -95,3 +155,152 @@ class DevmemRegIf(RegisterInterface):
                 "Failed to execute devmem set command for register "
                 f"0x{reg_address:X} = 0x{value:X}."
             ) from exc
+
+    def _command_line(self, reg_address: int, value: Optional[int] = None) -> str:
+        """Format a shell-quoted `devmem` invocation for use in a batch script."""
+        args = [*self._cmd, f"0x{reg_address:X}", str(self._data_width)]
+        if value is not None:
+            args.append(f"0x{value:X}")
+        return " ".join(shlex.quote(arg) for arg in args)
+
+    def _run_script(self, lines: List[str]) -> List[str]:
+        """Execute a batch of `devmem` invocations in a single shell process.
+
+        The script stops on the first failing command. In the persistent mode
+        the script is executed by the shell coprocess.
+
+        Arguments:
+            lines -- shell command lines.
+
+        Returns:
+            Non-empty lines of the script output.
+
+        Raises:
+            CalledProcessError: a command of the script failed.
+        """
+        if self._shell is not None:
+            return self._run_coprocess(lines)
+        return (
+            subprocess.run(
+                ["sh", "-e", "-c", "\n".join(lines)],
+                capture_output=True,
+                check=True,
+            )
+            .stdout.decode()
+            .split()
+        )
+
+    def _coprocess(self) -> Tuple[IO[bytes], IO[bytes]]:
+        """Get standard input and output of the shell coprocess, starting it if needed.
+
+        Standard error of the coprocess is inherited, so diagnostic messages
+        aren't mixed with the parsed output.
+        """
+        if self._process is None or self._process.poll() is not None:
+            assert self._shell is not None
+            self._process = subprocess.Popen(  # pylint: disable=consider-using-with
+                self._shell, stdin=subprocess.PIPE, stdout=subprocess.PIPE
+            )
+        assert self._process.stdin is not None and self._process.stdout is not None
+        return self._process.stdin, self._process.stdout
+
+    def _run_coprocess(self, lines: List[str]) -> List[str]:
+        """Execute a batch of `devmem` invocations in the shell coprocess.
+
+        The commands are chained with `&&`, so the batch stops on the first
+        failing command. The end of the batch output is marked with
+        a delimiter line followed by the exit status.
+
+        Arguments:
+            lines -- shell command lines.
+
+        Returns:
+            Non-empty lines of the batch output.
+
+        Raises:
+            CalledProcessError: a command of the batch failed.
+            RuntimeError: the coprocess terminated unexpectedly.
+        """
+        script = " &&\n".join(lines) + f"\necho {self._delimiter} $?\n"
+        with self._process_lock:
+            stdin, stdout = self._coprocess()
+            output: List[str] = []
+            try:
+                stdin.write(script.encode())
+                stdin.flush()
+                while True:
+                    line = stdout.readline()
+                    if len(line) == 0:
+                        raise RuntimeError("devmem shell coprocess terminated.")
+                    words = line.decode().split()
+                    if len(words) == 2 and words[0] == self._delimiter:
+                        status = int(words[1])
+                        break
+                    output.extend(words)
+            except (OSError, RuntimeError):
+                self.close()
+                raise
+        if status != 0:
+            raise subprocess.CalledProcessError(
+                status, self._cmd, "\n".join(output).encode()
+            )
+        return output
+
+    def _get_many(self, reg_addresses: Sequence[int]) -> List[int]:
+        """Read multiple registers with a single `devmem` batch script.
+
+        Arguments:
+            reg_addresses -- absolute addresses of registers to read.
+
+        Returns:
+            Data from the registers.
+        """
+        if len(reg_addresses) == 0:
+            return []
+        try:
+            output = self._run_script(
+                [self._command_line(reg_address) for reg_address in reg_addresses]
+            )
+        except subprocess.CalledProcessError as exc:
+            raise RuntimeError(
+                f"Failed to execute devmem batch get command for {len(reg_addresses)} registers."
+            ) from exc
+        if len(output) != len(reg_addresses):
+            raise RuntimeError(
+                f"Unexpected devmem batch output: got {len(output)} values, "
+                f"expected {len(reg_addresses)}."
+            )
+        return self._parse_values(output)
+
+    @staticmethod
+    def _parse_values(output: List[str]) -> List[int]:
+        """Parse register values printed by `devmem`.
+
+        Raises:
+            RuntimeError: the output isn't a register value.
+        """
+        try:
+            return [int(value, 0) for value in output]
+        except ValueError as exc:
+            raise RuntimeError(f"Unexpected devmem output: {output!r}.") from exc
+
+    def _set_many(self, reg_addresses: Sequence[int], values: Sequence[int]) -> None:
+        """Write multiple registers with a single `devmem` batch script.
+
+        Arguments:
+            reg_addresses -- absolute addresses of registers to write to.
+            values -- values to write to the registers.
+        """
+        if len(reg_addresses) == 0:
+            return
+        try:
+            self._run_script(
+                [
+                    self._command_line(reg_address, value)
+                    for reg_address, value in zip(reg_addresses, values)
+                ]
+            )
+        except subprocess.CalledProcessError as exc:
+            raise RuntimeError(
+                f"Failed to execute devmem batch set command for {len(reg_addresses)} registers."
+            ) from exc
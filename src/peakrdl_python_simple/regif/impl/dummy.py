@@ -2,7 +2,7 @@
 
 __authors__ = ["Marek Pikuła <marek.pikula at embevity.com>"]
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Sequence
 
 from ..regif import RegisterInterface
 
@@ -57,3 +57,25 @@ class DummyRegIf(RegisterInterface):
             value -- value to write to the register.
         """
         self._values[reg_address] = value
+
+    def _get_many(self, reg_addresses: Sequence[int]) -> List[int]:
+        """Get values from multiple registers.
+
+        Arguments:
+            reg_addresses -- absolute register addresses.
+
+        Returns:
+            Register values.
+        """
+        values = self._values
+        reset_value = self._reset_value
+        return [values.get(reg_address, reset_value) for reg_address in reg_addresses]
+
+    def _set_many(self, reg_addresses: Sequence[int], values: Sequence[int]):
+        """Set values of multiple registers.
+
+        Arguments:
+            reg_addresses -- absolute register addresses.
+            values -- values to write to the registers.
+        """
+        self._values.update(zip(reg_addresses, values))
@@ -3,15 +3,140 @@
 __authors__ = ["Marek Pikuła <marek.pikula at embevity.com>"]
 
 import mmap
+import struct
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from functools import partial
 from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from ..regif import RegisterInterface
 
+try:
+    import numpy
+
+    NUMPY_ENABLED = True
+except ImportError:
+    NUMPY_ENABLED = False  # type: ignore
+
+_STRUCT_FORMATS = {1: "B", 2: "H", 4: "I", 8: "Q"}
+"""Struct format characters for data widths (in bytes) natively supported by `struct`."""
+
+
+def _map_region(
+    fileno: int, offset: int, length: int, data_bytes: int
+) -> Tuple[mmap.mmap, memoryview, Optional[memoryview]]:
+    """Map a region of a file.
+
+    Arguments:
+        fileno -- file descriptor of the memory device.
+        offset -- page-aligned offset of the region in the file.
+        length -- length of the region in bytes.
+        data_bytes -- register width in bytes.
+
+    Returns:
+        Tuple of (mapping, byte view, typed view). The typed view is None if
+        the register width or byte order is not natively supported.
+    """
+    mapping = mmap.mmap(
+        fileno,
+        length,
+        mmap.MAP_SHARED,
+        mmap.PROT_READ | mmap.PROT_WRITE,
+        offset=offset,
+    )
+    data = memoryview(mapping)
+    fmt = _STRUCT_FORMATS.get(data_bytes)
+    if fmt is None or sys.byteorder != "little" or struct.calcsize(fmt) != data_bytes:
+        # Typed view uses native byte order and size, so it's used only if
+        # they're the same as the register ones.
+        return mapping, data, None
+    size = len(data) - len(data) % data_bytes
+    return mapping, data, data[:size].cast(fmt)  # type: ignore[call-overload]
+
+
+def _decode(data: Any, data_bytes: int) -> List[int]:
+    """Decode raw little-endian memory contents into register values."""
+    fmt = _STRUCT_FORMATS.get(data_bytes)
+    if fmt is not None:
+        return list(struct.unpack(f"<{len(data) // data_bytes}{fmt}", data))
+    return [
+        int.from_bytes(data[i : i + data_bytes], "little")
+        for i in range(0, len(data), data_bytes)
+    ]
+
+
+def _encode(values: Sequence[int], data_bytes: int) -> bytes:
+    """Encode register values into raw little-endian memory contents."""
+    fmt = _STRUCT_FORMATS.get(data_bytes)
+    if fmt is not None:
+        return struct.pack(f"<{len(values)}{fmt}", *values)
+    return b"".join(
+        value.to_bytes(data_bytes, "little", signed=False) for value in values
+    )
+
+
+def _poll(  # pylint: disable=too-many-arguments
+    read: Callable[[], int],
+    mask: int,
+    value: int,
+    spin_deadline: float,
+    check_period: int,
+    delays: Iterator[float],
+) -> int:
+    """Poll register until masked bits are equal to the value.
+
+    The register is busy-polled until `spin_deadline` (checked every
+    `check_period` reads) and then polled after each of the delays.
+
+    Arguments:
+        read -- register reader.
+        mask -- mask of the register bits to compare.
+        value -- expected value of the masked bits (already shifted).
+        spin_deadline -- end of busy-polling (as in `time.monotonic()`).
+        check_period -- number of busy-poll reads between deadline checks.
+        delays -- sleep durations between the following polls.
+
+    Returns:
+        Last read register value (not matching if the timeout occurred).
+    """
+    while True:
+        for _ in range(check_period):
+            current = read()
+            if current & mask == value:
+                return current
+        if time.monotonic() >= spin_deadline:
+            break
+    for delay in delays:
+        time.sleep(delay)
+        current = read()
+        if current & mask == value:
+            break
+    return current
+
 
 class MmapRegIf(RegisterInterface):
     """Memory mapped register interface.
 
     Can be for example /dev/mem or /dev/uioX device.
+
+    If the data width is natively supported (8, 16, 32 or 64 bits), registers
+    are accessed through a typed `memoryview` of the mapping, so each access is
+    a single aligned load or store without any intermediate allocation. The
+    access path doesn't depend on the file position, so it's safe to use from
+    multiple threads.
     """
 
     def __init__(
@@ -34,23 +159,509 @@ class MmapRegIf(RegisterInterface):
         """
         super().__init__(data_width, address_bounds, trace)
         self._address_bounds: range = address_bounds
-        self._data_bytes = self._data_width // 8
         self._mem_file = open(device, "r+b", 0)  # pylint: disable=consider-using-with
-        self._mmap = mmap.mmap(
+        # Mapping offset needs to be page-aligned.
+        self._base = (
+            address_bounds.start - address_bounds.start % mmap.ALLOCATIONGRANULARITY
+        )
+        self._mmap, self._bytes, self._view = _map_region(
             self._mem_file.fileno(),
-            address_bounds.stop - address_bounds.start,
-            mmap.MAP_SHARED,
-            mmap.PROT_READ | mmap.PROT_WRITE,
-            offset=address_bounds.start,
+            self._base,
+            address_bounds.stop - self._base,
+            self._data_bytes,
+        )
+
+    def __del__(self):
+        """Ensure the memory device file is closed.
+
+        The mmap isn't closed explicitly, as arrays returned by `as_array()`
+        reference it without holding a buffer export. It's unmapped once the
+        last of them is dropped.
+        """
+        if hasattr(self, "_mem_file"):
+            self._mem_file.close()
+
+    def _get(self, reg_address: int) -> int:
+        """Get value from register.
+
+        Arguments:
+            reg_address -- absolute register address.
+
+        Returns:
+            Register value.
+        """
+        offset = reg_address - self._base
+        if self._view is not None and offset % self._data_bytes == 0:
+            return self._view[offset // self._data_bytes]
+        return int.from_bytes(self._bytes[offset : offset + self._data_bytes], "little")
+
+    def _set(self, reg_address: int, value: int):
+        """Set register value.
+
+        Arguments:
+            reg_address -- absolute register address.
+            value -- value to write to the register.
+        """
+        offset = reg_address - self._base
+        if self._view is not None and offset % self._data_bytes == 0:
+            self._view[offset // self._data_bytes] = value
+        else:
+            self._bytes[offset : offset + self._data_bytes] = value.to_bytes(
+                self._data_bytes, "little", signed=False
+            )
+
+    WAIT_CHECK_PERIOD: int = 1024
+    """Number of `_wait_for()` busy-poll iterations between deadline checks."""
+
+    WAIT_SPIN_TIME: float = 1e-4
+    """Time (in seconds) for which `_wait_for()` busy-polls before backing off."""
+
+    def _wait_for(  # pylint: disable=too-many-arguments
+        self, reg_address: int, mask: int, value: int, timeout: float, interval: float
+    ) -> int:
+        """Poll register until masked bits are equal to the value.
+
+        Memory access is cheap, so the register is first busy-polled for
+        `WAIT_SPIN_TIME` to catch quick changes with low latency. Then it's
+        polled with exponential backoff up to `interval`, like in the default
+        implementation, not to keep a CPU core busy for long waits.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            mask -- mask of the register bits to compare.
+            value -- expected value of the masked bits (already shifted).
+            timeout -- maximum time to wait in seconds.
+            interval -- maximum polling interval in seconds.
+
+        Returns:
+            Last read register value (not matching if the timeout occurred).
+        """
+        offset = reg_address - self._base
+        if self._view is not None and offset % self._data_bytes == 0:
+            read = partial(self._view.__getitem__, offset // self._data_bytes)
+        else:
+            read = partial(self._get, reg_address)
+        now = time.monotonic()
+        deadline = now + timeout
+        return _poll(
+            read,
+            mask,
+            value,
+            min(now + self.WAIT_SPIN_TIME, deadline),
+            self.WAIT_CHECK_PERIOD,
+            self._poll_delays(deadline, interval),
+        )
+
+    def _view_indices(self, reg_addresses: Sequence[int]) -> Optional[List[int]]:
+        """Get typed view indices of registers.
+
+        Returns:
+            Indices or None if the typed view can't be used (it's not available
+            or any of the addresses is not aligned).
+        """
+        if self._view is None:
+            return None
+        start = self._base
+        size = self._data_bytes
+        offsets = [reg_address - start for reg_address in reg_addresses]
+        if any(offset % size for offset in offsets):
+            return None
+        return [offset // size for offset in offsets]
+
+    def _get_many(self, reg_addresses: Sequence[int]) -> List[int]:
+        """Get values from multiple registers.
+
+        Arguments:
+            reg_addresses -- absolute register addresses.
+
+        Returns:
+            Register values.
+        """
+        indices = self._view_indices(reg_addresses)
+        if indices is not None:
+            view = self._view
+            assert view is not None
+            return [view[index] for index in indices]
+        mem = self._bytes
+        start = self._base
+        size = self._data_bytes
+        return _decode(
+            b"".join(
+                mem[reg_address - start : reg_address - start + size]
+                for reg_address in reg_addresses
+            ),
+            size,
+        )
+
+    def _set_many(self, reg_addresses: Sequence[int], values: Sequence[int]):
+        """Set values of multiple registers.
+
+        Arguments:
+            reg_addresses -- absolute register addresses.
+            values -- values to write to the registers.
+        """
+        indices = self._view_indices(reg_addresses)
+        if indices is not None:
+            view = self._view
+            assert view is not None
+            for index, value in zip(indices, values):
+                view[index] = value
+            return
+        mem = self._bytes
+        start = self._base
+        size = self._data_bytes
+        data = _encode(values, size)
+        for i, reg_address in enumerate(reg_addresses):
+            mem[reg_address - start : reg_address - start + size] = data[
+                i * size : (i + 1) * size
+            ]
+
+    def _read_block(self, start: int, count: int) -> List[int]:
+        """Read consecutive registers with a single memory copy.
+
+        Arguments:
+            start -- absolute address of the first register.
+            count -- number of registers to read.
+
+        Returns:
+            Register values.
+        """
+        offset = start - self._base
+        if self._view is not None and offset % self._data_bytes == 0:
+            index = offset // self._data_bytes
+            return self._view[index : index + count].tolist()
+        return _decode(
+            self._bytes[offset : offset + count * self._data_bytes], self._data_bytes
+        )
+
+    def _write_block(self, start: int, values: Sequence[int]):
+        """Write consecutive registers with a single memory copy.
+
+        Arguments:
+            start -- absolute address of the first register.
+            values -- values to write to the registers.
+        """
+        offset = start - self._base
+        if self._view is not None and offset % self._data_bytes == 0:
+            index = offset // self._data_bytes
+            self._view[index : index + len(values)] = array(self._view.format, values)
+            return
+        self._bytes[offset : offset + len(values) * self._data_bytes] = _encode(
+            values, self._data_bytes
+        )
+
+    def _block_buffer(self, start: int, buffer: Any) -> memoryview:
+        """Validate a block access with a caller-provided buffer.
+
+        Arguments:
+            start -- absolute address of the first register.
+            buffer -- object supporting the buffer protocol.
+
+        Returns:
+            Byte view of the buffer.
+
+        Raises:
+            ValueError: buffer size is not a multiple of the register size or
+                the block is out of the address bounds.
+            RuntimeError: called inside a transaction.
+        """
+        if self._transaction is not None:
+            raise RuntimeError("Buffer block access is not supported in transactions.")
+        data = memoryview(buffer).cast("B")
+        if len(data) % self._data_bytes != 0:
+            raise ValueError(
+                f"Buffer size ({len(data)}) is not a multiple of "
+                f"register size ({self._data_bytes})."
+            )
+        self._sanitize_field_args(start)
+        if len(data) > 0:
+            self._sanitize_field_args(start + len(data) - self._data_bytes)
+        return data
+
+    def read_block_into(self, start: int, buffer: Any) -> int:
+        """Copy a block of consecutive registers into a caller-provided buffer.
+
+        The registers are copied directly from the mapping into the buffer
+        without any intermediate objects. Transactions are not supported.
+
+        Arguments:
+            start -- absolute address of the first register.
+            buffer -- writable buffer (e.g., `bytearray` or `array.array`).
+                Its size in bytes determines the number of registers to read.
+
+        Returns:
+            Number of registers read.
+        """
+        data = self._block_buffer(start, buffer)
+        offset = start - self._base
+        data[:] = self._bytes[offset : offset + len(data)]
+        count = len(data) // self._data_bytes
+        if self._trace_active:
+            for reg_address, value in zip(
+                self._block_addresses(start, count), _decode(data, self._data_bytes)
+            ):
+                self._trace(self._Operation.GET, reg_address, value)
+        return count
+
+    def write_block_from(self, start: int, buffer: Any) -> int:
+        """Copy a caller-provided buffer into a block of consecutive registers.
+
+        The buffer is copied directly into the mapping without any
+        intermediate objects. Transactions are not supported.
+
+        Arguments:
+            start -- absolute address of the first register.
+            buffer -- buffer with little-endian register values (e.g., `bytes`
+                or `array.array`).
+
+        Returns:
+            Number of registers written.
+        """
+        data = self._block_buffer(start, buffer)
+        count = len(data) // self._data_bytes
+        if self._trace_active:
+            for reg_address, value in zip(
+                self._block_addresses(start, count), _decode(data, self._data_bytes)
+            ):
+                self._trace(self._Operation.SET, reg_address, value)
+        offset = start - self._base
+        self._bytes[offset : offset + len(data)] = data
+        return count
+
+    def as_array(self, start: int, count: int, dtype: Any = None) -> Any:
+        """Get an array aliasing a block of the mapped memory.
+
+        Nothing is copied, so changes of the array are directly reflected in
+        the memory and vice versa. Access through the array bypasses tracing,
+        metrics and transactions.
+
+        Arguments:
+            start -- absolute address of the first element.
+            count -- number of elements.
+
+        Keyword Arguments:
+            dtype -- NumPy data type of the elements. Defaults to little-endian
+                unsigned integer of the register width. Requires NumPy.
+
+        Returns:
+            NumPy array or, if NumPy is not installed, a `memoryview` (typed if
+            the data width is natively supported, otherwise raw bytes).
+
+        Raises:
+            ValueError: the block is out of the address bounds or the data
+                width is not supported by NumPy.
+            RuntimeError: `dtype` was given, but NumPy is not installed.
+        """
+        self._sanitize_field_args(start)
+        offset = start - self._base
+        if not NUMPY_ENABLED:
+            if dtype is not None:
+                raise RuntimeError("NumPy not installed. Can't use custom dtype.")
+            if offset + count * self._data_bytes > len(self._bytes):
+                raise ValueError("Array exceeds the register interface allowed range.")
+            if self._view is not None and offset % self._data_bytes == 0:
+                index = offset // self._data_bytes
+                return self._view[index : index + count]
+            return self._bytes[offset : offset + count * self._data_bytes]
+
+        if dtype is None:
+            if self._data_bytes not in _STRUCT_FORMATS:
+                raise ValueError(
+                    f"Data width {self.data_width} is not supported by NumPy."
+                )
+            dtype = f"<u{self._data_bytes}"
+        dtype = numpy.dtype(dtype)
+        if offset + count * dtype.itemsize > len(self._mmap):
+            raise ValueError("Array exceeds the register interface allowed range.")
+        return numpy.ndarray((count,), dtype, buffer=self._mmap, offset=offset)
+
+    def read_array(self, start: int, count: int) -> "numpy.ndarray":
+        """Read a block of consecutive registers into a NumPy array.
+
+        The registers are copied with a single memory copy.
+
+        Arguments:
+            start -- absolute address of the first register.
+            count -- number of registers to read.
+
+        Returns:
+            One-dimensional array of register values.
+        """
+        dtype = self._numpy_dtype()
+        if self._transaction is not None or dtype.hasobject:
+            return super().read_array(start, count)
+        ret = numpy.empty(count, dtype)
+        self.read_block_into(start, ret)
+        return ret
+
+    def write_array(self, start: int, values: "numpy.ndarray") -> None:
+        """Write a NumPy array to a block of consecutive registers.
+
+        The registers are written with a single memory copy.
+
+        Arguments:
+            start -- absolute address of the first register.
+            values -- array of register values. Multi-dimensional arrays are
+                written in C (row-major) order.
+        """
+        dtype = self._numpy_dtype()
+        if self._transaction is not None or dtype.hasobject:
+            super().write_array(start, values)
+            return
+        data = numpy.ascontiguousarray(values, dtype).ravel()
+        if not numpy.array_equal(data, numpy.ravel(values)):
+            raise ValueError("Register values wider than register width.")
+        self.write_block_from(start, data)
+
+
+class _MmapWindow(NamedTuple):
+    """Lazily mapped window of `WindowedMmapRegIf`."""
+
+    mapping: mmap.mmap
+    """Memory mapping of the window."""
+
+    data: memoryview
+    """Byte view of the mapping."""
+
+    view: Optional[memoryview]
+    """Typed view of the mapping (if the data width is natively supported)."""
+
+
+class WindowedMmapRegIf(
+    RegisterInterface
+):  # pylint: disable=too-many-instance-attributes
+    """Memory mapped register interface with lazily mapped windows.
+
+    Intended for very large or sparse address ranges (e.g., PCIe BARs). The
+    range is split into page-aligned windows, which are mapped on first access
+    and kept in the least recently used order. If the total size of mapped
+    windows exceeds `max_mapped_bytes`, the least recently used windows are
+    unmapped. Windows still referenced (e.g., by a poll in progress) stay
+    mapped until the reference is dropped.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        device: Path,
+        data_width: int,
+        address_bounds: range,
+        window_size: int = 1 << 20,
+        max_mapped_bytes: int = 64 << 20,
+        trace: bool = False,
+    ):
+        """Initialize the windowed memory mapped register interface.
+
+        Arguments:
+            device -- memory device path (e.g., "/dev/mem").
+            data_width -- width of data in bits, should be divisible by 8.
+            address_bounds -- address range, which is allowed by this register
+                interface. Doesn't need to be page-aligned.
+
+        Keyword Arguments:
+            window_size -- size of a single mapping in bytes. Needs to be
+                a multiple of `mmap.ALLOCATIONGRANULARITY`.
+            max_mapped_bytes -- maximum total size of mapped windows in bytes.
+            trace -- activate operation tracing (uses `loguru.trace()` under the hood).
+
+        Raises:
+            ValueError: raised if sanity check on the arguments doesn't pass.
+        """
+        super().__init__(data_width, address_bounds, trace)
+        if window_size <= 0 or window_size % mmap.ALLOCATIONGRANULARITY != 0:
+            raise ValueError(
+                f"Window size ({window_size}) needs to be a multiple of "
+                f"{mmap.ALLOCATIONGRANULARITY}."
+            )
+        if max_mapped_bytes < window_size:
+            raise ValueError(
+                f"Maximum mapped size ({max_mapped_bytes}) can't be smaller "
+                f"than window size ({window_size})."
+            )
+        self._address_bounds: range = address_bounds
+        self._window_size = window_size
+        self._max_mapped_bytes = max_mapped_bytes
+        self._base = (
+            address_bounds.start - address_bounds.start % mmap.ALLOCATIONGRANULARITY
         )
+        self._mem_file = open(device, "r+b", 0)  # pylint: disable=consider-using-with
+        self._windows: "OrderedDict[int, _MmapWindow]" = OrderedDict()
+        self._mapped_bytes = 0
+        self._windows_lock = threading.Lock()
 
     def __del__(self):
-        """Ensure the mmap is closed."""
-        if hasattr(self, "_mmap"):
-            self._mmap.close()
+        """Ensure the file is closed."""
+        if hasattr(self, "_windows"):
+            self._windows.clear()
         if hasattr(self, "_mem_file"):
             self._mem_file.close()
 
+    @property
+    def mapped_bytes(self) -> int:
+        """Get total size of currently mapped windows in bytes."""
+        return self._mapped_bytes
+
+    def _window(self, offset: int) -> Tuple[_MmapWindow, int]:
+        """Get window containing the offset, mapping it if needed.
+
+        Arguments:
+            offset -- offset from the mapping base.
+
+        Returns:
+            Window and the offset within it.
+        """
+        index, window_offset = divmod(offset, self._window_size)
+        with self._windows_lock:
+            window = self._windows.get(index)
+            if window is not None:
+                self._windows.move_to_end(index)
+                return window, window_offset
+
+            start = index * self._window_size
+            length = min(
+                self._window_size, self._address_bounds.stop - self._base - start
+            )
+            window = _MmapWindow(
+                *_map_region(
+                    self._mem_file.fileno(),
+                    self._base + start,
+                    length,
+                    self._data_bytes,
+                )
+            )
+            self._windows[index] = window
+            self._mapped_bytes += length
+            while self._mapped_bytes > self._max_mapped_bytes:
+                # Unmapped once the last reference to the window is dropped.
+                _, evicted = self._windows.popitem(last=False)
+                self._mapped_bytes -= len(evicted.data)
+            return window, window_offset
+
+    def _read_bytes(self, offset: int, length: int) -> bytes:
+        """Read raw memory contents possibly spanning multiple windows."""
+        chunks: List[bytes] = []
+        while length > 0:
+            window, window_offset = self._window(offset)
+            chunk = window.data[window_offset : window_offset + length]
+            if len(chunk) == 0:
+                raise ValueError("Access exceeds the register interface allowed range.")
+            chunks.append(chunk.tobytes())
+            offset += len(chunk)
+            length -= len(chunk)
+        return b"".join(chunks)
+
+    def _write_bytes(self, offset: int, data: bytes) -> None:
+        """Write raw memory contents possibly spanning multiple windows."""
+        position = 0
+        while position < len(data):
+            window, window_offset = self._window(offset + position)
+            size = min(len(data) - position, len(window.data) - window_offset)
+            if size <= 0:
+                raise ValueError("Access exceeds the register interface allowed range.")
+            window.data[window_offset : window_offset + size] = data[
+                position : position + size
+            ]
+            position += size
+
     def _get(self, reg_address: int) -> int:
         """Get value from register.
 
@@ -60,8 +671,11 @@ class MmapRegIf(RegisterInterface):
         Returns:
             Register value.
         """
-        self._mmap.seek(reg_address - self._address_bounds.start)
-        return int.from_bytes(self._mmap.read(self._data_bytes), "little")
+        offset = reg_address - self._base
+        window, window_offset = self._window(offset)
+        if window.view is not None and window_offset % self._data_bytes == 0:
+            return window.view[window_offset // self._data_bytes]
+        return int.from_bytes(self._read_bytes(offset, self._data_bytes), "little")
 
     def _set(self, reg_address: int, value: int):
         """Set register value.
@@ -70,5 +684,69 @@ class MmapRegIf(RegisterInterface):
             reg_address -- absolute register address.
             value -- value to write to the register.
         """
-        self._mmap.seek(reg_address - self._address_bounds.start)
-        self._mmap.write(value.to_bytes(self._data_bytes, "little", signed=False))
+        offset = reg_address - self._base
+        window, window_offset = self._window(offset)
+        if window.view is not None and window_offset % self._data_bytes == 0:
+            window.view[window_offset // self._data_bytes] = value
+        else:
+            self._write_bytes(
+                offset, value.to_bytes(self._data_bytes, "little", signed=False)
+            )
+
+    def _wait_for(  # pylint: disable=too-many-arguments
+        self, reg_address: int, mask: int, value: int, timeout: float, interval: float
+    ) -> int:
+        """Poll register until masked bits are equal to the value.
+
+        The window containing the register is kept mapped during the poll. See
+        `MmapRegIf._wait_for()` for details.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            mask -- mask of the register bits to compare.
+            value -- expected value of the masked bits (already shifted).
+            timeout -- maximum time to wait in seconds.
+            interval -- maximum polling interval in seconds.
+
+        Returns:
+            Last read register value (not matching if the timeout occurred).
+        """
+        window, window_offset = self._window(reg_address - self._base)
+        if window.view is not None and window_offset % self._data_bytes == 0:
+            read = partial(window.view.__getitem__, window_offset // self._data_bytes)
+        else:
+            read = partial(self._get, reg_address)
+        now = time.monotonic()
+        deadline = now + timeout
+        return _poll(
+            read,
+            mask,
+            value,
+            min(now + MmapRegIf.WAIT_SPIN_TIME, deadline),
+            MmapRegIf.WAIT_CHECK_PERIOD,
+            self._poll_delays(deadline, interval),
+        )
+
+    def _read_block(self, start: int, count: int) -> List[int]:
+        """Read consecutive registers with a memory copy per window.
+
+        Arguments:
+            start -- absolute address of the first register.
+            count -- number of registers to read.
+
+        Returns:
+            Register values.
+        """
+        return _decode(
+            self._read_bytes(start - self._base, count * self._data_bytes),
+            self._data_bytes,
+        )
+
+    def _write_block(self, start: int, values: Sequence[int]):
+        """Write consecutive registers with a memory copy per window.
+
+        Arguments:
+            start -- absolute address of the first register.
+            values -- values to write to the registers.
+        """
+        self._write_bytes(start - self._base, _encode(values, self._data_bytes))
@@ -2,15 +2,44 @@
 
 __authors__ = ["Marek Pikuła <marek.pikula at embevity.com>"]
 
-from typing import List, Optional, Tuple
+import threading
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
 
-from ..regif import RegisterInterface
+from ..metrics import AccessStats
+from ..regif import LOGURU_ACTIVE, RegisterInterface
 
+_T = TypeVar("_T")
 
-class MultiRegionRegIf(RegisterInterface):
-    """Register interface mapping multiple regions to different separate regifs."""
 
-    def __init__(self, regions: List[RegisterInterface], trace: Optional[bool] = None):
+class MultiRegionRegIf(  # pylint: disable=too-many-instance-attributes
+    RegisterInterface
+):
+    """Register interface mapping multiple regions to different separate regifs.
+
+    Sub-regions are kept in an index sorted by address, so the sub-region of a
+    register is found with a binary search (or right away if it's the same as
+    in the previous access). Accesses are validated and traced once by the
+    multi-region and dispatched straight to the implementation of the
+    sub-region. Batches are split into one batch per sub-region.
+
+    With `max_workers` greater than 1, batches spanning multiple sub-regions
+    are transferred concurrently (e.g., with slow remote sub-regions), one
+    task per sub-region, so the order of accesses within each sub-region is
+    kept.
+    """
+
+    # Sub-region implementation methods are called directly on purpose.
+    # pylint: disable=protected-access
+
+    def __init__(
+        self,
+        regions: Sequence[RegisterInterface],
+        trace: Optional[bool] = None,
+        max_workers: int = 1,
+    ):
         """Initialize the multi-region register interface.
 
         The sub-regions need to:
@@ -19,19 +48,25 @@ class MultiRegionRegIf(RegisterInterface):
         - have no address bounds collisions between each other.
 
         Arguments:
-            regions -- list of regions.
+            regions -- register interfaces of the regions.
 
         Keyword Arguments:
             trace -- overrides operation tracing for all regions. If None doesn't modify the
-                sub-regions.
+                sub-regions and traces multi-region operations if any sub-region has tracing
+                enabled.
+            max_workers -- maximum number of sub-regions accessed concurrently
+                by batch operations. The sub-regions need to support access from
+                multiple threads. 1 transfers the batches sequentially.
 
         Raises:
             ValueError: forbidden configuration of sub-regions.
         """
         if len(regions) == 0:
             raise ValueError("A multi-region needs to have at least one sub-region.")
+        if max_workers < 1:
+            raise ValueError("At least one worker is needed.")
 
-        bound_regions: List[Tuple[range, RegisterInterface]] = []
+        bound_regions: List[Tuple[range, int, RegisterInterface]] = []
         for reg_id, region in enumerate(regions):
             if region.data_width != regions[0].data_width:
                 raise ValueError(
@@ -43,41 +78,175 @@ class MultiRegionRegIf(RegisterInterface):
                 raise ValueError(
                     f"Sub-region {reg_id} doesn't have address bounds defined."
                 )
-            for bound_id, (bound, _) in enumerate(bound_regions):
-                if (
-                    region._address_bounds.start in bound
-                    or region._address_bounds.stop in bound
-                ):
-                    raise ValueError(
-                        f"Address bounds collision between sub-region {reg_id} and {bound_id}."
-                    )
-            bound_regions.append((region._address_bounds, region))
-
-        self._regions = sorted(bound_regions, key=lambda region: region[0].start)
+            bound_regions.append((region._address_bounds, reg_id, region))
+
+        bound_regions.sort(key=lambda region: (region[0].start, region[0].stop))
+        for previous, current in zip(bound_regions, bound_regions[1:]):
+            if current[0].start < previous[0].stop:
+                raise ValueError(
+                    "Address bounds collision between sub-region "
+                    f"{current[1]} and {previous[1]}."
+                )
+
+        self._regifs: List[RegisterInterface] = []
         super().__init__(
             regions[0].data_width,
-            range(self._regions[0][0].start, self._regions[-1][0].stop),
+            range(bound_regions[0][0].start, bound_regions[-1][0].stop),
             trace=False,
         )
+        self._bounds = [bounds for bounds, _, _ in bound_regions]
+        self._starts = [bounds.start for bounds in self._bounds]
+        self._stops = [bounds.stop for bounds in self._bounds]
+        self._regifs = [regif for _, _, regif in bound_regions]
+        self._last_hit = 0
+        self._max_workers = min(max_workers, len(regions))
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
 
         if trace is not None:
             self.tracing_enabled = trace
+        elif any(regif.tracing_enabled for regif in self._regifs):
+            self._trace_active = LOGURU_ACTIVE
 
     @property
     def tracing_enabled(self) -> bool:
-        """Check if any sub-region has operation tracing enabled."""
-        return any(region[1].tracing_enabled for region in self._regions)
+        """Check if the multi-region operation tracing is enabled."""
+        return self._trace_active
 
     @tracing_enabled.setter
-    def tracing_enabled(self, trace: bool):
-        for region in self._regions:
-            region[1].tracing_enabled = trace
+    def tracing_enabled(self, trace: bool) -> None:
+        """Set operation tracing of the multi-region and all the sub-regions.
+
+        Operations are traced once by the multi-region, sub-region tracing
+        applies only to operations called on the sub-regions directly.
+        """
+        RegisterInterface.tracing_enabled.fset(self, trace)  # type: ignore
+        for regif in self._regifs:
+            regif.tracing_enabled = trace
+
+    def __del__(self):
+        """Ensure the worker threads are stopped."""
+        if hasattr(self, "_executor"):
+            self.close()
+
+    def close(self) -> None:
+        """Stop the worker threads of concurrent batch operations (if running).
+
+        They're started again on the next batch operation.
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def _run_tasks(self, tasks: List[Callable[[], _T]]) -> List[_T]:
+        """Run per sub-region tasks, concurrently if enabled.
+
+        The first task is run by the calling thread. All the tasks are
+        finished before an exception of any of them is raised.
+
+        Arguments:
+            tasks -- tasks to run.
+
+        Returns:
+            Results of the tasks in order of `tasks`.
+        """
+        if self._max_workers == 1 or len(tasks) < 2:
+            return [task() for task in tasks]
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self._max_workers - 1, thread_name_prefix="multiregion"
+                )
+            futures = [self._executor.submit(task) for task in tasks[1:]]
+        try:
+            first = tasks[0]()
+        finally:
+            wait(futures)
+        return [first] + [future.result() for future in futures]
+
+    def region_metrics(self) -> Dict[range, AccessStats]:
+        """Get access metrics aggregated per sub-region.
+
+        Requires `metrics_enabled` to be set on the multi-region register
+        interface.
+
+        Returns:
+            Statistics of each sub-region keyed by its address bounds.
+
+        Raises:
+            RuntimeError: metrics collection is not enabled.
+        """
+        if self.metrics is None:
+            raise RuntimeError("Metrics collection is not enabled.")
+        return {bounds: self.metrics.summary(bounds) for bounds in self._bounds}
+
+    def register_volatility(self, reg_address: int, volatile: bool) -> None:
+        """Pass the register volatility to the sub-region containing the register.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            volatile -- True if the register value can change on its own.
+        """
+        try:
+            region = self._region_index(reg_address)
+        except ValueError:
+            return
+        self._regifs[region].register_volatility(reg_address, volatile)
+
+    def _region_index(self, reg_address: int) -> int:
+        """Find index of the sub-region containing the address.
+
+        The sub-region of the previous lookup is checked first, as accesses
+        tend to stay in one sub-region.
+
+        Raises:
+            ValueError: the address isn't assigned to any sub-region.
+        """
+        region = self._last_hit
+        if self._starts[region] <= reg_address < self._stops[region]:
+            return region
+        region = bisect_right(self._starts, reg_address) - 1
+        if region < 0 or reg_address >= self._stops[region]:
+            raise ValueError(
+                f"The address {reg_address} isn't assigned to any sub-region."
+            )
+        self._last_hit = region
+        return region
 
     def _address_to_region(self, reg_address: int) -> RegisterInterface:
-        for bounds, regif in self._regions:
-            if bounds.start <= reg_address < bounds.stop:
-                return regif
-        raise ValueError(f"The address {reg_address} isn't assigned to any sub-region.")
+        return self._regifs[self._region_index(reg_address)]
+
+    def _partition(
+        self, reg_addresses: Sequence[int]
+    ) -> Dict[int, Tuple[List[int], List[int]]]:
+        """Split addresses into batches of the sub-regions.
+
+        The sub-region is looked up only for the first address of each run of
+        addresses falling into the same sub-region.
+
+        Arguments:
+            reg_addresses -- absolute register addresses.
+
+        Returns:
+            Positions in `reg_addresses` and addresses keyed by sub-region
+            index, in order of `reg_addresses`.
+
+        Raises:
+            ValueError: an address isn't assigned to any sub-region.
+        """
+        batches: Dict[int, Tuple[List[int], List[int]]] = {}
+        count = len(reg_addresses)
+        position = 0
+        while position < count:
+            region = self._region_index(reg_addresses[position])
+            start, stop = self._starts[region], self._stops[region]
+            positions, addresses = batches.setdefault(region, ([], []))
+            while position < count and start <= reg_addresses[position] < stop:
+                positions.append(position)
+                addresses.append(reg_addresses[position])
+                position += 1
+        return batches
 
     def _get(self, reg_address: int) -> int:
         """Get value from register.
@@ -88,7 +257,7 @@ class MultiRegionRegIf(RegisterInterface):
         Returns:
             Register value.
         """
-        return self._address_to_region(reg_address).get(reg_address)
+        return self._regifs[self._region_index(reg_address)]._get(reg_address)
 
     def _set(self, reg_address: int, value: int):
         """Set register value.
@@ -97,4 +266,145 @@ class MultiRegionRegIf(RegisterInterface):
             reg_address -- absolute register address.
             value -- value to write to the register.
         """
-        self._address_to_region(reg_address).set(reg_address, value)
+        self._regifs[self._region_index(reg_address)]._set(reg_address, value)
+
+    def _modify(self, reg_address: int, mask: int, value: int) -> int:
+        """Read-modify-write register using the sub-region implementation.
+
+        Atomicity of the sub-region read-modify-write operations applies.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            mask -- mask of the register bits to modify.
+            value -- new value of the masked bits (already shifted).
+
+        Returns:
+            New register value.
+        """
+        return self._regifs[self._region_index(reg_address)]._atomic_modify(
+            reg_address, mask, value
+        )
+
+    def _wait_for(  # pylint: disable=too-many-arguments
+        self, reg_address: int, mask: int, value: int, timeout: float, interval: float
+    ) -> int:
+        """Wait for register value using the sub-region polling implementation.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            mask -- mask of the register bits to compare.
+            value -- expected value of the masked bits (already shifted).
+            timeout -- maximum time to wait in seconds.
+            interval -- maximum polling interval in seconds.
+
+        Returns:
+            Last read register value (not matching if the timeout occurred).
+        """
+        return self._regifs[self._region_index(reg_address)]._wait_for(
+            reg_address, mask, value, timeout, interval
+        )
+
+    def _get_many(self, reg_addresses: Sequence[int]) -> List[int]:
+        """Get values from multiple registers with one batch per sub-region.
+
+        Arguments:
+            reg_addresses -- absolute register addresses.
+
+        Returns:
+            Register values in order of `reg_addresses`.
+        """
+        batches = self._partition(reg_addresses)
+        if len(batches) == 1:
+            region, (_, addresses) = batches.popitem()
+            return self._regifs[region]._get_many(addresses)
+        results = self._run_tasks(
+            [
+                partial(self._regifs[region]._get_many, addresses)
+                for region, (_, addresses) in batches.items()
+            ]
+        )
+        ret = [0] * len(reg_addresses)
+        for (positions, _), values in zip(batches.values(), results):
+            for position, value in zip(positions, values):
+                ret[position] = value
+        return ret
+
+    def _set_many(self, reg_addresses: Sequence[int], values: Sequence[int]):
+        """Set values of multiple registers with one batch per sub-region.
+
+        Writes are ordered within each sub-region, but not between them.
+
+        Arguments:
+            reg_addresses -- absolute register addresses.
+            values -- values to write to the registers.
+        """
+        self._run_tasks(
+            [
+                partial(
+                    self._regifs[region]._set_many,
+                    addresses,
+                    [values[position] for position in positions],
+                )
+                for region, (positions, addresses) in self._partition(
+                    reg_addresses
+                ).items()
+            ]
+        )
+
+    def _block_parts(self, start: int, count: int) -> List[Tuple[int, int, int]]:
+        """Split a block of consecutive registers at sub-region bounds.
+
+        Returns:
+            (sub-region index, start address, register count) of each part.
+
+        Raises:
+            ValueError: a register isn't assigned to any sub-region.
+        """
+        parts: List[Tuple[int, int, int]] = []
+        while count > 0:
+            region = self._region_index(start)
+            part = min(count, -(-(self._stops[region] - start) // self._data_bytes))
+            parts.append((region, start, part))
+            start += part * self._data_bytes
+            count -= part
+        return parts
+
+    def _read_block(self, start: int, count: int) -> List[int]:
+        """Read consecutive registers with one block per sub-region.
+
+        Arguments:
+            start -- absolute address of the first register.
+            count -- number of registers to read.
+
+        Returns:
+            Register values in order of increasing address.
+        """
+        ret: List[int] = []
+        for values in self._run_tasks(
+            [
+                partial(self._regifs[region]._read_block, part_start, part_count)
+                for region, part_start, part_count in self._block_parts(start, count)
+            ]
+        ):
+            ret.extend(values)
+        return ret
+
+    def _write_block(self, start: int, values: Sequence[int]) -> None:
+        """Write consecutive registers with one block per sub-region.
+
+        Arguments:
+            start -- absolute address of the first register.
+            values -- values to write in order of increasing address.
+        """
+        tasks: List[Callable[[], None]] = []
+        offset = 0
+        for region, part_start, part_count in self._block_parts(start, len(values)):
+            tasks.append(
+                partial(
+                    self._regifs[region]._write_block,
+                    part_start,
+                    values[offset : offset + part_count],
+                )
+            )
+            offset += part_count
+        self._run_tasks(tasks)
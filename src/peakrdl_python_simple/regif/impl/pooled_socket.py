@@ -0,0 +1,425 @@
+"""Socket register interface client with a pool of connections."""
+
+__authors__ = ["Marek Pikuła <marek.pikula at embevity.com>"]
+
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from ..regif import LOGURU_ACTIVE, RegisterInterface, WaitTimeoutError
+from ..sequence import RegSequence, SequenceOperation
+from .socket import SocketRegIfClient, SocketRegIfPacket, SocketRegIfSubscription
+from .socket_transport import SocketAddress
+
+if LOGURU_ACTIVE:
+    from loguru import logger
+
+
+class _ThreadConnection:  # pylint: disable=too-few-public-methods
+    """Connection held by a thread, returned to the pool when the thread ends."""
+
+    __slots__ = ("client", "__weakref__")
+
+    def __init__(self, client: SocketRegIfClient):
+        """Hold the client."""
+        self.client = client
+
+
+class PooledSocketRegIfClient(  # pylint: disable=too-many-instance-attributes
+    RegisterInterface
+):
+    """Socket register interface client using a pool of connections.
+
+    A single `SocketRegIfClient` executes blocking calls of all threads over
+    one connection. This client opens up to `max_connections` connections
+    lazily, so blocking calls of many threads are executed in parallel (given
+    the server serves clients concurrently).
+
+    A connection is checked out of the pool for every call, or for the whole
+    lifetime of a thread if `per_thread` is set. Each subscription holds its
+    own connection until it's closed. Connections idle for longer
+    than `idle_check_interval` are pinged before use and closed connections
+    are replaced with new ones transparently. A call failing due to a broken
+    connection is not retried, as it could have been already executed.
+
+    In the per-thread mode, a connection is returned to the pool only when its
+    thread ends, so no more than `max_connections` long-lived threads (e.g.,
+    of a thread pool) can use the client. Calls of further threads fail with
+    RuntimeError after waiting for `PER_THREAD_CHECKOUT_TIMEOUT` (unless
+    `checkout_timeout` is set).
+    """
+
+    PER_THREAD_CHECKOUT_TIMEOUT: float = 10.0
+    """Default time (in seconds) to wait for a free connection in per-thread mode."""
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        socket_tuple: SocketAddress,
+        data_width: int,
+        address_bounds: Optional[range] = None,
+        trace: bool = False,
+        max_connections: int = 4,
+        per_thread: bool = False,
+        idle_check_interval: float = 10.0,
+        allow_pickle: bool = False,
+        checkout_timeout: Optional[float] = None,
+    ):
+        """Initialize the pool without opening any connection.
+
+        Arguments:
+            socket_tuple -- server address: (host, port) pair, Unix domain
+                socket path or shared memory prefixed socket path.
+            data_width -- width of data in bits, should be divisible by 8.
+
+        Keyword Arguments:
+            address_bounds -- address range, which is allowed by this register
+                interface. If not defined, addresses are not validated if they
+                are in range.
+            trace -- activate operation tracing (uses `loguru.trace()` under the hood).
+            max_connections -- maximum number of open connections. Callers wait
+                for a free connection if all are in use.
+            per_thread -- assign a connection to a thread until the thread ends
+                instead of checking it out for each call.
+            idle_check_interval -- ping connections idle for longer than this
+                number of seconds before use.
+            allow_pickle -- fall back to pickle for servers not supporting the
+                binary wire format.
+            checkout_timeout -- maximum time in seconds to wait for a free
+                connection. If None, callers wait indefinitely, except in the
+                per-thread mode, which uses `PER_THREAD_CHECKOUT_TIMEOUT`.
+        """
+        super().__init__(data_width, address_bounds, trace)
+        self._socket_tuple = socket_tuple
+        self._max_connections = max_connections
+        self._per_thread = per_thread
+        self._idle_check_interval = idle_check_interval
+        self._allow_pickle = allow_pickle
+        self._checkout_timeout = checkout_timeout
+        if per_thread and checkout_timeout is None:
+            self._checkout_timeout = self.PER_THREAD_CHECKOUT_TIMEOUT
+
+        self._idle: List[Tuple[SocketRegIfClient, float]] = []
+        self._in_use: Set[SocketRegIfClient] = set()
+        self._retired: Set[SocketRegIfClient] = set()
+        self._held: "weakref.WeakSet[_ThreadConnection]" = weakref.WeakSet()
+        self._open = 0
+        self._condition = threading.Condition()
+        self._local = threading.local()
+
+    @property
+    def connection_count(self) -> int:
+        """Get number of open connections (both idle and in use)."""
+        return self._open
+
+    def close(self) -> None:
+        """Close idle connections and connections held by threads.
+
+        Connections in use by calls and subscriptions are closed when returned
+        to the pool. New connections are opened on the next access.
+        """
+        with self._condition:
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+            self._retired |= self._in_use
+            held = [held.client for held in self._held]
+            self._condition.notify_all()
+        for client, _ in idle:
+            client.close()
+        for client in held:
+            client.close()
+
+    def _connect(self) -> SocketRegIfClient:
+        """Open a new connection."""
+        client = SocketRegIfClient(
+            self._socket_tuple,
+            self.data_width,
+            allow_pickle=self._allow_pickle,
+        )
+        if LOGURU_ACTIVE:
+            logger.debug(
+                "Opened pooled connection {count}/{limit}.",
+                count=self._open,
+                limit=self._max_connections,
+            )
+        return client
+
+    def _checkout(self) -> SocketRegIfClient:
+        """Take a healthy connection from the pool, opening one if needed.
+
+        Raises:
+            RuntimeError: no connection became free within the checkout timeout.
+        """
+        deadline = (
+            time.monotonic() + self._checkout_timeout
+            if self._checkout_timeout is not None
+            else None
+        )
+        with self._condition:
+            while len(self._idle) == 0 and self._open >= self._max_connections:
+                remaining = (
+                    deadline - time.monotonic() if deadline is not None else None
+                )
+                if remaining is not None and remaining <= 0:
+                    raise RuntimeError(
+                        f"No pooled connection became free within "
+                        f"{self._checkout_timeout} s."
+                        + (
+                            " Connections are held by threads until they end, so "
+                            "at most max_connections threads can use the client."
+                            if self._per_thread
+                            else ""
+                        )
+                    )
+                self._condition.wait(remaining)
+            if len(self._idle) > 0:
+                # The most recently used connection is the most likely alive.
+                client, last_used = self._idle.pop()
+            else:
+                client, last_used = None, 0.0
+                self._open += 1
+
+        try:
+            if client is not None and (
+                not client.connected
+                or (
+                    time.monotonic() - last_used > self._idle_check_interval
+                    and not client.ping(self._idle_check_interval)
+                )
+            ):
+                if LOGURU_ACTIVE:
+                    logger.debug("Replacing broken pooled connection.")
+                client.close()
+                client = None
+            if client is None:
+                client = self._connect()
+        except Exception:
+            with self._condition:
+                self._open -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._in_use.add(client)
+        return client
+
+    def _checkin(self, client: SocketRegIfClient) -> None:
+        """Return the connection to the pool.
+
+        It's dropped if it's closed or the pool was closed while in use.
+        """
+        with self._condition:
+            self._in_use.discard(client)
+            retired = client in self._retired
+            self._retired.discard(client)
+            if client.connected and not retired:
+                self._idle.append((client, time.monotonic()))
+            else:
+                self._open -= 1
+            self._condition.notify()
+        if retired:
+            client.close()
+
+    @contextmanager
+    def _connection(self) -> Iterator[SocketRegIfClient]:
+        """Get a connection for a call."""
+        if not self._per_thread:
+            client = self._checkout()
+            try:
+                yield client
+            finally:
+                self._checkin(client)
+            return
+
+        held: Optional[_ThreadConnection] = getattr(self._local, "held", None)
+        if held is None or not held.client.connected:
+            held = _ThreadConnection(self._checkout())
+            weakref.finalize(held, self._checkin, held.client)
+            with self._condition:
+                self._held.add(held)
+            self._local.held = held
+        yield held.client
+
+    def _get(self, reg_address: int) -> int:
+        """Read register value over a pooled connection.
+
+        Arguments:
+            reg_address -- absolute address of register to read.
+
+        Returns:
+            Data from the register.
+        """
+        with self._connection() as client:
+            return client.get(reg_address)
+
+    def _set(self, reg_address: int, value: int) -> None:
+        """Write register over a pooled connection.
+
+        Arguments:
+            reg_address -- absolute address of register to write to.
+            value -- value to write to the register.
+        """
+        with self._connection() as client:
+            client.set(reg_address, value)
+
+    def _modify(self, reg_address: int, mask: int, value: int) -> int:
+        """Read-modify-write register on the server side.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            mask -- mask of the register bits to modify.
+            value -- new value of the masked bits (already shifted).
+
+        Returns:
+            New register value.
+        """
+        with self._connection() as client:
+            return client.modify(reg_address, mask, value)
+
+    def _wait_for(  # pylint: disable=too-many-arguments
+        self, reg_address: int, mask: int, value: int, timeout: float, interval: float
+    ) -> int:
+        """Poll register on the server side.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            mask -- mask of the register bits to compare.
+            value -- expected value of the masked bits (already shifted).
+            timeout -- maximum time to wait in seconds.
+            interval -- maximum polling interval in seconds.
+
+        Returns:
+            Last read register value (not matching if the timeout occurred).
+        """
+        with self._connection() as client:
+            try:
+                return client.wait_for(reg_address, mask, value, timeout, interval)
+            except WaitTimeoutError as exc:
+                return exc.value
+
+    def _get_many(self, reg_addresses: Sequence[int]) -> List[int]:
+        """Read multiple registers over a pooled connection.
+
+        Arguments:
+            reg_addresses -- absolute addresses of registers to read.
+
+        Returns:
+            Data from the registers.
+        """
+        with self._connection() as client:
+            return client.get_many(reg_addresses)
+
+    def _set_many(self, reg_addresses: Sequence[int], values: Sequence[int]) -> None:
+        """Write multiple registers over a pooled connection.
+
+        Arguments:
+            reg_addresses -- absolute addresses of registers to write to.
+            values -- values to write to the registers.
+        """
+        with self._connection() as client:
+            client.set_many(zip(reg_addresses, values))
+
+    def batch(
+        self,
+        operations: Iterable[SocketRegIfPacket.BatchOp],
+        continue_on_error: bool = False,
+    ) -> List[SocketRegIfPacket.BatchResult]:
+        """Execute a sequence of mixed operations over a pooled connection.
+
+        See `SocketRegIfClient.batch()`.
+
+        Arguments:
+            operations -- GET, SET and MODIFY operations to execute.
+
+        Keyword Arguments:
+            continue_on_error -- execute all the operations even if some of them
+                fail.
+
+        Returns:
+            Results of the executed operations in order of `operations`.
+
+        Raises:
+            ValueError: invalid operation arguments.
+            RuntimeError: called inside a transaction or the batch as a whole
+                failed.
+        """
+        if self._transaction is not None:
+            raise RuntimeError("Batch access is not supported in transactions.")
+        operations = list(operations)
+        for batch_op in operations:
+            self._sanitize_field_args(batch_op.reg_address)
+        with self._connection() as client:
+            return client.batch(operations, continue_on_error)
+
+    def run_sequence(self, sequence: RegSequence) -> Dict[str, int]:
+        """Execute a register access sequence over a pooled connection.
+
+        See `SocketRegIfClient.run_sequence()`.
+
+        Arguments:
+            sequence -- sequence to execute.
+
+        Returns:
+            Captured values.
+
+        Raises:
+            ValueError: invalid step arguments.
+            RuntimeError: called inside a transaction or the sequence failed.
+        """
+        if self._transaction is not None:
+            raise RuntimeError("Sequences are not supported in transactions.")
+        for step in sequence.steps:
+            if step.operation != SequenceOperation.DELAY:
+                self._sanitize_field_args(step.reg_address)
+        with self._connection() as client:
+            return client.run_sequence(sequence)
+
+    def subscribe(
+        self,
+        reg_addresses: Iterable[int],
+        period: float = 0.1,
+        callback: Optional[Callable[[SocketRegIfPacket.Change], None]] = None,
+    ) -> SocketRegIfSubscription:
+        """Subscribe to changes of register values over a pooled connection.
+
+        See `SocketRegIfClient.subscribe()`. The subscription holds its own
+        connection, which is returned to the pool when the subscription ends,
+        so callbacks can use this register interface without waiting for it.
+
+        Arguments:
+            reg_addresses -- absolute addresses of registers to watch.
+
+        Keyword Arguments:
+            period -- sampling period in seconds.
+            callback -- function called with every change.
+
+        Returns:
+            Open subscription with the current register values.
+
+        Raises:
+            ValueError: invalid addresses or period.
+            RuntimeError: called inside a transaction or the subscription failed.
+        """
+        if self._transaction is not None:
+            raise RuntimeError("Subscriptions are not supported in transactions.")
+        reg_addresses = list(reg_addresses)
+        self._sanitize_bulk_args(reg_addresses)
+        client = self._checkout()
+        try:
+            subscription = client.subscribe(reg_addresses, period, callback)
+        except Exception:
+            self._checkin(client)
+            raise
+        # pylint: disable-next=protected-access
+        subscription._on_end(lambda: self._checkin(client))
+        return subscription
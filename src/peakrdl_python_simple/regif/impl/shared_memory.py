@@ -0,0 +1,304 @@
+"""Shared memory ring buffers for local transport of the socket protocol."""
+
+__authors__ = ["Marek Pikuła <marek.pikula at embevity.com>"]
+
+import mmap
+import os
+import platform
+import struct
+from typing import List, Sequence, Tuple, Union
+
+_TSO_MACHINES = ("x86_64", "amd64", "i386", "i686")
+"""Machines with total store ordering, on which `SharedRing` is correct."""
+
+try:
+    from os import (  # pylint: disable=no-name-in-module
+        EFD_CLOEXEC,
+        EFD_NONBLOCK,
+        MFD_CLOEXEC,
+        eventfd,
+        eventfd_read,
+        eventfd_write,
+        memfd_create,
+    )
+
+    SHARED_MEMORY_ENABLED = platform.machine().lower() in _TSO_MACHINES
+except ImportError:
+    SHARED_MEMORY_ENABLED = False  # type: ignore
+
+_POSITIONS = struct.Struct("=QQ")
+"""Ring write (head) and read (tail) positions (total numbers of bytes)."""
+
+_VALUE = struct.Struct("=Q")
+"""Single field of the ring header."""
+
+_TAIL_OFFSET = 8
+_WAITING_OFFSET = 16
+_RING_HEADER_SIZE = 64
+"""Ring header: head, tail and producer waiting for space flag."""
+
+
+class SharedRing:
+    """Single-producer single-consumer byte ring in shared memory.
+
+    The header holds the total numbers of written (head) and read (tail)
+    bytes. Each of them is updated only by one side, so no lock is needed.
+    The producer sets the waiting flag when the ring is full, so the consumer
+    knows it should signal freeing of space.
+
+    Positions are published with plain stores, as Python has no memory
+    fences. The other side must see the data before the new position, which
+    holds only on machines with total store ordering (x86). Elsewhere
+    `SHARED_MEMORY_ENABLED` is False.
+    """
+
+    def __init__(self, memory: mmap.mmap, offset: int, capacity: int):
+        """Use part of the memory as a ring of the given data capacity.
+
+        Arguments:
+            memory -- shared memory.
+            offset -- offset of the ring in the memory.
+            capacity -- number of data bytes.
+        """
+        self.capacity = capacity
+        """Number of data bytes the ring can hold."""
+
+        self._memory = memory
+        self._offset = offset
+        self._data = offset + _RING_HEADER_SIZE
+
+    @staticmethod
+    def size(capacity: int) -> int:
+        """Get size of memory needed for a ring of the given capacity."""
+        return _RING_HEADER_SIZE + capacity
+
+    @property
+    def producer_waiting(self) -> bool:
+        """Check whether the producer waits for space."""
+        return _VALUE.unpack_from(self._memory, self._offset + _WAITING_OFFSET)[0] != 0
+
+    @producer_waiting.setter
+    def producer_waiting(self, waiting: bool) -> None:
+        """Set whether the producer waits for space (by the producer)."""
+        _VALUE.pack_into(self._memory, self._offset + _WAITING_OFFSET, int(waiting))
+
+    def _positions(self) -> Tuple[int, int]:
+        """Get head and tail positions.
+
+        The positions are written by both processes, so they're validated
+        before use.
+
+        Raises:
+            OSError: the positions are inconsistent (corrupted by the peer).
+        """
+        head, tail = _POSITIONS.unpack_from(self._memory, self._offset)
+        if not 0 <= head - tail <= self.capacity:
+            raise OSError(f"Shared ring positions are corrupted ({head}, {tail}).")
+        return head, tail
+
+    def write(self, data: Union[bytes, bytearray, memoryview]) -> int:
+        """Write as much of the data as fits without waiting.
+
+        Arguments:
+            data -- data to write.
+
+        Returns:
+            Number of written bytes.
+
+        Raises:
+            OSError: the ring positions are corrupted.
+        """
+        memory = self._memory
+        head, tail = self._positions()
+        count = min(len(data), self.capacity - (head - tail))
+        if count == 0:
+            return 0
+        start = self._data + head % self.capacity
+        first = min(count, self._data + self.capacity - start)
+        if first == len(data):
+            memory[start : start + first] = data
+        else:
+            data = memoryview(data)
+            memory[start : start + first] = data[:first]
+            memory[self._data : self._data + count - first] = data[first:count]
+        _VALUE.pack_into(memory, self._offset, head + count)
+        return count
+
+    def read(self) -> bytes:
+        """Read all the available data without waiting.
+
+        Raises:
+            OSError: the ring positions are corrupted.
+        """
+        memory = self._memory
+        head, tail = self._positions()
+        count = head - tail
+        if count == 0:
+            return b""
+        start = self._data + tail % self.capacity
+        first = min(count, self._data + self.capacity - start)
+        ret = memory[start : start + first]
+        if first < count:
+            ret += memory[self._data : self._data + count - first]
+        _VALUE.pack_into(memory, self._offset + _TAIL_OFFSET, tail + count)
+        return ret
+
+
+class SharedMemoryChannel:  # pylint: disable=too-many-instance-attributes
+    """Byte stream between a server and a local client over shared memory.
+
+    A memory file holds a request ring and a response ring. Sides signal each
+    other with eventfd counters, which can be waited for with `select()`:
+
+    - server event -- requests were written or responses were read,
+    - client data event -- responses were written,
+    - client space event -- requests were read.
+
+    Freeing of space is signalled only to a producer waiting for it (see
+    `wait_for_space()`). The waiting flag can be missed due to memory
+    ordering, so such a producer should retry writing periodically.
+
+    The server creates the channel with `create()` and passes `fds` to the
+    client (e.g., with `socket.send_fds()`), which opens it with `attach()`.
+    The client doesn't need any access rights to the server's files.
+    """
+
+    def __init__(self, fds: Sequence[int], capacity: int, server: bool):
+        """Map the channel memory.
+
+        Use `create()` or `attach()` instead.
+
+        Arguments:
+            fds -- memory file, server event, client data event and client
+                space event descriptors. The channel takes ownership of them.
+            capacity -- capacity of each ring in bytes.
+            server -- use the server side of the channel.
+
+        Raises:
+            ValueError: wrong number of descriptors.
+        """
+        if len(fds) != 4:
+            raise ValueError(f"Expected 4 channel descriptors, got {len(fds)}.")
+        self.fds: List[int] = list(fds)
+        """Memory file, server event, client data event and client space
+        event descriptors."""
+
+        memory_fd, server_event, client_data, client_space = self.fds
+        self._mmap = mmap.mmap(memory_fd, 2 * SharedRing.size(capacity))
+        requests = SharedRing(self._mmap, 0, capacity)
+        responses = SharedRing(self._mmap, SharedRing.size(capacity), capacity)
+        if server:
+            self._incoming, self._outgoing = requests, responses
+            self.data_fd = self.space_fd = server_event
+            self._peer_data_fd, self._peer_space_fd = client_data, client_space
+        else:
+            self._incoming, self._outgoing = responses, requests
+            self.data_fd, self.space_fd = client_data, client_space
+            self._peer_data_fd = self._peer_space_fd = server_event
+        self.closed = False
+        """The channel is closed."""
+
+    @classmethod
+    def create(cls, capacity: int) -> "SharedMemoryChannel":
+        """Create server side of a new channel.
+
+        Arguments:
+            capacity -- capacity of each ring in bytes.
+
+        Returns:
+            The channel.
+
+        Raises:
+            OSError: creating the memory file or events failed.
+        """
+        fds = [memfd_create("regif-channel", MFD_CLOEXEC)]
+        try:
+            os.ftruncate(fds[0], 2 * SharedRing.size(capacity))
+            for _ in range(3):
+                fds.append(eventfd(0, EFD_NONBLOCK | EFD_CLOEXEC))
+            return cls(fds, capacity, True)
+        except Exception:
+            for fd in fds:
+                os.close(fd)
+            raise
+
+    @classmethod
+    def attach(cls, fds: Sequence[int], capacity: int) -> "SharedMemoryChannel":
+        """Open client side of a channel created by the server.
+
+        Arguments:
+            fds -- descriptors received from the server.
+            capacity -- capacity of each ring in bytes.
+
+        Returns:
+            The channel.
+        """
+        try:
+            return cls(fds, capacity, False)
+        except Exception:
+            for fd in fds:
+                os.close(fd)
+            raise
+
+    def fileno(self) -> int:
+        """Get descriptor signalled when incoming data is available (for `select()`)."""
+        return self.data_fd
+
+    def send(self, data: Union[bytes, bytearray, memoryview]) -> int:
+        """Write as much of the data as fits without waiting and signal the peer.
+
+        Arguments:
+            data -- data to send.
+
+        Returns:
+            Number of sent bytes.
+
+        Raises:
+            OSError: the channel is closed or corrupted.
+        """
+        if self.closed:
+            raise OSError("Shared memory channel is closed.")
+        count = self._outgoing.write(data)
+        if count > 0:
+            eventfd_write(self._peer_data_fd, 1)
+        return count
+
+    def receive(self) -> bytes:
+        """Read all the available data without waiting.
+
+        The peer is signalled if it waits for space.
+
+        Raises:
+            OSError: the channel is closed or corrupted.
+        """
+        if self.closed:
+            raise OSError("Shared memory channel is closed.")
+        data = self._incoming.read()
+        if data and self._incoming.producer_waiting:
+            eventfd_write(self._peer_space_fd, 1)
+        return data
+
+    def wait_for_space(self, waiting: bool) -> None:
+        """Request (or stop requesting) signalling of freed space by the peer.
+
+        Should be set before the last write attempt preceding a wait for
+        `space_fd`.
+        """
+        self._outgoing.producer_waiting = waiting
+
+    @staticmethod
+    def clear(fd: int) -> None:
+        """Reset the event counter, so it can be waited for again."""
+        try:
+            eventfd_read(fd)
+        except BlockingIOError:
+            pass
+
+    def close(self) -> None:
+        """Unmap the memory and close the descriptors."""
+        if self.closed:
+            return
+        self.closed = True
+        self._mmap.close()
+        for fd in self.fds:
+            os.close(fd)
@@ -1,13 +1,40 @@
 """Register interface using custom socket protocol over a remote connection."""
 
+# pylint: disable=too-many-lines
+
 __authors__ = ["Marek Pikuła <marek.pikula at embevity.com>"]
 
+import math
+import os
+import pickle
+import selectors
+import socket
+import struct
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import ExitStack, contextmanager
 from dataclasses import dataclass
 from enum import Enum
-from multiprocessing.connection import Client, Listener
-from pickle import PickleError
-from threading import Lock
-from typing import Any, Optional, Tuple
+from multiprocessing.connection import Connection
+from queue import SimpleQueue
+from threading import Condition, Event, Lock, Thread, current_thread
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 try:
     from loguru import logger
@@ -16,17 +43,43 @@ try:
 except ImportError:
     LOGURU_ENABLED = False  # type: ignore
 
-from ..regif import RegisterInterface
+from ..regif import RegisterInterface, WaitTimeoutError
+from ..sequence import RegSequence, SequenceOperation, SequenceStep
+from .shared_memory import SHARED_MEMORY_ENABLED, SharedMemoryChannel
+from .socket_transport import (
+    _CHANNEL_MAGIC,
+    _CHANNEL_RETRY_INTERVAL,
+    SocketAddress,
+    _address_str,
+    _connect,
+    _frame,
+    _frame_size,
+    _listen,
+    _offer_channel,
+    _SharedMemoryConnection,
+)
 
-PROTOCOL_VERSION: int = 1
+PROTOCOL_VERSION: int = 8
 """Current version of the SocketRegIf protocol.
 
-Used to ensure compatibility between client and server.
+Used to ensure compatibility between client and server. Since version 5 the
+client negotiates the version at connect time and the server accepts requests
+of all older versions.
+
+Version history:
+    1 -- single register GET and SET operations.
+    2 -- GET_MANY and SET_MANY bulk operations.
+    3 -- MODIFY atomic read-modify-write operation.
+    4 -- WAIT_FOR server-side register polling.
+    5 -- BATCH operation and version negotiation.
+    6 -- binary wire format.
+    7 -- SEQUENCE server-side sequence execution.
+    8 -- SUBSCRIBE and UNSUBSCRIBE register change subscriptions.
 """
 
 
 @dataclass
-class SocketRegIfPacket:
+class SocketRegIfPacket:  # pylint: disable=too-many-instance-attributes
     """Socket register interface packet."""
 
     class Operation(Enum):
@@ -34,6 +87,15 @@ class SocketRegIfPacket:
 
         GET = 0
         SET = 1
+        GET_MANY = 2
+        SET_MANY = 3
+        MODIFY = 4
+        WAIT_FOR = 5
+        BATCH = 6
+        SEQUENCE = 7
+        SUBSCRIBE = 8
+        UNSUBSCRIBE = 9
+        NOTIFY = 10
 
     class Status(Enum):
         """Status of the curent packet."""
@@ -42,6 +104,48 @@ class SocketRegIfPacket:
         RESPONSE_OK = 1
         RESPONSE_ERROR = 2
 
+    class BatchOp(NamedTuple):
+        """Single operation of a batch (GET, SET or MODIFY)."""
+
+        operation: "SocketRegIfPacket.Operation"
+        """Operation to be performed."""
+
+        reg_address: int
+        """Register address to be accessed."""
+
+        value: Optional[int] = None
+        """Register value for the set and modify operations."""
+
+        mask: Optional[int] = None
+        """Mask of register bits to be modified by the modify operation."""
+
+    class BatchResult(NamedTuple):
+        """Result of a single operation of a batch."""
+
+        status: "SocketRegIfPacket.Status"
+        """RESPONSE_OK or RESPONSE_ERROR."""
+
+        value: Optional[int] = None
+        """Register value read by get or written by modify operation."""
+
+        message: Optional[str] = None
+        """Error message."""
+
+    class Change(NamedTuple):
+        """Change of a subscribed register value."""
+
+        reg_address: int
+        """Register address."""
+
+        old: int
+        """Previous register value."""
+
+        new: int
+        """Current register value."""
+
+        timestamp: float
+        """Time of sampling the current value (as in `time.time()`)."""
+
     protocol_version: int
     """Protocol version.
 
@@ -60,212 +164,2547 @@ class SocketRegIfPacket:
     value: Optional[int]
     """Register value for the set operation or return value from get operation."""
 
+    reg_addresses: Optional[List[int]] = None
+    """Register addresses to be accessed by bulk operations."""
 
-class SocketRegIfServer:  # pylint: disable=too-few-public-methods
-    """Socket register interface server.
+    values: Optional[List[int]] = None
+    """Register values for the bulk set operation or return values from bulk get operation."""
+
+    mask: Optional[int] = None
+    """Mask of register bits to be modified or compared by the modify and wait operations."""
+
+    timeout: Optional[float] = None
+    """Timeout of the wait operation in seconds."""
 
-    Supposed to be running on the hardware side.
+    interval: Optional[float] = None
+    """Maximum polling interval of the wait operation in seconds."""
+
+    batch: Optional[List[BatchOp]] = None
+    """Operations of the batch operation."""
+
+    batch_results: Optional[List[BatchResult]] = None
+    """Results of the batch operation in order of `batch`.
+
+    If the batch stopped on an error, the last result is the failed operation.
     """
 
-    def __init__(self, regif: RegisterInterface):
-        """Initialize the socket regif.
+    continue_on_error: bool = False
+    """Execute all the operations of the batch even if some of them fail."""
 
-        Arguments:
-            regif -- register interface with access to be published via the socket.
-        """
-        self._regif = regif
+    sequence: Optional[List[SequenceStep]] = None
+    """Steps of the sequence operation."""
 
-    def serve(self, socket_tuple: Tuple[str, int]):
-        """Start the socket server.
+    captures: Optional[Dict[str, int]] = None
+    """Values captured by the sequence operation."""
 
-        Arguments:
-            socket_tuple -- host, port number pair.
-        """
-        with Listener(socket_tuple) as listener:
-            if LOGURU_ENABLED:
-                logger.info("Listening at {addr[0]}:{addr[1]}.", addr=listener.address)
-            while True:
-                self._accept_connection(listener)
-
-    def _accept_connection(self, listener: Listener):
-        """Accept connection and process requests."""
-        with listener.accept() as connection:
-            assert (
-                listener.last_accepted is not None
-            ), "Something's wrong. We have just accepted a connection."
-            if LOGURU_ENABLED:
-                logger.info(
-                    "Connection accepted from {acc[0]}:{acc[1]}.",
-                    acc=listener.last_accepted,
-                )
-            while not connection.closed:
-                # Process packets until the connection is closed.
-                try:
-                    connection.send(self._process_packet(connection.recv()))
-                except EOFError:
-                    # Raised when connection is closed by the client during `recv()`.
-                    connection.close()
-                    break
-        if LOGURU_ENABLED:
-            logger.info("Connection closed.")
+    changes: Optional[List[Change]] = None
+    """Register changes pushed by the server with the notify operation.
 
-    def _process_packet(self, data: SocketRegIfPacket) -> SocketRegIfPacket:
-        """Process a packet and return a response.
+    A subscription is identified by the operation ID of its subscribe request.
+    Notifications carry it as their operation ID and unsubscribe requests in
+    `reg_address`.
+    """
 
-        If any error occurs during the packet processing, the exception string is passed as an
-        response error with the exception message passed as the optional response string.
+    negotiate: bool = False
+    """Version negotiation request.
+
+    It's sent as a GET request, which is known to all protocol versions. The
+    server responds with the highest supported protocol version in `value`
+    without accessing any register. Servers older than version 5 respond with
+    unsupported version error carrying their protocol version.
+    """
+
+    @classmethod
+    def request(
+        cls,
+        protocol_version: int,
+        operation: "SocketRegIfPacket.Operation",
+        operation_id: int,
+        reg_address: int = 0,
+        value: Optional[int] = None,
+        **arguments: Any,
+    ) -> "SocketRegIfPacket":
+        """Build a request packet.
 
         Arguments:
-            data -- request packet.
+            protocol_version -- protocol version of the request.
+            operation -- requested operation.
+            operation_id -- ID of the operation matching it with the response.
+
+        Keyword Arguments:
+            reg_address -- register address to be accessed.
+            value -- register value for the set operation.
+            arguments -- other packet fields (e.g. `mask` or `timeout`).
 
         Returns:
-            Response packet.
+            The request packet.
         """
-        try:
-            if data.protocol_version != PROTOCOL_VERSION:
-                raise RuntimeError(
-                    f"Unsupported protocol version: {data.protocol_version}."
+        return cls(
+            protocol_version,
+            (operation, operation_id),
+            (cls.Status.REQUEST, None),
+            reg_address,
+            value,
+            **arguments,
+        )
+
+
+OPERATION_VERSIONS: Dict[SocketRegIfPacket.Operation, int] = {
+    SocketRegIfPacket.Operation.GET: 1,
+    SocketRegIfPacket.Operation.SET: 1,
+    SocketRegIfPacket.Operation.GET_MANY: 2,
+    SocketRegIfPacket.Operation.SET_MANY: 2,
+    SocketRegIfPacket.Operation.MODIFY: 3,
+    SocketRegIfPacket.Operation.WAIT_FOR: 4,
+    SocketRegIfPacket.Operation.BATCH: 5,
+    SocketRegIfPacket.Operation.SEQUENCE: 7,
+    SocketRegIfPacket.Operation.SUBSCRIBE: 8,
+    SocketRegIfPacket.Operation.UNSUBSCRIBE: 8,
+    SocketRegIfPacket.Operation.NOTIFY: 8,
+}
+"""Protocol version in which the operations were introduced."""
+
+BINARY_PROTOCOL_VERSION: int = 6
+"""First protocol version supporting the binary wire format."""
+
+_BINARY_MAGIC = 0xB5
+"""First byte of binary packets (pickled packets start with 0x80)."""
+
+_BINARY_HEADER = struct.Struct("!BBBBHBQ")
+"""Binary packet header.
+
+Fields: magic, protocol version, operation, status, flags of the present
+optional fields, width of register values in bytes and operation ID. It's
+followed by the register address (`_ADDRESS`) and the optional fields in the
+order of the flags.
+"""
+
+_ADDRESS = struct.Struct("!Q")
+_COUNT = struct.Struct("!I")
+_FLOAT = struct.Struct("!d")
+_BATCH_ITEM = struct.Struct("!BB")
+_MESSAGE_LENGTH = struct.Struct("!H")
+
+_HAS_VALUE = 1 << 0
+_HAS_MASK = 1 << 1
+_HAS_REG_ADDRESSES = 1 << 2
+_HAS_VALUES = 1 << 3
+_HAS_TIMEOUT = 1 << 4
+_HAS_INTERVAL = 1 << 5
+_HAS_BATCH = 1 << 6
+_HAS_BATCH_RESULTS = 1 << 7
+_HAS_MESSAGE = 1 << 8
+_CONTINUE_ON_ERROR = 1 << 9
+_NEGOTIATE = 1 << 10
+_HAS_SEQUENCE = 1 << 11
+_HAS_CAPTURES = 1 << 12
+_HAS_CHANGES = 1 << 13
+"""Flags of the optional fields of packets."""
+
+_ITEM_HAS_VALUE = 1 << 0
+_ITEM_HAS_MASK = 1 << 1
+_ITEM_HAS_MESSAGE = 1 << 2
+_ITEM_HAS_CAPTURE = 1 << 3
+_ITEM_HAS_CONDITION = 1 << 4
+"""Flags of the optional fields of batch operations, results and sequence steps."""
+
+_SEQUENCE_TIMING = struct.Struct("!dd")
+"""Timeout and interval of a sequence step."""
+
+_VALUE_FORMATS = {1: "B", 2: "H", 4: "I", 8: "Q"}
+"""Struct formats of register values of native widths."""
+
+
+def _pack_values(values: Sequence[int], value_bytes: int) -> bytes:
+    """Pack register values as big-endian unsigned integers."""
+    fmt = _VALUE_FORMATS.get(value_bytes)
+    if fmt is not None:
+        return struct.pack(f"!{len(values)}{fmt}", *values)
+    return b"".join(value.to_bytes(value_bytes, "big") for value in values)
+
+
+class _BinaryReader:
+    """Sequential reader of a binary packet."""
+
+    def __init__(self, data: bytes):
+        """Initialize the reader at the beginning of `data`."""
+        self._data = data
+        self._offset = 0
+
+    def unpack(self, fmt: struct.Struct) -> Tuple[Any, ...]:
+        """Read a structure."""
+        ret = fmt.unpack_from(self._data, self._offset)
+        self._offset += fmt.size
+        return ret
+
+    def values(self, count: int, value_bytes: int) -> List[int]:
+        """Read register values."""
+        size = count * value_bytes
+        if self._offset + size > len(self._data):
+            raise ValueError("Binary packet is truncated.")
+        fmt = _VALUE_FORMATS.get(value_bytes)
+        if fmt is not None:
+            ret = list(struct.unpack_from(f"!{count}{fmt}", self._data, self._offset))
+        else:
+            ret = [
+                int.from_bytes(
+                    self._data[offset : offset + value_bytes], "big"  # noqa: E203
                 )
-            if data.status[0] != SocketRegIfPacket.Status.REQUEST:
-                raise RuntimeError(
-                    f"Server can handle only requests. Got {data.status}."
+                for offset in range(self._offset, self._offset + size, value_bytes)
+            ]
+        self._offset += size
+        return ret
+
+    def message(self) -> str:
+        """Read a length-prefixed UTF-8 string."""
+        (length,) = self.unpack(_MESSAGE_LENGTH)
+        if self._offset + length > len(self._data):
+            raise ValueError("Binary packet is truncated.")
+        ret = self._data[self._offset : self._offset + length]  # noqa: E203
+        self._offset += length
+        return ret.decode()
+
+    def step(self, value_bytes: int) -> SequenceStep:
+        """Read a sequence step."""
+        operation, item_flags = self.unpack(_BATCH_ITEM)
+        (reg_address,) = self.unpack(_ADDRESS)
+        value, mask = self.values(2, value_bytes)
+        timeout, interval = self.unpack(_SEQUENCE_TIMING)
+        step = SequenceStep(
+            SequenceOperation(operation), reg_address, value, mask, timeout, interval
+        )
+        if item_flags & _ITEM_HAS_CAPTURE:
+            step = step._replace(capture=self.message())
+        if item_flags & _ITEM_HAS_CONDITION:
+            name = self.message()
+            condition_mask, condition_value = self.values(2, value_bytes)
+            step = step._replace(condition=(name, condition_mask, condition_value))
+        return step
+
+    def change(self, value_bytes: int) -> SocketRegIfPacket.Change:
+        """Read a register change."""
+        (reg_address,) = self.unpack(_ADDRESS)
+        old, new = self.values(2, value_bytes)
+        (timestamp,) = self.unpack(_FLOAT)
+        return SocketRegIfPacket.Change(reg_address, old, new, timestamp)
+
+    def check_end(self) -> None:
+        """Check whether the whole packet has been read."""
+        if self._offset != len(self._data):
+            raise ValueError("Binary packet has trailing data.")
+
+
+def _pack_message(message: str) -> bytes:
+    """Pack a length-prefixed UTF-8 string (truncated if too long)."""
+    data = message.encode()[: (1 << 16) - 1]
+    return _MESSAGE_LENGTH.pack(len(data)) + data
+
+
+def _pack_step(step: SequenceStep, value_bytes: int) -> bytes:
+    """Pack a sequence step."""
+    payload = [
+        _BATCH_ITEM.pack(
+            step.operation.value,
+            (_ITEM_HAS_CAPTURE if step.capture is not None else 0)
+            | (_ITEM_HAS_CONDITION if step.condition is not None else 0),
+        ),
+        _ADDRESS.pack(step.reg_address),
+        _pack_values([step.value, step.mask], value_bytes),
+        _SEQUENCE_TIMING.pack(step.timeout, step.interval),
+    ]
+    if step.capture is not None:
+        payload.append(_pack_message(step.capture))
+    if step.condition is not None:
+        payload.append(_pack_message(step.condition[0]))
+        payload.append(_pack_values(step.condition[1:], value_bytes))
+    return b"".join(payload)
+
+
+def encode_packet(  # pylint: disable=too-many-branches,too-many-statements
+    packet: SocketRegIfPacket, binary: bool = False, value_bytes: int = 8
+) -> bytes:
+    """Serialize a packet.
+
+    Arguments:
+        packet -- packet to serialize.
+
+    Keyword Arguments:
+        binary -- use the binary wire format instead of pickle.
+        value_bytes -- width of register values in bytes (binary format only).
+
+    Returns:
+        Serialized packet.
+    """
+    if not binary:
+        return pickle.dumps(packet, pickle.HIGHEST_PROTOCOL)
+
+    flags = 0
+    payload = [_ADDRESS.pack(packet.reg_address)]
+    if packet.value is not None:
+        flags |= _HAS_VALUE
+        payload.append(packet.value.to_bytes(value_bytes, "big"))
+    if packet.mask is not None:
+        flags |= _HAS_MASK
+        payload.append(packet.mask.to_bytes(value_bytes, "big"))
+    if packet.reg_addresses is not None:
+        flags |= _HAS_REG_ADDRESSES
+        payload.append(_COUNT.pack(len(packet.reg_addresses)))
+        payload.append(
+            struct.pack(f"!{len(packet.reg_addresses)}Q", *packet.reg_addresses)
+        )
+    if packet.values is not None:
+        flags |= _HAS_VALUES
+        payload.append(_COUNT.pack(len(packet.values)))
+        payload.append(_pack_values(packet.values, value_bytes))
+    if packet.timeout is not None:
+        flags |= _HAS_TIMEOUT
+        payload.append(_FLOAT.pack(packet.timeout))
+    if packet.interval is not None:
+        flags |= _HAS_INTERVAL
+        payload.append(_FLOAT.pack(packet.interval))
+    if packet.batch is not None:
+        flags |= _HAS_BATCH
+        payload.append(_COUNT.pack(len(packet.batch)))
+        for batch_op in packet.batch:
+            payload.append(
+                _BATCH_ITEM.pack(
+                    batch_op.operation.value,
+                    (_ITEM_HAS_VALUE if batch_op.value is not None else 0)
+                    | (_ITEM_HAS_MASK if batch_op.mask is not None else 0),
+                )
+            )
+            payload.append(_ADDRESS.pack(batch_op.reg_address))
+            if batch_op.value is not None:
+                payload.append(batch_op.value.to_bytes(value_bytes, "big"))
+            if batch_op.mask is not None:
+                payload.append(batch_op.mask.to_bytes(value_bytes, "big"))
+    if packet.batch_results is not None:
+        flags |= _HAS_BATCH_RESULTS
+        payload.append(_COUNT.pack(len(packet.batch_results)))
+        for result in packet.batch_results:
+            payload.append(
+                _BATCH_ITEM.pack(
+                    result.status.value,
+                    (_ITEM_HAS_VALUE if result.value is not None else 0)
+                    | (_ITEM_HAS_MESSAGE if result.message is not None else 0),
                 )
+            )
+            if result.value is not None:
+                payload.append(result.value.to_bytes(value_bytes, "big"))
+            if result.message is not None:
+                payload.append(_pack_message(result.message))
+    if packet.sequence is not None:
+        flags |= _HAS_SEQUENCE
+        payload.append(_COUNT.pack(len(packet.sequence)))
+        payload.extend(_pack_step(step, value_bytes) for step in packet.sequence)
+    if packet.captures is not None:
+        flags |= _HAS_CAPTURES
+        payload.append(_COUNT.pack(len(packet.captures)))
+        for name, value in packet.captures.items():
+            payload.append(_pack_message(name))
+            payload.append(value.to_bytes(value_bytes, "big"))
+    if packet.changes is not None:
+        flags |= _HAS_CHANGES
+        payload.append(_COUNT.pack(len(packet.changes)))
+        for change in packet.changes:
+            payload.append(_ADDRESS.pack(change.reg_address))
+            payload.append(_pack_values([change.old, change.new], value_bytes))
+            payload.append(_FLOAT.pack(change.timestamp))
+    if packet.status[1] is not None:
+        flags |= _HAS_MESSAGE
+        payload.append(_pack_message(packet.status[1]))
+    if packet.continue_on_error:
+        flags |= _CONTINUE_ON_ERROR
+    if packet.negotiate:
+        flags |= _NEGOTIATE
+
+    header = _BINARY_HEADER.pack(
+        _BINARY_MAGIC,
+        packet.protocol_version,
+        packet.operation[0].value,
+        packet.status[0].value,
+        flags,
+        value_bytes,
+        packet.operation[1],
+    )
+    return header + b"".join(payload)
+
+
+def is_binary_packet(data: bytes) -> bool:
+    """Check whether serialized packet uses the binary wire format."""
+    return len(data) > 0 and data[0] == _BINARY_MAGIC
+
 
-            if data.operation[0] == SocketRegIfPacket.Operation.GET:
-                data.value = self._regif.get(data.reg_address)
-                data.status = (SocketRegIfPacket.Status.RESPONSE_OK, None)
-            elif data.operation[0] == SocketRegIfPacket.Operation.SET:
-                if data.value is None:
-                    raise RuntimeError(
-                        f"SET request for address 0x{data.reg_address:X} failed. No value provided."
+def decode_packet(  # pylint: disable=too-many-locals,too-many-branches
+    data: bytes, allow_pickle: bool = True
+) -> SocketRegIfPacket:
+    """Deserialize a packet of any wire format.
+
+    Arguments:
+        data -- serialized packet.
+
+    Keyword Arguments:
+        allow_pickle -- accept pickled packets. Unpickling of untrusted data
+            can execute arbitrary code.
+
+    Returns:
+        Deserialized packet.
+
+    Raises:
+        ValueError: the packet is malformed or pickled and pickle is not allowed.
+        RuntimeError: the unpickled object is not a packet.
+    """
+    if not is_binary_packet(data):
+        if not allow_pickle:
+            raise ValueError("Pickled packets are not allowed.")
+        packet = pickle.loads(data)
+        if not isinstance(packet, SocketRegIfPacket):
+            raise RuntimeError(
+                "The packet is of an unexpected type. "
+                f"Requested SocketRegIfPacket, got {type(packet)}."
+            )
+        return packet
+
+    try:
+        reader = _BinaryReader(data)
+        (
+            _,
+            protocol_version,
+            operation,
+            status,
+            flags,
+            value_bytes,
+            operation_id,
+        ) = reader.unpack(_BINARY_HEADER)
+        packet = SocketRegIfPacket(
+            protocol_version,
+            (SocketRegIfPacket.Operation(operation), operation_id),
+            (SocketRegIfPacket.Status(status), None),
+            reader.unpack(_ADDRESS)[0],
+            reader.values(1, value_bytes)[0] if flags & _HAS_VALUE else None,
+            continue_on_error=bool(flags & _CONTINUE_ON_ERROR),
+            negotiate=bool(flags & _NEGOTIATE),
+        )
+        if flags & _HAS_MASK:
+            packet.mask = reader.values(1, value_bytes)[0]
+        if flags & _HAS_REG_ADDRESSES:
+            (count,) = reader.unpack(_COUNT)
+            packet.reg_addresses = reader.values(count, _ADDRESS.size)
+        if flags & _HAS_VALUES:
+            (count,) = reader.unpack(_COUNT)
+            packet.values = reader.values(count, value_bytes)
+        if flags & _HAS_TIMEOUT:
+            packet.timeout = reader.unpack(_FLOAT)[0]
+        if flags & _HAS_INTERVAL:
+            packet.interval = reader.unpack(_FLOAT)[0]
+        if flags & _HAS_BATCH:
+            (count,) = reader.unpack(_COUNT)
+            packet.batch = []
+            for _ in range(count):
+                batch_operation, item_flags = reader.unpack(_BATCH_ITEM)
+                packet.batch.append(
+                    SocketRegIfPacket.BatchOp(
+                        SocketRegIfPacket.Operation(batch_operation),
+                        reader.unpack(_ADDRESS)[0],
+                        (
+                            reader.values(1, value_bytes)[0]
+                            if item_flags & _ITEM_HAS_VALUE
+                            else None
+                        ),
+                        (
+                            reader.values(1, value_bytes)[0]
+                            if item_flags & _ITEM_HAS_MASK
+                            else None
+                        ),
                     )
-                self._regif.set(data.reg_address, data.value)
-                data.status = (SocketRegIfPacket.Status.RESPONSE_OK, None)
-            else:
-                raise NotImplementedError(
-                    f'Operation "{data.operation}" not supported.'
                 )
-        except Exception as exc:  # pylint: disable=broad-except
-            # Exception occured either during validation of the packet or during register access.
-            data.protocol_version = PROTOCOL_VERSION
-            data.status = (SocketRegIfPacket.Status.RESPONSE_ERROR, str(exc))
-        return data
+        if flags & _HAS_BATCH_RESULTS:
+            (count,) = reader.unpack(_COUNT)
+            packet.batch_results = []
+            for _ in range(count):
+                result_status, item_flags = reader.unpack(_BATCH_ITEM)
+                packet.batch_results.append(
+                    SocketRegIfPacket.BatchResult(
+                        SocketRegIfPacket.Status(result_status),
+                        (
+                            reader.values(1, value_bytes)[0]
+                            if item_flags & _ITEM_HAS_VALUE
+                            else None
+                        ),
+                        reader.message() if item_flags & _ITEM_HAS_MESSAGE else None,
+                    )
+                )
+        if flags & _HAS_SEQUENCE:
+            (count,) = reader.unpack(_COUNT)
+            packet.sequence = [reader.step(value_bytes) for _ in range(count)]
+        if flags & _HAS_CAPTURES:
+            (count,) = reader.unpack(_COUNT)
+            packet.captures = {}
+            for _ in range(count):
+                name = reader.message()
+                packet.captures[name] = reader.values(1, value_bytes)[0]
+        if flags & _HAS_CHANGES:
+            (count,) = reader.unpack(_COUNT)
+            packet.changes = [reader.change(value_bytes) for _ in range(count)]
+        if flags & _HAS_MESSAGE:
+            packet.status = (packet.status[0], reader.message())
+        reader.check_end()
+    except struct.error as exc:
+        raise ValueError(f"Malformed binary packet: {exc}") from exc
+    return packet
 
 
-class SocketRegIfClient(RegisterInterface):
-    """Socket register interface client.
+class _ServerConnection:  # pylint: disable=too-few-public-methods
+    """Client connection state of `SocketRegIfServer`."""
 
-    Supposed to be running on the controller side.
+    # pylint: disable=too-many-instance-attributes
+
+    __slots__ = (
+        "sock",
+        "peer",
+        "in_buffer",
+        "out_buffer",
+        "requests",
+        "busy",
+        "events",
+        "binary",
+        "channel",
+    )
+
+    def __init__(self, sock: socket.socket, peer: Any):
+        """Initialize idle connection."""
+        self.sock = sock
+        """Non-blocking client socket."""
+
+        self.peer = peer
+        """Client address."""
+
+        self.in_buffer = bytearray()
+        """Received bytes not forming a whole message yet."""
+
+        self.out_buffer = bytearray()
+        """Framed responses waiting to be sent."""
+
+        self.requests: Deque[bytes] = deque()
+        """Received requests waiting for execution."""
+
+        self.busy = False
+        """A request of the connection is being executed."""
+
+        self.events = 0
+        """Selector events the connection is registered for."""
+
+        self.binary = False
+        """The client uses the binary wire format (used for notifications)."""
+
+        self.channel: Optional[SharedMemoryChannel] = None
+        """Shared memory channel replacing the socket for data transfer."""
+
+
+class _SampledSet:  # pylint: disable=too-few-public-methods
+    """Register set sampled for subscribers of `SocketRegIfServer`."""
+
+    __slots__ = ("reg_addresses", "period", "values", "deadline", "subscribers")
+
+    def __init__(self, reg_addresses: Tuple[int, ...], period: float):
+        """Initialize the set without subscribers."""
+        self.reg_addresses = reg_addresses
+        """Sorted unique register addresses."""
+
+        self.period = period
+        """Sampling period in seconds."""
+
+        self.values: Dict[int, int] = {}
+        """Last sampled values."""
+
+        self.deadline = time.monotonic() + period
+        """Time of the next sampling (as in `time.monotonic()`)."""
+
+        self.subscribers: Dict[Tuple[_ServerConnection, int], int] = {}
+        """Protocol versions of subscriptions by (connection, subscription ID)."""
+
+
+class SocketRegIfServer:  # pylint: disable=too-many-instance-attributes
+    """Socket register interface server.
+
+    Supposed to be running on the hardware side. Requests of a connection are
+    processed in order and each response is sent as soon as it's ready, so
+    clients can pipeline requests.
+
+    Each response uses the wire format of its request. Pickled requests of
+    clients older than protocol version 6 are served only if explicitly
+    allowed with `allow_pickle`.
+
+    All the connections are multiplexed by a single I/O thread using
+    `selectors`, while requests are executed by a pool of worker threads. Each
+    connection has at most one request in execution and is requeued after it,
+    so the workers are shared fairly between clients. Requests accessing the
+    same register region are serialized, so read-modify-write operations stay
+    atomic against other clients. WAIT_FOR requests don't hold region locks,
+    so they don't block writers the wait depends on.
+
+    Local clients can connect to a Unix domain socket instead of TCP. Over
+    it, they can also switch to a shared memory channel (see
+    `SharedMemoryChannel`), which avoids the socket stack altogether. The
+    channel descriptors are passed over the socket, so unprivileged clients
+    need only access to the socket file.
+
+    Subscribed register sets are sampled by a sampler thread. Subscriptions of
+    the same registers with the same period are coalesced into a single
+    sampled set, even across clients, and only changed values are pushed to
+    the subscribers.
     """
 
-    def __init__(
+    REGION_LOCK_STRIPES: int = 64
+    """Number of locks used for serializing access to register regions."""
+
+    def __init__(  # pylint: disable=too-many-arguments
         self,
-        socket_tuple: Tuple[str, int],
-        data_width: int,
-        address_bounds: Optional[range] = None,
-        trace: bool = False,
+        regif: RegisterInterface,
+        allow_pickle: bool = False,
+        max_connections: int = 16,
+        workers: int = 4,
+        max_queued_requests: int = 64,
+        region_size: int = 0x1000,
+        channel_capacity: int = 1 << 20,
+        max_wait: float = 10.0,
+        max_sequence_duration: float = 60.0,
     ):
-        """Initialize the socket register interface client.
+        """Initialize the socket regif.
 
         Arguments:
-            socket_tuple -- server socket tuple in form of (address, port).
-            data_width -- width of data in bits, should be divisible by 8.
-            address_bounds -- address range, which is allowed by this register
-                interface. If not defined, addresses are not validated if they
-                are in range.
+            regif -- register interface with access to be published via the socket.
 
         Keyword Arguments:
-            trace -- activate operation tracing (uses `loguru.trace()` under the hood).
+            allow_pickle -- accept pickled requests of clients older than
+                protocol version 6. Unpickling of untrusted data can execute
+                arbitrary code, so it's disabled by default and should be
+                enabled only for trusted legacy clients. Pickled requests are
+                rejected otherwise, which makes current clients switch to the
+                binary wire format.
+            max_connections -- maximum number of connected clients. Further
+                connections are closed right after accepting.
+            workers -- number of threads executing requests.
+            max_queued_requests -- maximum number of requests received from a
+                single connection waiting for execution. Reading from the
+                connection is paused if reached.
+            region_size -- size of register region in bytes, in which
+                requests are serialized.
+            channel_capacity -- capacity of each ring of shared memory
+                channels in bytes.
+            max_wait -- maximum timeout of a wait and duration of a delay
+                requested by a client in seconds. Waits and sequences occupy a
+                worker thread, so longer requests are rejected.
+            max_sequence_duration -- maximum total duration of waits and
+                delays of a sequence in seconds.
         """
-        super().__init__(data_width, address_bounds, trace)
+        self._regif = regif
+        self._allow_pickle = allow_pickle
+        self._max_connections = max_connections
+        self._workers = workers
+        self._max_queued_requests = max_queued_requests
+        self._region_size = region_size
+        self._channel_capacity = channel_capacity
+        self._max_wait = max_wait
+        self._max_sequence_duration = max_sequence_duration
+        self._region_locks = [Lock() for _ in range(self.REGION_LOCK_STRIPES)]
+
+        self._listener: Optional[socket.socket] = None
+        self._unix_path: Optional[str] = None
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._connections: Dict[socket.socket, _ServerConnection] = {}
+        self._completed: Deque[Tuple[_ServerConnection, Optional[bytes]]] = deque()
+        self._wakeup_recv, self._wakeup_send = socket.socketpair()
+        self._wakeup_send.setblocking(False)
+        self._shutdown = Event()
+
+        self._sampled: Dict[Tuple[Tuple[int, ...], float], _SampledSet] = {}
+        self._sampler_condition = Condition()
+        self._pushes: Deque[Tuple[_ServerConnection, bytes]] = deque()
+
+    @property
+    def connection_count(self) -> int:
+        """Get number of connected clients."""
+        return len(self._connections)
+
+    def listen(
+        self, address: SocketAddress, permissions: Optional[int] = None
+    ) -> SocketAddress:
+        """Bind the server socket without serving it yet.
+
+        Arguments:
+            address -- host, port number pair (port 0 selects a free port) or
+                Unix domain socket path (optionally with the shared memory
+                prefix). A stale socket file is replaced.
+
+        Keyword Arguments:
+            permissions -- permission bits of the Unix domain socket file
+                (e.g., 0o666 to let all users connect).
 
-        self._conn = Client(socket_tuple)
+        Returns:
+            Host, port number pair or the socket path the server is listening at.
+        """
+        self._listener, self._unix_path = _listen(
+            address, self._max_connections, permissions
+        )
+        bound = self._listener.getsockname()
         if LOGURU_ENABLED:
-            logger.info("Connected to {conn[0]}:{conn[1]}", conn=socket_tuple)
+            logger.info("Listening at {addr}.", addr=_address_str(bound))
+        return bound if isinstance(bound, str) else (bound[0], bound[1])
 
-        self._operation_id = 0
-        self._operation_lock = Lock()
+    def serve(self, address: SocketAddress):
+        """Start the socket server.
 
-    @staticmethod
-    def _check_response(request: SocketRegIfPacket, response: Any) -> SocketRegIfPacket:
-        """Verify whether the response is valid.
+        Arguments:
+            address -- host, port number pair or Unix domain socket path.
+        """
+        self.listen(address)
+        self.serve_forever()
 
-        Raises RuntimeError for every invalidity. Returns the validated response.
+    def serve_forever(self) -> None:
+        """Serve the bound socket until `shutdown()` is called.
+
+        Raises:
+            RuntimeError: `listen()` wasn't called.
         """
-        if not isinstance(response, SocketRegIfPacket):
-            raise RuntimeError(
-                "The response is of an unexpected type. "
-                f"Requested SocketRegIfPacket, got {type(response)}."
-            )
+        if self._listener is None:
+            raise RuntimeError("The server is not listening.")
+        self._shutdown.clear()
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._listener, selectors.EVENT_READ)
+        self._selector.register(self._wakeup_recv, selectors.EVENT_READ)
+        sampler = Thread(target=self._sample_forever, daemon=True)
+        sampler.start()
+        with ThreadPoolExecutor(self._workers) as executor:
+            try:
+                while not self._shutdown.is_set():
+                    stalled = [
+                        connection
+                        for connection in self._connections.values()
+                        if connection.channel is not None and connection.out_buffer
+                    ]
+                    ready = self._selector.select(
+                        _CHANNEL_RETRY_INTERVAL if stalled else None
+                    )
+                    for connection in stalled:
+                        self._write(connection)
+                    for key, events in ready:
+                        self._handle(key, events)
+                        self._dispatch(executor)
+            finally:
+                with self._sampler_condition:
+                    self._sampler_condition.notify()
+                sampler.join()
+                for connection in list(self._connections.values()):
+                    self._close(connection)
+                self._pushes.clear()
+                self._selector.close()
+                self._selector = None
+                self._listener.close()
+                self._listener = None
+                if self._unix_path is not None:
+                    os.unlink(self._unix_path)
+                    self._unix_path = None
 
-        if response.protocol_version != PROTOCOL_VERSION:
-            raise RuntimeError(
-                f"Wrong protocol version in response: {response.protocol_version}"
-            )
+    def _handle(self, key: selectors.SelectorKey, events: int) -> None:
+        """Handle events of a registered file object."""
+        if key.fileobj is self._listener:
+            self._accept()
+        elif key.fileobj is self._wakeup_recv:
+            self._wakeup_recv.recv(4096)
+        elif key.fileobj is key.data.channel:
+            self._exchange(key.data)
+        else:
+            if events & selectors.EVENT_READ:
+                self._read(key.data)
+            if events & selectors.EVENT_WRITE:
+                self._write(key.data)
 
-        if request.operation != response.operation:
-            raise RuntimeError(
-                "Response for wrong operation. "
-                f"Requested {request.operation}, got {response.operation}"
+    def shutdown(self) -> None:
+        """Stop `serve_forever()` running in another thread."""
+        self._shutdown.set()
+        self._wake_up()
+
+    def _accept(self) -> None:
+        """Accept a new connection if the connection limit allows it."""
+        assert self._listener is not None and self._selector is not None
+        try:
+            sock, peer = self._listener.accept()
+        except BlockingIOError:
+            return
+        if len(self._connections) >= self._max_connections:
+            if LOGURU_ENABLED:
+                logger.warning(
+                    "Connection from {peer} refused. Too many connections.",
+                    peer=_address_str(peer),
+                )
+            sock.close()
+            return
+        sock.setblocking(False)
+        if sock.family != socket.AF_UNIX:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        connection = _ServerConnection(sock, peer)
+        self._connections[sock] = connection
+        self._update_events(connection)
+        if LOGURU_ENABLED:
+            logger.info("Connection accepted from {peer}.", peer=_address_str(peer))
+
+    def _close(self, connection: _ServerConnection) -> None:
+        """Close the connection."""
+        assert self._selector is not None
+        if self._connections.pop(connection.sock, None) is None:
+            return
+        if connection.events:
+            self._selector.unregister(connection.sock)
+            connection.events = 0
+        if connection.channel is not None:
+            self._selector.unregister(connection.channel)
+            connection.channel.close()
+        connection.sock.close()
+        connection.requests.clear()
+        with self._sampler_condition:
+            for key, sampled in list(self._sampled.items()):
+                for subscriber in [
+                    subscriber
+                    for subscriber in sampled.subscribers
+                    if subscriber[0] is connection
+                ]:
+                    del sampled.subscribers[subscriber]
+                if not sampled.subscribers:
+                    del self._sampled[key]
+        if LOGURU_ENABLED:
+            logger.info(
+                "Connection closed from {peer}.", peer=_address_str(connection.peer)
             )
 
-        if response.status[0] != SocketRegIfPacket.Status.RESPONSE_OK:
-            raise RuntimeError(f"Response error: {response.status}")
+    def _update_events(self, connection: _ServerConnection) -> None:
+        """Register the connection for events it can handle now.
 
-        return response
+        Socket of a shared memory connection is watched only for closing.
+        """
+        assert self._selector is not None
+        events = 0
+        if (
+            connection.channel is not None
+            or len(connection.requests) < self._max_queued_requests
+        ):
+            events |= selectors.EVENT_READ
+        if connection.out_buffer and connection.channel is None:
+            events |= selectors.EVENT_WRITE
+        if events == connection.events:
+            return
+        if connection.events == 0:
+            self._selector.register(connection.sock, events, connection)
+        elif events == 0:
+            self._selector.unregister(connection.sock)
+        else:
+            self._selector.modify(connection.sock, events, connection)
+        connection.events = events
 
-    def _get(self, reg_address: int) -> int:
-        """Read register value over the socket.
+    def _read(self, connection: _ServerConnection) -> None:
+        """Receive data from the socket and split it into requests."""
+        try:
+            data = connection.sock.recv(1 << 16)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+        if not data or connection.channel is not None:
+            # Nothing but closing is expected on sockets of shared memory
+            # connections.
+            self._close(connection)
+            return
+        self._split(connection, data)
 
-        Arguments:
-            reg_address -- absolute address of register to read.
+    def _exchange(self, connection: _ServerConnection) -> None:
+        """Receive requests and send pending responses over the shared memory."""
+        assert connection.channel is not None
+        connection.channel.clear(connection.channel.data_fd)
+        if len(connection.requests) < self._max_queued_requests:
+            try:
+                data = connection.channel.receive()
+            except OSError:
+                self._close(connection)
+                return
+            if data:
+                self._split(connection, data)
+        if connection.out_buffer:
+            self._write(connection)
 
-        Returns:
-            Data from the register.
+    def _split(self, connection: _ServerConnection, data: bytes) -> None:
+        """Split received data into requests."""
+        buffer = connection.in_buffer
+        buffer += data
+        offset = 0
+        while True:
+            size, header_size = _frame_size(buffer, offset)
+            if size is None or offset + header_size + size > len(buffer):
+                break
+            offset += header_size
+            message = bytes(buffer[offset : offset + size])
+            offset += size
+            if message[:1] == bytes([_CHANNEL_MAGIC]) and connection.channel is None:
+                self._open_channel(connection)
+                if connection.sock not in self._connections:
+                    return
+            else:
+                connection.requests.append(message)
+        del buffer[:offset]
+        self._update_events(connection)
+
+    def _open_channel(self, connection: _ServerConnection) -> None:
+        """Switch the connection to a new shared memory channel.
+
+        The channel descriptors are sent to the client over the socket, which
+        is then used only to detect closing of the connection.
         """
-        with self._operation_lock:
+        assert self._selector is not None
+        if not SHARED_MEMORY_ENABLED or connection.sock.family != socket.AF_UNIX:
+            if LOGURU_ENABLED:
+                logger.warning(
+                    "Shared memory channel is not supported for {peer}.",
+                    peer=_address_str(connection.peer),
+                )
+            self._close(connection)
+            return
+        try:
+            channel = _offer_channel(connection.sock, self._channel_capacity)
+        except OSError as exc:
+            if LOGURU_ENABLED:
+                logger.warning("Shared memory channel failed: {exc}", exc=exc)
+            self._close(connection)
+            return
+        connection.channel = channel
+        self._selector.register(channel, selectors.EVENT_READ, connection)
+
+    def _write(self, connection: _ServerConnection) -> None:
+        """Send as much of the pending responses as possible."""
+        try:
+            if connection.channel is not None:
+                sent = connection.channel.send(connection.out_buffer)
+            else:
+                sent = connection.sock.send(connection.out_buffer)
+        except BlockingIOError:
+            return
+        except OSError:
+            self._close(connection)
+            return
+        del connection.out_buffer[:sent]
+        if connection.channel is not None:
+            connection.channel.wait_for_space(bool(connection.out_buffer))
+        self._update_events(connection)
+
+    def _dispatch(self, executor: ThreadPoolExecutor) -> None:
+        """Queue responses of completed requests and schedule next requests."""
+        while self._completed:
+            connection, response = self._completed.popleft()
+            connection.busy = False
+            if connection.sock not in self._connections:
+                continue
+            if response is None:
+                self._close(connection)
+                continue
+            connection.out_buffer += _frame(response)
+            self._write(connection)
+        while self._pushes:
+            connection, message = self._pushes.popleft()
+            if connection.sock not in self._connections:
+                continue
+            connection.out_buffer += _frame(message)
+            self._write(connection)
+        for connection in list(self._connections.values()):
+            if connection.busy or not connection.requests:
+                continue
+            connection.busy = True
+            executor.submit(self._execute, connection, connection.requests.popleft())
+            if (
+                connection.channel is not None
+                and len(connection.requests) == self._max_queued_requests - 1
+            ):
+                # Resume reading of requests paused by the full queue.
+                self._exchange(connection)
+            else:
+                self._update_events(connection)
+
+    def _execute(self, connection: _ServerConnection, data: bytes) -> None:
+        """Process a request in a worker thread and wake up the I/O thread."""
+        response: Optional[bytes] = None
+        try:
+            response = self._process_message(data, connection)
+        except ValueError as exc:
+            # The request can't be answered without knowing its ID.
+            if LOGURU_ENABLED:
+                logger.warning("Malformed request: {exc}", exc=exc)
+        except Exception as exc:  # pylint: disable=broad-except
+            # Completion must be queued anyway, otherwise the connection would
+            # stay busy forever.
+            if LOGURU_ENABLED:
+                logger.error("Request processing failed: {exc}", exc=exc)
             try:
-                request = SocketRegIfPacket(
-                    PROTOCOL_VERSION,
-                    (SocketRegIfPacket.Operation.GET, self._operation_id),
-                    (SocketRegIfPacket.Status.REQUEST, None),
-                    reg_address,
-                    None,
+                response = self._error_response(
+                    decode_packet(data, self._allow_pickle),
+                    is_binary_packet(data),
+                    str(exc),
                 )
-                self._conn.send(request)
-                self._operation_id += 1
+            except Exception:  # pylint: disable=broad-except
+                pass
+        self._completed.append((connection, response))
+        self._wake_up()
 
-                response = self._check_response(request, self._conn.recv())
-                if response.value is None:
-                    raise RuntimeError("Get response doesn't have a value.")
-                return response.value
-            except PickleError as exc:
-                raise RuntimeError(
-                    f"Failed to execute socket get command for register 0x{reg_address:X}."
-                ) from exc
+    def _wake_up(self) -> None:
+        """Wake up the I/O thread waiting in `select()`."""
+        try:
+            self._wakeup_send.send(b"\0")
+        except BlockingIOError:
+            # The I/O thread has not consumed previous wake-ups yet.
+            pass
 
-    def _set(self, reg_address: int, value: int) -> None:
-        """Write register over socket.
+    def _sample_forever(self) -> None:
+        """Sample subscribed register sets until the server is shut down.
 
-        Arguments:
-            reg_address -- absolute address of register to write to.
-            value -- value to write to the register.
+        Runs in the sampler thread.
         """
-        with self._operation_lock:
+        while True:
+            with self._sampler_condition:
+                while True:
+                    if self._shutdown.is_set():
+                        return
+                    if not self._sampled:
+                        self._sampler_condition.wait()
+                        continue
+                    sampled = min(
+                        self._sampled.values(), key=lambda sampled: sampled.deadline
+                    )
+                    now = time.monotonic()
+                    if sampled.deadline > now:
+                        self._sampler_condition.wait(sampled.deadline - now)
+                        continue
+                    # Skip missed periods instead of sampling in a burst.
+                    sampled.deadline = max(sampled.deadline + sampled.period, now)
+                    break
+            self._sample(sampled)
+
+    def _sample(self, sampled: _SampledSet) -> None:
+        """Sample the register set and push changes to its subscribers."""
+        with self._region_locks_held(sampled.reg_addresses):
             try:
-                request = SocketRegIfPacket(
-                    PROTOCOL_VERSION,
-                    (SocketRegIfPacket.Operation.SET, self._operation_id),
-                    (SocketRegIfPacket.Status.REQUEST, None),
-                    reg_address,
-                    value,
+                values = self._regif.get_many(sampled.reg_addresses)
+            except Exception as exc:  # pylint: disable=broad-except
+                if LOGURU_ENABLED:
+                    logger.warning(
+                        "Sampling of subscribed registers failed: {exc}", exc=exc
+                    )
+                return
+            timestamp = time.time()
+            with self._sampler_condition:
+                changes = [
+                    SocketRegIfPacket.Change(
+                        reg_address, sampled.values[reg_address], value, timestamp
+                    )
+                    for reg_address, value in zip(sampled.reg_addresses, values)
+                    if sampled.values[reg_address] != value
+                ]
+                sampled.values.update(zip(sampled.reg_addresses, values))
+                subscribers = list(sampled.subscribers.items())
+        if not changes:
+            return
+
+        for (connection, subscription_id), protocol_version in subscribers:
+            notification = SocketRegIfPacket(
+                protocol_version,
+                (SocketRegIfPacket.Operation.NOTIFY, subscription_id),
+                (SocketRegIfPacket.Status.RESPONSE_OK, None),
+                0,
+                None,
+                changes=changes,
+            )
+            self._pushes.append(
+                (
+                    connection,
+                    encode_packet(
+                        notification, connection.binary, self._regif.data_width // 8
+                    ),
                 )
-                self._conn.send(request)
-                self._operation_id += 1
+            )
+        self._wake_up()
 
-                self._check_response(request, self._conn.recv())
-            except PickleError as exc:
-                raise RuntimeError(
-                    "Failed to execute socket set command "
-                    f"for register 0x{reg_address:X} = 0x{value:X}."
-                ) from exc
+    def _subscribe(
+        self, connection: _ServerConnection, data: SocketRegIfPacket
+    ) -> List[int]:
+        """Add a subscription to the sampled set of its registers and period.
+
+        Called with the region locks of the registers held.
+
+        Returns:
+            Current values of the registers in order of the request.
+        """
+        if data.reg_addresses is None or data.interval is None or data.interval <= 0:
+            raise RuntimeError(
+                "SUBSCRIBE request failed. No addresses or valid period provided."
+            )
+        key = (tuple(sorted(set(data.reg_addresses))), data.interval)
+        with self._sampler_condition:
+            if connection.sock not in self._connections:
+                raise RuntimeError("SUBSCRIBE request failed. Connection closed.")
+            sampled = self._sampled.get(key)
+            if sampled is None:
+                sampled = _SampledSet(*key)
+                sampled.values = dict(
+                    zip(
+                        sampled.reg_addresses,
+                        self._regif.get_many(sampled.reg_addresses),
+                    )
+                )
+                self._sampled[key] = sampled
+                self._sampler_condition.notify()
+            sampled.subscribers[(connection, data.operation[1])] = data.protocol_version
+            return [sampled.values[reg_address] for reg_address in data.reg_addresses]
+
+    def _unsubscribe(self, connection: _ServerConnection, subscription_id: int) -> None:
+        """Remove a subscription, ignoring unknown ones."""
+        with self._sampler_condition:
+            for key, sampled in list(self._sampled.items()):
+                if sampled.subscribers.pop((connection, subscription_id), None) is None:
+                    continue
+                if not sampled.subscribers:
+                    del self._sampled[key]
+
+    def _serialized(self, data: SocketRegIfPacket) -> ContextManager[None]:
+        """Hold locks of all the register regions accessed by the request.
+
+        Sequences lock regions step by step on their own.
+        """
+        operation = data.operation[0]
+        reg_addresses: Iterable[int]
+        if data.negotiate or operation in (
+            SocketRegIfPacket.Operation.WAIT_FOR,
+            SocketRegIfPacket.Operation.SEQUENCE,
+            SocketRegIfPacket.Operation.UNSUBSCRIBE,
+        ):
+            reg_addresses = []
+        elif operation in (
+            SocketRegIfPacket.Operation.GET_MANY,
+            SocketRegIfPacket.Operation.SET_MANY,
+            SocketRegIfPacket.Operation.SUBSCRIBE,
+        ):
+            reg_addresses = data.reg_addresses or []
+        elif operation == SocketRegIfPacket.Operation.BATCH:
+            reg_addresses = (batch_op.reg_address for batch_op in data.batch or [])
+        else:
+            reg_addresses = [data.reg_address]
+        return self._region_locks_held(reg_addresses)
+
+    @contextmanager
+    def _region_locks_held(self, reg_addresses: Iterable[int]) -> Iterator[None]:
+        """Hold locks of the register regions containing the addresses."""
+        stripes = sorted(
+            {
+                (reg_address // self._region_size) % len(self._region_locks)
+                for reg_address in reg_addresses
+            }
+        )
+        with ExitStack() as stack:
+            for stripe in stripes:
+                stack.enter_context(self._region_locks[stripe])
+            yield
+
+    def _process_message(
+        self, data: bytes, connection: Optional[_ServerConnection] = None
+    ) -> bytes:
+        """Process a serialized packet and return a serialized response.
+
+        If pickle isn't allowed, pickled requests are answered with a binary
+        error response carrying the server protocol version, which makes
+        negotiating clients switch to the binary format.
+
+        Arguments:
+            data -- serialized request packet.
+
+        Keyword Arguments:
+            connection -- connection the request was received from. Required
+                by subscriptions.
+
+        Returns:
+            Serialized response packet.
+
+        Raises:
+            ValueError: the request is malformed.
+            RuntimeError: the request is not a packet.
+        """
+        binary = is_binary_packet(data)
+        if connection is not None:
+            connection.binary = binary
+        if not binary and not self._allow_pickle:
+            response = SocketRegIfPacket(
+                PROTOCOL_VERSION,
+                (SocketRegIfPacket.Operation.GET, 0),
+                (
+                    SocketRegIfPacket.Status.RESPONSE_ERROR,
+                    "Pickled requests are not allowed. Use binary wire format.",
+                ),
+                0,
+                None,
+            )
+            return encode_packet(response, True)
+
+        try:
+            request = decode_packet(data, self._allow_pickle)
+        except Exception as exc:  # pylint: disable=broad-except
+            # Unpickling can fail with almost any exception.
+            raise ValueError(str(exc)) from exc
+        response = self._process_packet(request, connection)
+        try:
+            return encode_packet(response, binary, self._regif.data_width // 8)
+        except Exception as exc:  # pylint: disable=broad-except
+            # E.g., a value doesn't fit the binary format.
+            return self._error_response(request, binary, str(exc))
+
+    def _error_response(
+        self, request: SocketRegIfPacket, binary: bool, message: str
+    ) -> bytes:
+        """Serialize a minimal error response to the request.
+
+        Only the operation and the error are kept, so the response can be
+        encoded no matter what the request carried.
+
+        Arguments:
+            request -- request packet.
+            binary -- use the binary wire format.
+            message -- error message.
+
+        Returns:
+            Serialized response packet.
+        """
+        response = SocketRegIfPacket(
+            (
+                request.protocol_version
+                if 1 <= request.protocol_version <= PROTOCOL_VERSION
+                else PROTOCOL_VERSION
+            ),
+            request.operation,
+            (SocketRegIfPacket.Status.RESPONSE_ERROR, message),
+            0,
+            None,
+        )
+        return encode_packet(response, binary, self._regif.data_width // 8)
+
+    def _process_packet(  # pylint: disable=too-many-branches,too-many-statements
+        self, data: SocketRegIfPacket, connection: Optional[_ServerConnection] = None
+    ) -> SocketRegIfPacket:
+        """Process a packet and return a response.
+
+        If any error occurs during the packet processing, the exception string is passed as an
+        response error with the exception message passed as the optional response string.
+
+        Arguments:
+            data -- request packet.
+
+        Keyword Arguments:
+            connection -- connection the request was received from. Required
+                by subscriptions.
+
+        Returns:
+            Response packet.
+        """
+        try:
+            if not 1 <= data.protocol_version <= PROTOCOL_VERSION:
+                raise RuntimeError(
+                    f"Unsupported protocol version: {data.protocol_version}."
+                )
+            if data.status[0] != SocketRegIfPacket.Status.REQUEST:
+                raise RuntimeError(
+                    f"Server can handle only requests. Got {data.status}."
+                )
+            if OPERATION_VERSIONS.get(data.operation[0], 0) > data.protocol_version:
+                raise RuntimeError(
+                    f"Operation {data.operation[0]} not supported in protocol "
+                    f"version {data.protocol_version}."
+                )
+            self._check_duration(data)
+
+            with self._serialized(data):
+                if data.negotiate:
+                    data.value = PROTOCOL_VERSION
+                    data.status = (SocketRegIfPacket.Status.RESPONSE_OK, None)
+                elif data.operation[0] == SocketRegIfPacket.Operation.GET:
+                    data.value = self._regif.get(data.reg_address)
+                    data.status = (SocketRegIfPacket.Status.RESPONSE_OK, None)
+                elif data.operation[0] == SocketRegIfPacket.Operation.SET:
+                    if data.value is None:
+                        raise RuntimeError(
+                            f"SET request for address 0x{data.reg_address:X} failed. "
+                            "No value provided."
+                        )
+                    self._regif.set(data.reg_address, data.value)
+                    data.status = (SocketRegIfPacket.Status.RESPONSE_OK, None)
+                elif data.operation[0] == SocketRegIfPacket.Operation.GET_MANY:
+                    if data.reg_addresses is None:
+                        raise RuntimeError(
+                            "GET_MANY request failed. No addresses provided."
+                        )
+                    data.values = self._regif.get_many(data.reg_addresses)
+                    data.status = (SocketRegIfPacket.Status.RESPONSE_OK, None)
+                elif data.operation[0] == SocketRegIfPacket.Operation.SET_MANY:
+                    if data.reg_addresses is None or data.values is None:
+                        raise RuntimeError(
+                            "SET_MANY request failed. No addresses or values provided."
+                        )
+                    self._regif.set_many(zip(data.reg_addresses, data.values))
+                    data.status = (SocketRegIfPacket.Status.RESPONSE_OK, None)
+                elif data.operation[0] == SocketRegIfPacket.Operation.MODIFY:
+                    if data.value is None or data.mask is None:
+                        raise RuntimeError(
+                            f"MODIFY request for address 0x{data.reg_address:X} failed. "
+                            "No value or mask provided."
+                        )
+                    data.value = self._regif.modify(
+                        data.reg_address, data.mask, data.value
+                    )
+                    data.status = (SocketRegIfPacket.Status.RESPONSE_OK, None)
+                elif data.operation[0] == SocketRegIfPacket.Operation.WAIT_FOR:
+                    if data.value is None or data.mask is None or data.timeout is None:
+                        raise RuntimeError(
+                            f"WAIT_FOR request for address 0x{data.reg_address:X} failed. "
+                            "No value, mask or timeout provided."
+                        )
+                    try:
+                        data.value = self._regif.wait_for(
+                            data.reg_address,
+                            data.mask,
+                            data.value,
+                            data.timeout,
+                            data.interval if data.interval is not None else 0.01,
+                        )
+                    except WaitTimeoutError as exc:
+                        # Timeout is not an error, the client compares the last value.
+                        data.value = exc.value
+                    data.status = (SocketRegIfPacket.Status.RESPONSE_OK, None)
+                elif data.operation[0] == SocketRegIfPacket.Operation.SEQUENCE:
+                    if data.sequence is None:
+                        raise RuntimeError(
+                            "SEQUENCE request failed. No steps provided."
+                        )
+                    data.captures = RegSequence(data.sequence).run(
+                        self._regif,
+                        lambda reg_address: self._region_locks_held([reg_address]),
+                    )
+                    data.status = (SocketRegIfPacket.Status.RESPONSE_OK, None)
+                elif data.operation[0] == SocketRegIfPacket.Operation.BATCH:
+                    if data.batch is None:
+                        raise RuntimeError(
+                            "BATCH request failed. No operations provided."
+                        )
+                    data.batch_results = self._process_batch(
+                        data.batch, data.continue_on_error
+                    )
+                    data.status = (SocketRegIfPacket.Status.RESPONSE_OK, None)
+                elif data.operation[0] in (
+                    SocketRegIfPacket.Operation.SUBSCRIBE,
+                    SocketRegIfPacket.Operation.UNSUBSCRIBE,
+                ):
+                    if connection is None:
+                        raise RuntimeError("Subscriptions require a connection.")
+                    if data.operation[0] == SocketRegIfPacket.Operation.SUBSCRIBE:
+                        data.values = self._subscribe(connection, data)
+                    else:
+                        self._unsubscribe(connection, data.reg_address)
+                    data.status = (SocketRegIfPacket.Status.RESPONSE_OK, None)
+                else:
+                    raise NotImplementedError(
+                        f'Operation "{data.operation}" not supported.'
+                    )
+        except Exception as exc:  # pylint: disable=broad-except
+            # Exception occured either during validation of the packet or during register access.
+            if not 1 <= data.protocol_version <= PROTOCOL_VERSION:
+                data.protocol_version = PROTOCOL_VERSION
+            data.status = (SocketRegIfPacket.Status.RESPONSE_ERROR, str(exc))
+        return data
+
+    def _check_duration(self, data: SocketRegIfPacket) -> None:
+        """Check if waits and delays of a request are within the server limits.
+
+        Durations of all sequence steps are summed, no matter their conditions.
+
+        Arguments:
+            data -- request packet.
+
+        Raises:
+            ValueError: a timeout, interval or delay is negative or not finite.
+            RuntimeError: a wait or delay is longer than `max_wait` or waits
+                and delays of a sequence are longer than `max_sequence_duration`.
+        """
+        if data.operation[0] == SocketRegIfPacket.Operation.WAIT_FOR:
+            durations = [data.timeout] if data.timeout is not None else []
+            intervals = [data.interval] if data.interval is not None else []
+        elif (
+            data.operation[0] == SocketRegIfPacket.Operation.SEQUENCE
+            and data.sequence is not None
+        ):
+            steps = [
+                step
+                for step in data.sequence
+                if step.operation
+                in (SequenceOperation.WAIT_FOR, SequenceOperation.DELAY)
+            ]
+            durations = [step.timeout for step in steps]
+            intervals = [
+                step.interval
+                for step in steps
+                if step.operation == SequenceOperation.WAIT_FOR
+            ]
+        else:
+            return
+        for duration in durations + intervals:
+            if not 0 <= duration < math.inf:
+                raise ValueError(
+                    f"Timeout, interval or delay of {duration} s is not allowed."
+                )
+        longest = max(durations, default=0.0)
+        if longest > self._max_wait:
+            raise RuntimeError(
+                f"Wait or delay of {longest} s exceeds the server limit "
+                f"of {self._max_wait} s."
+            )
+        if sum(durations) > self._max_sequence_duration:
+            raise RuntimeError(
+                f"Sequence duration of {sum(durations)} s exceeds the server limit "
+                f"of {self._max_sequence_duration} s."
+            )
+
+    def _process_batch_op(
+        self, batch_op: SocketRegIfPacket.BatchOp
+    ) -> SocketRegIfPacket.BatchResult:
+        """Execute a single operation of a batch.
+
+        Arguments:
+            batch_op -- operation to execute.
+
+        Returns:
+            Result of the operation.
+        """
+        try:
+            value: Optional[int] = None
+            if batch_op.operation == SocketRegIfPacket.Operation.GET:
+                value = self._regif.get(batch_op.reg_address)
+            elif batch_op.operation == SocketRegIfPacket.Operation.SET:
+                if batch_op.value is None:
+                    raise RuntimeError("No value provided.")
+                self._regif.set(batch_op.reg_address, batch_op.value)
+            elif batch_op.operation == SocketRegIfPacket.Operation.MODIFY:
+                if batch_op.value is None or batch_op.mask is None:
+                    raise RuntimeError("No value or mask provided.")
+                value = self._regif.modify(
+                    batch_op.reg_address, batch_op.mask, batch_op.value
+                )
+            else:
+                raise NotImplementedError(
+                    f'Operation "{batch_op.operation}" not supported in batch.'
+                )
+        except Exception as exc:  # pylint: disable=broad-except
+            return SocketRegIfPacket.BatchResult(
+                SocketRegIfPacket.Status.RESPONSE_ERROR, None, str(exc)
+            )
+        return SocketRegIfPacket.BatchResult(
+            SocketRegIfPacket.Status.RESPONSE_OK, value
+        )
+
+    def _valid_batch_op(self, batch_op: SocketRegIfPacket.BatchOp) -> bool:
+        """Check if a GET or SET operation of a batch passes argument validation."""
+        if (
+            batch_op.operation == SocketRegIfPacket.Operation.SET
+            and batch_op.value is None
+        ):
+            return False
+        try:
+            # pylint: disable-next=protected-access
+            self._regif._sanitize_field_args(batch_op.reg_address, value=batch_op.value)
+        except ValueError:
+            return False
+        return True
+
+    def _process_bulk(
+        self, batch: List[SocketRegIfPacket.BatchOp]
+    ) -> List[SocketRegIfPacket.BatchResult]:
+        """Execute validated GET or SET operations with a single bulk operation.
+
+        If the bulk operation fails, all the operations are reported as failed,
+        since it's unknown which registers have already been accessed.
+
+        Arguments:
+            batch -- operations to execute (all GET or all SET).
+
+        Returns:
+            Results of the operations.
+        """
+        try:
+            if batch[0].operation == SocketRegIfPacket.Operation.GET:
+                values: List[Optional[int]] = list(
+                    self._regif.get_many(batch_op.reg_address for batch_op in batch)
+                )
+            else:
+                self._regif.set_many(
+                    (batch_op.reg_address, batch_op.value)  # type: ignore
+                    for batch_op in batch
+                )
+                values = [None] * len(batch)
+        except Exception as exc:  # pylint: disable=broad-except
+            error = SocketRegIfPacket.BatchResult(
+                SocketRegIfPacket.Status.RESPONSE_ERROR,
+                None,
+                f"Bulk {batch[0].operation.name} of {len(batch)} registers failed: {exc}",
+            )
+            return [error] * len(batch)
+        return [
+            SocketRegIfPacket.BatchResult(SocketRegIfPacket.Status.RESPONSE_OK, value)
+            for value in values
+        ]
+
+    def _process_batch(
+        self, batch: List[SocketRegIfPacket.BatchOp], continue_on_error: bool
+    ) -> List[SocketRegIfPacket.BatchResult]:
+        """Execute operations of a batch.
+
+        Runs of consecutive GET or SET operations are validated up front and
+        executed with a single bulk operation of the register interface.
+        Operations failing the validation are executed separately to report
+        the error. A failed bulk operation isn't replayed, see
+        `_process_bulk()`.
+
+        Arguments:
+            batch -- operations to execute.
+            continue_on_error -- don't stop on the first failed operation.
+
+        Returns:
+            Results of the operations. If stopped on error, the last result is
+            the failed operation.
+        """
+        results: List[SocketRegIfPacket.BatchResult] = []
+        start = 0
+        while start < len(batch):
+            operation = batch[start].operation
+            stop = start + 1
+            if operation in (
+                SocketRegIfPacket.Operation.GET,
+                SocketRegIfPacket.Operation.SET,
+            ) and self._valid_batch_op(batch[start]):
+                while (
+                    stop < len(batch)
+                    and batch[stop].operation == operation
+                    and self._valid_batch_op(batch[stop])
+                ):
+                    stop += 1
+            run = batch[start:stop]
+            start = stop
+
+            if len(run) > 1:
+                results.extend(self._process_bulk(run))
+            else:
+                results.append(self._process_batch_op(run[0]))
+            if (
+                results[-1].status != SocketRegIfPacket.Status.RESPONSE_OK
+                and not continue_on_error
+            ):
+                break
+        return results
+
+
+_PendingRequest = Tuple[
+    SocketRegIfPacket, "Future[Any]", Callable[[SocketRegIfPacket], Any]
+]
+"""Request waiting for response: (request, future, response to result conversion)."""
+
+
+class SocketRegIfSubscription:  # pylint: disable=too-many-instance-attributes
+    """Subscription to register changes, see `SocketRegIfClient.subscribe()`.
+
+    Changes are passed to the callback if provided, otherwise they're queued
+    for `get()` or iteration. Iteration ends when the subscription is closed.
+    """
+
+    def __init__(
+        self,
+        reg_addresses: List[int],
+        period: float,
+        callback: Optional[Callable[[SocketRegIfPacket.Change], None]] = None,
+        unsubscribe: Optional[Callable[["SocketRegIfSubscription"], None]] = None,
+    ):
+        """Initialize open subscription without values.
+
+        Arguments:
+            reg_addresses -- subscribed register addresses.
+            period -- sampling period in seconds.
+
+        Keyword Arguments:
+            callback -- function called with every change.
+            unsubscribe -- function cancelling the subscription on the server.
+        """
+        self.reg_addresses = reg_addresses
+        """Subscribed register addresses."""
+
+        self.period = period
+        """Sampling period in seconds."""
+
+        self.values: Dict[int, int] = {}
+        """Last known values of the subscribed registers."""
+
+        self._callback = callback
+        self._unsubscribe = unsubscribe
+        self._changes: "SimpleQueue[Optional[SocketRegIfPacket.Change]]" = SimpleQueue()
+        self._closed = Event()
+        self._end_lock = Lock()
+        self._end_callbacks: List[Callable[[], None]] = []
+
+    def __enter__(self) -> "SocketRegIfSubscription":
+        """Use the subscription as a context manager, which closes it at exit."""
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Close the subscription."""
+        self.close()
+
+    def __iter__(self) -> Iterator[SocketRegIfPacket.Change]:
+        """Iterate over changes until the subscription is closed."""
+        while True:
+            change = self.get()
+            if change is None:
+                return
+            yield change
+
+    @property
+    def closed(self) -> bool:
+        """Check whether the subscription is closed."""
+        return self._closed.is_set()
+
+    def get(
+        self, timeout: Optional[float] = None
+    ) -> Optional[SocketRegIfPacket.Change]:
+        """Wait for the next queued change.
+
+        Keyword Arguments:
+            timeout -- maximum time to wait in seconds.
+
+        Returns:
+            The change or None if the subscription is closed.
+
+        Raises:
+            queue.Empty: no change arrived before the timeout.
+        """
+        if self._closed.is_set() and self._changes.empty():
+            return None
+        return self._changes.get(timeout=timeout)
+
+    def close(self) -> None:
+        """Cancel the subscription."""
+        if self._closed.is_set():
+            return
+        if self._unsubscribe is not None:
+            self._unsubscribe(self)
+        self._end()
+
+    def _snapshot(self, values: Sequence[int]) -> None:
+        """Set initial values, unless already updated by a change."""
+        for reg_address, value in zip(self.reg_addresses, values):
+            self.values.setdefault(reg_address, value)
+
+    def _notify(self, changes: Iterable[SocketRegIfPacket.Change]) -> None:
+        """Record changes and pass them to the callback or the queue."""
+        for change in changes:
+            self.values[change.reg_address] = change.new
+            if self._callback is None:
+                self._changes.put(change)
+                continue
+            try:
+                self._callback(change)
+            except Exception as exc:  # pylint: disable=broad-except
+                if LOGURU_ENABLED:
+                    logger.exception("Subscription callback failed: {exc}", exc=exc)
+
+    def _on_end(self, callback: Callable[[], None]) -> None:
+        """Call the function once the subscription ends (right away if it has ended)."""
+        with self._end_lock:
+            if not self._closed.is_set():
+                self._end_callbacks.append(callback)
+                return
+        callback()
+
+    def _end(self) -> None:
+        """Mark the subscription closed, end iteration and call end callbacks."""
+        with self._end_lock:
+            if self._closed.is_set():
+                return
+            self._closed.set()
+            callbacks, self._end_callbacks = self._end_callbacks, []
+        self._changes.put(None)
+        for callback in callbacks:
+            callback()
+
+
+class SocketRegIfClient(
+    RegisterInterface
+):  # pylint: disable=too-many-instance-attributes
+    """Socket register interface client.
+
+    Supposed to be running on the controller side.
+
+    Requests are pipelined: they're sent without waiting for responses of the
+    previous ones and a receiver thread matches responses to requests by the
+    operation ID. The blocking API waits for each response, so to have many
+    requests in flight use `get_async()` and `set_async()` (or bulk operations).
+
+    The protocol version is negotiated at connect time. Operations unsupported
+    by an older server are emulated with the operations it supports. Servers
+    supporting protocol version 6 are talked to in the binary wire format,
+    older ones with pickle.
+
+    The transport is selected by the server address: TCP for (host, port)
+    pairs, Unix domain socket for paths and shared memory for paths prefixed
+    with `SHARED_MEMORY_PREFIX` (e.g., "shm:/run/regif.sock").
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        socket_tuple: SocketAddress,
+        data_width: int,
+        address_bounds: Optional[range] = None,
+        trace: bool = False,
+        allow_pickle: bool = False,
+    ):
+        """Initialize the socket register interface client.
+
+        Arguments:
+            socket_tuple -- server address: (host, port) pair, Unix domain
+                socket path or shared memory prefixed socket path.
+            data_width -- width of data in bits, should be divisible by 8.
+            address_bounds -- address range, which is allowed by this register
+                interface. If not defined, addresses are not validated if they
+                are in range.
+
+        Keyword Arguments:
+            trace -- activate operation tracing (uses `loguru.trace()` under the hood).
+            allow_pickle -- fall back to pickle for servers not supporting the
+                binary wire format. If False, the negotiation itself is done
+                in the binary format.
+
+        Raises:
+            RuntimeError: the protocol negotiation or the shared memory setup
+                failed.
+        """
+        super().__init__(data_width, address_bounds, trace)
+
+        try:
+            self._conn = _connect(socket_tuple)
+        except EOFError as exc:
+            raise RuntimeError(str(exc)) from exc
+        if LOGURU_ENABLED:
+            logger.info("Connected to {conn}", conn=_address_str(socket_tuple))
+
+        self._allow_pickle = allow_pickle
+        try:
+            self._conn.send_bytes(
+                encode_packet(self._negotiation_request(), not allow_pickle)
+            )
+            response = decode_packet(self._conn.recv_bytes(), allow_pickle)
+        except (EOFError, OSError) as exc:
+            self._conn.close()
+            raise RuntimeError(
+                "Connection closed during protocol negotiation."
+            ) from exc
+        self._protocol_version = self._negotiated_version(response)
+        self._binary = self._protocol_version >= BINARY_PROTOCOL_VERSION
+        if not self._binary and not allow_pickle:
+            self._conn.close()
+            raise RuntimeError(
+                "The server doesn't support binary wire format and pickle is not allowed."
+            )
+        if LOGURU_ENABLED:
+            logger.debug(
+                "Using protocol version {version}", version=self._protocol_version
+            )
+
+        self._operation_id = 1
+        self._operation_lock = Lock()
+        self._pending: Dict[int, _PendingRequest] = {}
+        self._pending_lock = Lock()
+        self._subscriptions: Dict[int, SocketRegIfSubscription] = {}
+        self._closed = Event()
+        # The receiver doesn't reference the client, so the connection is
+        # closed when the client is garbage collected.
+        self._receiver = Thread(
+            target=self._receive,
+            args=(
+                self._conn,
+                self._pending,
+                self._pending_lock,
+                self._subscriptions,
+                self._closed,
+                # Only legacy servers not supporting the binary format respond
+                # with pickle.
+                allow_pickle and not self._binary,
+            ),
+            daemon=True,
+        )
+        self._receiver.start()
+
+    def __del__(self):
+        """Ensure the connection is closed."""
+        if hasattr(self, "_receiver"):
+            self.close()
+
+    def close(self) -> None:
+        """Close the connection.
+
+        Requests waiting for a response fail with RuntimeError.
+        """
+        if self._conn.closed:
+            return
+        # Stop the receiver thread before closing the descriptor, otherwise it
+        # could read from a new connection reusing the descriptor number.
+        try:
+            with socket.socket(fileno=os.dup(self._conn.fileno())) as sock:
+                sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        if current_thread() is not self._receiver:
+            self._receiver.join()
+        self._conn.close()
+
+    @property
+    def protocol_version(self) -> int:
+        """Get protocol version negotiated with the server."""
+        return self._protocol_version
+
+    @property
+    def connected(self) -> bool:
+        """Check whether the connection is open."""
+        return not self._closed.is_set() and not self._conn.closed
+
+    def ping(self, timeout: Optional[float] = None) -> bool:
+        """Check whether the server responds.
+
+        Sends a negotiation request, which doesn't access any register. Servers
+        older than protocol version 5 aren't pinged, only the connection state
+        is checked.
+
+        Keyword Arguments:
+            timeout -- maximum time to wait for the response in seconds.
+
+        Returns:
+            True if the server responded.
+        """
+        if not self.connected:
+            return False
+        if self._protocol_version < 5:
+            return True
+        try:
+            self._submit(SocketRegIfPacket.Operation.GET, negotiate=True).result(
+                timeout
+            )
+        except (RuntimeError, FutureTimeoutError):
+            return False
+        return True
+
+    def _supports(self, operation: SocketRegIfPacket.Operation) -> bool:
+        """Check whether the negotiated protocol version supports the operation."""
+        return OPERATION_VERSIONS[operation] <= self._protocol_version
+
+    @staticmethod
+    def _negotiation_request() -> SocketRegIfPacket:
+        """Create version negotiation request (with operation ID 0)."""
+        return SocketRegIfPacket.request(
+            PROTOCOL_VERSION, SocketRegIfPacket.Operation.GET, 0, negotiate=True
+        )
+
+    @staticmethod
+    def _negotiated_version(response: Any) -> int:
+        """Get protocol version from the negotiation response.
+
+        Servers older than version 5 respond with unsupported version error, in
+        which they provide their own protocol version.
+
+        Raises:
+            RuntimeError: the response is invalid or the server version is
+                unknown.
+        """
+        if not isinstance(response, SocketRegIfPacket):
+            raise RuntimeError(
+                "The response is of an unexpected type. "
+                f"Requested SocketRegIfPacket, got {type(response)}."
+            )
+        if response.status[0] == SocketRegIfPacket.Status.RESPONSE_OK:
+            if response.value is None:
+                raise RuntimeError("Negotiation response doesn't have a version.")
+            version = min(response.value, PROTOCOL_VERSION)
+        else:
+            version = response.protocol_version
+        if not 1 <= version <= PROTOCOL_VERSION:
+            raise RuntimeError(f"Unsupported server protocol version: {version}.")
+        return version
+
+    @staticmethod
+    def _receive(  # pylint: disable=too-many-arguments
+        conn: Union[Connection, _SharedMemoryConnection],
+        pending: Dict[int, _PendingRequest],
+        pending_lock: Lock,
+        subscriptions: Dict[int, SocketRegIfSubscription],
+        closed: Event,
+        allow_pickle: bool,
+    ) -> None:
+        """Receive responses and resolve futures of the matching requests.
+
+        Notifications are passed to the matching subscriptions. Runs in the
+        receiver thread until the connection is closed.
+        """
+        error = "Connection closed."
+        try:
+            while True:
+                response = decode_packet(conn.recv_bytes(), allow_pickle)
+                if response.operation[0] == SocketRegIfPacket.Operation.NOTIFY:
+                    subscription = subscriptions.get(response.operation[1])
+                    if subscription is not None:
+                        # pylint: disable-next=protected-access
+                        subscription._notify(response.changes or [])
+                    continue
+                with pending_lock:
+                    entry = pending.pop(response.operation[1], None)
+                if entry is None:
+                    raise RuntimeError(f"Unexpected response: {response}")
+                request, future, convert = entry
+                try:
+                    future.set_result(
+                        convert(SocketRegIfClient._check_response(request, response))
+                    )
+                except Exception as exc:  # pylint: disable=broad-except
+                    future.set_exception(exc)
+        except (EOFError, OSError):
+            pass
+        except Exception as exc:  # pylint: disable=broad-except
+            error = f"Connection broken: {exc}"
+            conn.close()
+        with pending_lock:
+            closed.set()
+            for _, future, _ in pending.values():
+                future.set_exception(RuntimeError(error))
+            pending.clear()
+            for subscription in subscriptions.values():
+                subscription._end()  # pylint: disable=protected-access
+            subscriptions.clear()
+
+    @staticmethod
+    def _check_response(request: SocketRegIfPacket, response: Any) -> SocketRegIfPacket:
+        """Verify whether the response is valid.
+
+        Raises RuntimeError for every invalidity. Returns the validated response.
+        """
+        if not isinstance(response, SocketRegIfPacket):
+            raise RuntimeError(
+                "The response is of an unexpected type. "
+                f"Requested SocketRegIfPacket, got {type(response)}."
+            )
+
+        if response.protocol_version != request.protocol_version:
+            raise RuntimeError(
+                f"Wrong protocol version in response: {response.protocol_version}"
+            )
+
+        if request.operation != response.operation:
+            raise RuntimeError(
+                "Response for wrong operation. "
+                f"Requested {request.operation}, got {response.operation}"
+            )
+
+        if response.status[0] != SocketRegIfPacket.Status.RESPONSE_OK:
+            raise RuntimeError(f"Response error: {response.status}")
+
+        return response
+
+    def _submit(  # pylint: disable=too-many-arguments,too-many-locals
+        self,
+        operation: SocketRegIfPacket.Operation,
+        reg_address: int = 0,
+        value: Optional[int] = None,
+        reg_addresses: Optional[List[int]] = None,
+        values: Optional[List[int]] = None,
+        mask: Optional[int] = None,
+        timeout: Optional[float] = None,
+        interval: Optional[float] = None,
+        batch: Optional[List[SocketRegIfPacket.BatchOp]] = None,
+        continue_on_error: bool = False,
+        sequence: Optional[List[SequenceStep]] = None,
+        negotiate: bool = False,
+        subscription: Optional[SocketRegIfSubscription] = None,
+        convert: Callable[[SocketRegIfPacket], Any] = lambda response: response,
+    ) -> "Future[Any]":
+        """Send a request to the server without waiting for the response.
+
+        Keyword Arguments:
+            subscription -- subscription registered under the operation ID
+                before sending, so no notification is missed.
+            convert -- conversion of the validated response to the future result.
+
+        Returns:
+            Future resolved with the converted response. It fails with
+            RuntimeError if the response is invalid or reports an error.
+
+        Raises:
+            PickleError: the packet couldn't be serialized.
+            RuntimeError: the connection is closed.
+        """
+        future: "Future[Any]" = Future()
+        with self._operation_lock:
+            request = SocketRegIfPacket.request(
+                self._protocol_version,
+                operation,
+                self._operation_id,
+                reg_address,
+                value,
+                reg_addresses=reg_addresses,
+                values=values,
+                mask=mask,
+                timeout=timeout,
+                interval=interval,
+                batch=batch,
+                continue_on_error=continue_on_error,
+                sequence=sequence,
+                negotiate=negotiate,
+            )
+            with self._pending_lock:
+                if self._closed.is_set() or self._conn.closed:
+                    raise RuntimeError("Connection closed.")
+                self._pending[self._operation_id] = (request, future, convert)
+                if subscription is not None:
+                    self._subscriptions[self._operation_id] = subscription
+            try:
+                self._conn.send_bytes(
+                    encode_packet(request, self._binary, self._data_bytes)
+                )
+            except Exception:
+                with self._pending_lock:
+                    self._pending.pop(self._operation_id, None)
+                    self._subscriptions.pop(self._operation_id, None)
+                raise
+            finally:
+                self._operation_id += 1
+        return future
+
+    def _request(  # pylint: disable=too-many-arguments
+        self,
+        operation: SocketRegIfPacket.Operation,
+        reg_address: int = 0,
+        value: Optional[int] = None,
+        reg_addresses: Optional[List[int]] = None,
+        values: Optional[List[int]] = None,
+        mask: Optional[int] = None,
+        timeout: Optional[float] = None,
+        interval: Optional[float] = None,
+    ) -> SocketRegIfPacket:
+        """Send a request to the server and wait for the validated response.
+
+        Raises:
+            PickleError: the packet couldn't be serialized.
+            RuntimeError: the response is invalid or reports an error.
+        """
+        return self._submit(
+            operation,
+            reg_address,
+            value,
+            reg_addresses,
+            values,
+            mask,
+            timeout,
+            interval,
+        ).result()
+
+    @staticmethod
+    def _response_value(response: SocketRegIfPacket) -> int:
+        """Get value from get response."""
+        if response.value is None:
+            raise RuntimeError("Get response doesn't have a value.")
+        return response.value
+
+    def get_async(self, reg_address: int) -> "Future[int]":
+        """Read register value without waiting for the response.
+
+        Many reads can be in flight at the same time, so the link latency is
+        paid once for all of them. Transactions are not supported.
+
+        Arguments:
+            reg_address -- absolute address of register to read.
+
+        Returns:
+            Future resolved with data from the register.
+
+        Raises:
+            RuntimeError: called inside a transaction.
+        """
+        if self._transaction is not None:
+            raise RuntimeError("Asynchronous access is not supported in transactions.")
+        self._sanitize_field_args(reg_address)
+        future = self._submit(
+            SocketRegIfPacket.Operation.GET,
+            reg_address,
+            convert=self._response_value,
+        )
+        if self._trace_active:
+            future.add_done_callback(
+                lambda done: done.exception() is None
+                and self._trace(self._Operation.GET, reg_address, done.result())
+            )
+        return future
+
+    def set_async(self, reg_address: int, value: int) -> "Future[None]":
+        """Write register value without waiting for the response.
+
+        Transactions are not supported.
+
+        Arguments:
+            reg_address -- absolute address of register to write to.
+            value -- value to write to the register.
+
+        Returns:
+            Future resolved when the write is done.
+
+        Raises:
+            RuntimeError: called inside a transaction.
+        """
+        if self._transaction is not None:
+            raise RuntimeError("Asynchronous access is not supported in transactions.")
+        self._sanitize_field_args(reg_address, value=value)
+        self._trace(self._Operation.SET, reg_address, value)
+        return self._submit(
+            SocketRegIfPacket.Operation.SET,
+            reg_address,
+            value,
+            convert=lambda _: None,
+        )
+
+    def _get(self, reg_address: int) -> int:
+        """Read register value over the socket.
+
+        Arguments:
+            reg_address -- absolute address of register to read.
+
+        Returns:
+            Data from the register.
+        """
+        try:
+            return self._submit(
+                SocketRegIfPacket.Operation.GET,
+                reg_address,
+                convert=self._response_value,
+            ).result()
+        except pickle.PickleError as exc:
+            raise RuntimeError(
+                f"Failed to execute socket get command for register 0x{reg_address:X}."
+            ) from exc
+
+    def _set(self, reg_address: int, value: int) -> None:
+        """Write register over socket.
+
+        Arguments:
+            reg_address -- absolute address of register to write to.
+            value -- value to write to the register.
+        """
+        try:
+            self._request(SocketRegIfPacket.Operation.SET, reg_address, value)
+        except pickle.PickleError as exc:
+            raise RuntimeError(
+                "Failed to execute socket set command "
+                f"for register 0x{reg_address:X} = 0x{value:X}."
+            ) from exc
+
+    def _modify(self, reg_address: int, mask: int, value: int) -> int:
+        """Read-modify-write register on the server side in a single round-trip.
+
+        The operation is atomic against other clients of the server.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            mask -- mask of the register bits to modify.
+            value -- new value of the masked bits (already shifted).
+
+        Returns:
+            New register value.
+        """
+        if not self._supports(SocketRegIfPacket.Operation.MODIFY):
+            return super()._modify(reg_address, mask, value)
+        try:
+            response = self._request(
+                SocketRegIfPacket.Operation.MODIFY, reg_address, value, mask=mask
+            )
+        except pickle.PickleError as exc:
+            raise RuntimeError(
+                "Failed to execute socket modify command "
+                f"for register 0x{reg_address:X} = 0x{value:X} (mask 0x{mask:X})."
+            ) from exc
+        if response.value is None:
+            raise RuntimeError("Modify response doesn't have a value.")
+        return response.value
+
+    def _wait_for(  # pylint: disable=too-many-arguments
+        self, reg_address: int, mask: int, value: int, timeout: float, interval: float
+    ) -> int:
+        """Poll register on the server side.
+
+        The server replies only when the condition is met or on timeout, so
+        the whole wait takes a single round-trip.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            mask -- mask of the register bits to compare.
+            value -- expected value of the masked bits (already shifted).
+            timeout -- maximum time to wait in seconds.
+            interval -- maximum polling interval in seconds.
+
+        Returns:
+            Last read register value (not matching if the timeout occurred).
+        """
+        if not self._supports(SocketRegIfPacket.Operation.WAIT_FOR):
+            return super()._wait_for(reg_address, mask, value, timeout, interval)
+        try:
+            response = self._request(
+                SocketRegIfPacket.Operation.WAIT_FOR,
+                reg_address,
+                value,
+                mask=mask,
+                timeout=timeout,
+                interval=interval,
+            )
+        except pickle.PickleError as exc:
+            raise RuntimeError(
+                "Failed to execute socket wait command "
+                f"for register 0x{reg_address:X} = 0x{value:X} (mask 0x{mask:X})."
+            ) from exc
+        if response.value is None:
+            raise RuntimeError("Wait response doesn't have a value.")
+        return response.value
+
+    def _get_many(self, reg_addresses: Sequence[int]) -> List[int]:
+        """Read multiple registers over the socket in a single round-trip.
+
+        Arguments:
+            reg_addresses -- absolute addresses of registers to read.
+
+        Returns:
+            Data from the registers.
+        """
+        if not self._supports(SocketRegIfPacket.Operation.GET_MANY):
+            return super()._get_many(reg_addresses)
+        try:
+            response = self._request(
+                SocketRegIfPacket.Operation.GET_MANY,
+                reg_addresses=list(reg_addresses),
+            )
+        except pickle.PickleError as exc:
+            raise RuntimeError(
+                f"Failed to execute socket bulk get command for {len(reg_addresses)} registers."
+            ) from exc
+        if response.values is None or len(response.values) != len(reg_addresses):
+            raise RuntimeError("Bulk get response doesn't have matching values.")
+        return response.values
+
+    def _set_many(self, reg_addresses: Sequence[int], values: Sequence[int]) -> None:
+        """Write multiple registers over the socket in a single round-trip.
+
+        Arguments:
+            reg_addresses -- absolute addresses of registers to write to.
+            values -- values to write to the registers.
+        """
+        if not self._supports(SocketRegIfPacket.Operation.SET_MANY):
+            super()._set_many(reg_addresses, values)
+            return
+        try:
+            self._request(
+                SocketRegIfPacket.Operation.SET_MANY,
+                reg_addresses=list(reg_addresses),
+                values=list(values),
+            )
+        except pickle.PickleError as exc:
+            raise RuntimeError(
+                f"Failed to execute socket bulk set command for {len(reg_addresses)} registers."
+            ) from exc
+
+    def _emulate_batch(
+        self, operations: List[SocketRegIfPacket.BatchOp], continue_on_error: bool
+    ) -> List[SocketRegIfPacket.BatchResult]:
+        """Execute batch operation by operation for servers not supporting it.
+
+        Arguments:
+            operations -- operations to execute.
+            continue_on_error -- don't stop on the first failed operation.
+
+        Returns:
+            Results of the operations.
+        """
+        results: List[SocketRegIfPacket.BatchResult] = []
+        for batch_op in operations:
+            value: Optional[int] = None
+            try:
+                if batch_op.operation == SocketRegIfPacket.Operation.GET:
+                    value = self._get(batch_op.reg_address)
+                elif batch_op.operation == SocketRegIfPacket.Operation.SET:
+                    self._set(batch_op.reg_address, batch_op.value)  # type: ignore
+                else:
+                    value = self._modify(
+                        batch_op.reg_address, batch_op.mask, batch_op.value  # type: ignore
+                    )
+            except RuntimeError as exc:
+                results.append(
+                    SocketRegIfPacket.BatchResult(
+                        SocketRegIfPacket.Status.RESPONSE_ERROR, None, str(exc)
+                    )
+                )
+                if not continue_on_error:
+                    break
+                continue
+            results.append(
+                SocketRegIfPacket.BatchResult(
+                    SocketRegIfPacket.Status.RESPONSE_OK, value
+                )
+            )
+        return results
+
+    def _sanitize_batch_op(self, batch_op: SocketRegIfPacket.BatchOp) -> None:
+        """Validate arguments of a batch operation and trace writes.
+
+        Raises:
+            ValueError: invalid operation arguments.
+        """
+        if batch_op.operation == SocketRegIfPacket.Operation.GET:
+            self._sanitize_field_args(batch_op.reg_address)
+        elif batch_op.operation == SocketRegIfPacket.Operation.SET:
+            if batch_op.value is None:
+                raise ValueError("Set operation of a batch requires a value.")
+            self._sanitize_field_args(batch_op.reg_address, value=batch_op.value)
+            self._trace(self._Operation.SET, batch_op.reg_address, batch_op.value)
+        elif batch_op.operation == SocketRegIfPacket.Operation.MODIFY:
+            if batch_op.value is None or batch_op.mask is None:
+                raise ValueError(
+                    "Modify operation of a batch requires a value and a mask."
+                )
+            self._sanitize_masked_args(
+                batch_op.reg_address, batch_op.mask, batch_op.value
+            )
+        else:
+            raise ValueError(
+                f'Operation "{batch_op.operation}" not supported in batch.'
+            )
+
+    def batch(
+        self,
+        operations: Iterable[SocketRegIfPacket.BatchOp],
+        continue_on_error: bool = False,
+    ) -> List[SocketRegIfPacket.BatchResult]:
+        """Execute a sequence of mixed operations in a single round-trip.
+
+        The server executes the operations in order. Failure of an operation is
+        reported in its result instead of raising an exception. Transactions
+        are not supported.
+
+        Arguments:
+            operations -- GET, SET and MODIFY operations to execute.
+
+        Keyword Arguments:
+            continue_on_error -- execute all the operations even if some of them
+                fail. Otherwise the batch stops on the first failed operation
+                and the result list ends with it.
+
+        Returns:
+            Results of the executed operations in order of `operations`.
+
+        Raises:
+            ValueError: invalid operation arguments.
+            RuntimeError: called inside a transaction or the batch as a whole
+                failed.
+        """
+        if self._transaction is not None:
+            raise RuntimeError("Batch access is not supported in transactions.")
+        operations = list(operations)
+        for batch_op in operations:
+            self._sanitize_batch_op(batch_op)
+
+        if not self._supports(SocketRegIfPacket.Operation.BATCH):
+            results = self._emulate_batch(operations, continue_on_error)
+        else:
+            try:
+                response = self._submit(
+                    SocketRegIfPacket.Operation.BATCH,
+                    batch=operations,
+                    continue_on_error=continue_on_error,
+                ).result()
+            except pickle.PickleError as exc:
+                raise RuntimeError(
+                    f"Failed to execute socket batch command of {len(operations)} operations."
+                ) from exc
+            if response.batch_results is None or len(response.batch_results) > len(
+                operations
+            ):
+                raise RuntimeError("Batch response doesn't have matching results.")
+            results = response.batch_results
+
+        if self._trace_active:
+            for batch_op, result in zip(operations, results):
+                if (
+                    batch_op.operation != SocketRegIfPacket.Operation.SET
+                    and result.value is not None
+                ):
+                    self._trace(self._Operation.GET, batch_op.reg_address, result.value)
+        return results
+
+    def run_sequence(self, sequence: RegSequence) -> Dict[str, int]:
+        """Execute a register access sequence on the server side.
+
+        The whole sequence takes a single round-trip and its timing doesn't
+        depend on the link latency. Sequences are executed locally step by
+        step if the server doesn't support them. Transactions are not
+        supported.
+
+        Arguments:
+            sequence -- sequence to execute.
+
+        Returns:
+            Captured values.
+
+        Raises:
+            ValueError: invalid step arguments.
+            RuntimeError: called inside a transaction or the sequence failed
+                (`SequenceError` if executed locally).
+        """
+        if self._transaction is not None:
+            raise RuntimeError("Sequences are not supported in transactions.")
+        if not self._supports(SocketRegIfPacket.Operation.SEQUENCE):
+            return sequence.run(self)
+
+        for step in sequence.steps:
+            if step.operation == SequenceOperation.DELAY:
+                continue
+            self._sanitize_field_args(step.reg_address, value=step.value)
+            if step.operation == SequenceOperation.SET:
+                self._trace(self._Operation.SET, step.reg_address, step.value)
+            elif step.operation != SequenceOperation.GET:
+                self._sanitize_masked_args(step.reg_address, step.mask, step.value)
+        try:
+            response = self._submit(
+                SocketRegIfPacket.Operation.SEQUENCE, sequence=sequence.steps
+            ).result()
+        except pickle.PickleError as exc:
+            raise RuntimeError(
+                f"Failed to execute socket sequence command of {len(sequence)} steps."
+            ) from exc
+        if response.captures is None:
+            raise RuntimeError("Sequence response doesn't have captures.")
+        return response.captures
+
+    def subscribe(
+        self,
+        reg_addresses: Iterable[int],
+        period: float = 0.1,
+        callback: Optional[Callable[[SocketRegIfPacket.Change], None]] = None,
+    ) -> SocketRegIfSubscription:
+        """Subscribe to changes of register values.
+
+        The server samples the registers with the given period and pushes only
+        the changed values. Identical subscriptions of all the clients are
+        sampled once. Servers not supporting subscriptions are polled by a
+        client thread instead.
+
+        The callback is called from the receiver thread, so it must not wait
+        for responses of this client.
+
+        Arguments:
+            reg_addresses -- absolute addresses of registers to watch.
+
+        Keyword Arguments:
+            period -- sampling period in seconds.
+            callback -- function called with every change. If not provided,
+                changes are queued in the subscription.
+
+        Returns:
+            Open subscription with the current register values.
+
+        Raises:
+            ValueError: invalid addresses or period.
+            RuntimeError: called inside a transaction or the subscription failed.
+        """
+        if self._transaction is not None:
+            raise RuntimeError("Subscriptions are not supported in transactions.")
+        reg_addresses = list(reg_addresses)
+        self._sanitize_bulk_args(reg_addresses)
+        if period <= 0:
+            raise ValueError(f"Invalid subscription period: {period}.")
+
+        if not self._supports(SocketRegIfPacket.Operation.SUBSCRIBE):
+            subscription = SocketRegIfSubscription(reg_addresses, period, callback)
+            subscription._snapshot(  # pylint: disable=protected-access
+                self._get_many(reg_addresses)
+            )
+            Thread(target=self._poll, args=(subscription,), daemon=True).start()
+            return subscription
+
+        subscription = SocketRegIfSubscription(
+            reg_addresses, period, callback, self._unsubscribe
+        )
+        try:
+            response = self._submit(
+                SocketRegIfPacket.Operation.SUBSCRIBE,
+                reg_addresses=reg_addresses,
+                interval=period,
+                subscription=subscription,
+            ).result()
+            if response.values is None or len(response.values) != len(reg_addresses):
+                raise RuntimeError("Subscribe response doesn't have matching values.")
+        except pickle.PickleError as exc:
+            subscription.close()
+            raise RuntimeError(
+                f"Failed to subscribe to {len(reg_addresses)} registers."
+            ) from exc
+        except RuntimeError:
+            subscription.close()
+            raise
+        subscription._snapshot(response.values)  # pylint: disable=protected-access
+        return subscription
+
+    def _unsubscribe(self, subscription: SocketRegIfSubscription) -> None:
+        """Cancel a subscription on the server without waiting for the response."""
+        with self._pending_lock:
+            subscription_id = next(
+                (
+                    subscription_id
+                    for subscription_id, registered in self._subscriptions.items()
+                    if registered is subscription
+                ),
+                None,
+            )
+            if subscription_id is None:
+                return
+            del self._subscriptions[subscription_id]
+        try:
+            self._submit(
+                SocketRegIfPacket.Operation.UNSUBSCRIBE, reg_address=subscription_id
+            )
+        except RuntimeError:
+            # The connection is closed, so the subscription is gone anyway.
+            pass
+
+    def _poll(self, subscription: SocketRegIfSubscription) -> None:
+        """Emulate a subscription by polling the registers.
+
+        Runs in a polling thread until the subscription or the connection is
+        closed.
+        """
+        # pylint: disable=protected-access
+        while not subscription._closed.wait(subscription.period):
+            try:
+                values = self._get_many(subscription.reg_addresses)
+            except RuntimeError:
+                break
+            timestamp = time.time()
+            subscription._notify(
+                [
+                    SocketRegIfPacket.Change(
+                        reg_address, subscription.values[reg_address], value, timestamp
+                    )
+                    for reg_address, value in zip(subscription.reg_addresses, values)
+                    if subscription.values[reg_address] != value
+                ]
+            )
+        subscription._end()
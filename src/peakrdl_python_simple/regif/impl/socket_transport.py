@@ -0,0 +1,269 @@
+"""Transports of the socket register interface protocol.
+
+Messages are framed like in `multiprocessing.connection` and carried over
+TCP, a Unix domain socket or a shared memory channel set up over a Unix
+domain socket.
+"""
+
+__authors__ = ["Marek Pikuła <marek.pikula at embevity.com>"]
+
+import os
+import select
+import socket
+import stat
+import struct
+from multiprocessing.connection import Client, Connection
+from typing import Any, Optional, Tuple, Union
+
+from .shared_memory import SHARED_MEMORY_ENABLED, SharedMemoryChannel
+
+_FRAME_HEADER = struct.Struct("!i")
+"""Message header of `multiprocessing.connection` (message length)."""
+
+_FRAME_LONG_HEADER = struct.Struct("!Q")
+"""Extended message length, used if the header length is -1."""
+
+
+SocketAddress = Union[Tuple[str, int], str]
+"""Server address: (host, port) pair for TCP, a path for a Unix domain socket
+or a path prefixed with `SHARED_MEMORY_PREFIX` for the shared memory transport."""
+
+SHARED_MEMORY_PREFIX = "shm:"
+"""Address prefix of the shared memory transport (followed by the Unix domain
+socket path of the server)."""
+
+_CHANNEL_MAGIC = 0xC5
+"""First byte of shared memory channel setup messages."""
+
+_CHANNEL_SETUP = struct.Struct("!BI")
+"""Shared memory channel setup message: magic and ring capacity (0 in requests)."""
+
+_CHANNEL_RETRY_INTERVAL = 0.01
+"""Interval of retrying writes to a full shared memory ring in seconds."""
+
+
+def _address_str(address: Any) -> str:
+    """Format a socket address for logging."""
+    if isinstance(address, tuple):
+        return f"{address[0]}:{address[1]}"
+    return address or "local client"
+
+
+def _unix_path(address: str) -> str:
+    """Get Unix domain socket path from an address."""
+    if address.startswith(SHARED_MEMORY_PREFIX):
+        return address[len(SHARED_MEMORY_PREFIX) :]
+    return address
+
+
+def _frame(data: bytes) -> bytes:
+    """Frame a message like `multiprocessing.connection.Connection.send_bytes()`."""
+    if len(data) > 0x7FFFFFFF:
+        return _FRAME_HEADER.pack(-1) + _FRAME_LONG_HEADER.pack(len(data)) + data
+    return _FRAME_HEADER.pack(len(data)) + data
+
+
+def _frame_size(buffer: bytearray, offset: int) -> Tuple[Optional[int], int]:
+    """Get size of a framed message starting at the offset.
+
+    Returns:
+        Message size (None if the header is incomplete) and header size pair.
+    """
+    if len(buffer) - offset < _FRAME_HEADER.size:
+        return None, 0
+    (size,) = _FRAME_HEADER.unpack_from(buffer, offset)
+    if size != -1:
+        return size, _FRAME_HEADER.size
+    header_size = _FRAME_HEADER.size + _FRAME_LONG_HEADER.size
+    if len(buffer) - offset < header_size:
+        return None, 0
+    (size,) = _FRAME_LONG_HEADER.unpack_from(buffer, offset + _FRAME_HEADER.size)
+    return size, header_size
+
+
+def _listen(
+    address: SocketAddress, backlog: int, permissions: Optional[int] = None
+) -> Tuple[socket.socket, Optional[str]]:
+    """Create a non-blocking listening socket.
+
+    Arguments:
+        address -- host, port number pair or Unix domain socket path
+            (optionally with the shared memory prefix). A stale socket file is
+            replaced.
+        backlog -- maximum number of pending connections.
+
+    Keyword Arguments:
+        permissions -- permission bits of the Unix domain socket file.
+
+    Returns:
+        The socket and the Unix domain socket path (None for TCP).
+    """
+    path: Optional[str] = None
+    if isinstance(address, str):
+        path = _unix_path(address)
+        if os.path.exists(path) and stat.S_ISSOCK(os.stat(path).st_mode):
+            os.unlink(path)
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(path)
+        if permissions is not None:
+            os.chmod(path, permissions)
+    else:
+        family = socket.AF_INET6 if ":" in address[0] else socket.AF_INET
+        listener = socket.socket(family, socket.SOCK_STREAM)
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.bind(address)
+    listener.listen(backlog)
+    listener.setblocking(False)
+    return listener, path
+
+
+def _offer_channel(sock: socket.socket, capacity: int) -> SharedMemoryChannel:
+    """Create a shared memory channel and send its descriptors to the client.
+
+    Arguments:
+        sock -- Unix domain socket of the client connection.
+        capacity -- capacity of each ring of the channel in bytes.
+
+    Returns:
+        The channel.
+
+    Raises:
+        OSError: the channel couldn't be created or sent.
+    """
+    channel = SharedMemoryChannel.create(capacity)
+    try:
+        message = _frame(_CHANNEL_SETUP.pack(_CHANNEL_MAGIC, capacity))
+        socket.send_fds(sock, [message], channel.fds)
+    except OSError:
+        channel.close()
+        raise
+    return channel
+
+
+class _SharedMemoryConnection:
+    """`multiprocessing.connection.Connection` counterpart over shared memory.
+
+    Sets up a shared memory channel over a Unix domain socket connection,
+    which is then used only to detect closing of the connection by either
+    side. Supports a single sending and a single receiving thread.
+    """
+
+    def __init__(self, path: str):
+        """Connect to the server and set up the channel.
+
+        Arguments:
+            path -- Unix domain socket path of the server.
+
+        Raises:
+            RuntimeError: the shared memory transport isn't supported.
+            EOFError: the server closed the connection during the setup.
+        """
+        if not SHARED_MEMORY_ENABLED:
+            raise RuntimeError(
+                "Shared memory transport is not supported on this platform."
+            )
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            self._sock.connect(path)
+            self._sock.sendall(_frame(_CHANNEL_SETUP.pack(_CHANNEL_MAGIC, 0)))
+            message, fds, _, _ = socket.recv_fds(
+                self._sock, _FRAME_HEADER.size + _CHANNEL_SETUP.size, 4
+            )
+            if len(message) != _FRAME_HEADER.size + _CHANNEL_SETUP.size:
+                for fd in fds:
+                    os.close(fd)
+                raise EOFError("Shared memory channel setup failed.")
+            magic, capacity = _CHANNEL_SETUP.unpack_from(message, _FRAME_HEADER.size)
+            if magic != _CHANNEL_MAGIC:
+                raise EOFError("Shared memory channel setup failed.")
+            self._channel = SharedMemoryChannel.attach(fds, capacity)
+        except Exception:
+            self._sock.close()
+            raise
+        self._buffer = bytearray()
+        self._data_poll = select.poll()
+        self._space_poll = select.poll()
+        for poll, fd in (
+            (self._data_poll, self._channel.data_fd),
+            (self._space_poll, self._channel.space_fd),
+        ):
+            poll.register(fd, select.POLLIN)
+            poll.register(self._sock, select.POLLIN)
+
+    @property
+    def closed(self) -> bool:
+        """Check whether the connection is closed."""
+        return self._channel.closed
+
+    def fileno(self) -> int:
+        """Get descriptor of the socket (shut down to close the connection)."""
+        return self._sock.fileno()
+
+    def close(self) -> None:
+        """Close the connection."""
+        if self._channel.closed:
+            return
+        self._channel.close()
+        self._sock.close()
+
+    def _wait(
+        self, poll: "select.poll", fd: int, timeout: Optional[float] = None
+    ) -> None:
+        """Wait for the channel event or closing of the connection.
+
+        Raises:
+            EOFError: the connection is closed.
+        """
+        ready = poll.poll(None if timeout is None else timeout * 1000)
+        if ready and all(ready_fd != fd for ready_fd, _ in ready):
+            raise EOFError("Connection closed.")
+        self._channel.clear(fd)
+
+    def send_bytes(self, data: bytes) -> None:
+        """Send a message, waiting for space in the ring if needed.
+
+        Raises:
+            EOFError: the connection is closed.
+        """
+        view = memoryview(_frame(data))
+        view = view[self._channel.send(view) :]
+        if len(view) == 0:
+            return
+        self._channel.wait_for_space(True)
+        try:
+            while len(view) > 0:
+                sent = self._channel.send(view)
+                if sent == 0:
+                    self._wait(
+                        self._space_poll,
+                        self._channel.space_fd,
+                        _CHANNEL_RETRY_INTERVAL,
+                    )
+                view = view[sent:]
+        finally:
+            self._channel.wait_for_space(False)
+
+    def recv_bytes(self) -> bytes:
+        """Receive a message, waiting for it if needed.
+
+        Raises:
+            EOFError: the connection is closed.
+        """
+        while True:
+            size, header_size = _frame_size(self._buffer, 0)
+            if size is not None and header_size + size <= len(self._buffer):
+                message = bytes(self._buffer[header_size : header_size + size])
+                del self._buffer[: header_size + size]
+                return message
+            data = self._channel.receive()
+            if data:
+                self._buffer += data
+            else:
+                self._wait(self._data_poll, self._channel.data_fd)
+
+
+def _connect(address: SocketAddress) -> Union[Connection, _SharedMemoryConnection]:
+    """Connect to the server using the transport selected by the address."""
+    if isinstance(address, str) and address.startswith(SHARED_MEMORY_PREFIX):
+        return _SharedMemoryConnection(_unix_path(address))
+    return Client(address)
@@ -0,0 +1,260 @@
+"""Register interface access metrics."""
+
+__authors__ = ["Marek Pikuła <marek.pikula at embevity.com>"]
+
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+
+def latency_bucket(latency_ns: int) -> int:
+    """Get histogram bucket index of a latency.
+
+    Buckets are log-linear (HDR-style): each power of two is split into four
+    equally wide buckets, which gives at most 25% relative error.
+
+    Arguments:
+        latency_ns -- latency in nanoseconds.
+
+    Returns:
+        Bucket index.
+    """
+    exponent = latency_ns.bit_length()
+    if exponent <= 2:
+        return latency_ns
+    return (exponent - 2) * 4 + ((latency_ns >> (exponent - 3)) & 3)
+
+
+def latency_bucket_start(bucket: int) -> int:
+    """Get the lowest latency (in nanoseconds) falling into the bucket."""
+    if bucket < 4:
+        return bucket
+    return (4 + bucket % 4) << (bucket // 4 - 1)
+
+
+class AccessStats:  # pylint: disable=too-many-instance-attributes
+    """Access statistics of a register or a group of registers."""
+
+    __slots__ = (
+        "reads",
+        "writes",
+        "bytes_read",
+        "bytes_written",
+        "read_time_ns",
+        "write_time_ns",
+        "read_latency",
+        "write_latency",
+    )
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.reads = 0
+        """Number of register reads."""
+
+        self.writes = 0
+        """Number of register writes."""
+
+        self.bytes_read = 0
+        """Number of bytes read."""
+
+        self.bytes_written = 0
+        """Number of bytes written."""
+
+        self.read_time_ns = 0
+        """Total time spent on reads in nanoseconds."""
+
+        self.write_time_ns = 0
+        """Total time spent on writes in nanoseconds."""
+
+        self.read_latency: Dict[int, int] = {}
+        """Read latency histogram (bucket index to count)."""
+
+        self.write_latency: Dict[int, int] = {}
+        """Write latency histogram (bucket index to count)."""
+
+    @property
+    def total_time_ns(self) -> int:
+        """Get total time spent on accesses in nanoseconds."""
+        return self.read_time_ns + self.write_time_ns
+
+    def merge(self, other: "AccessStats") -> None:
+        """Add statistics from `other` to this one."""
+        self.reads += other.reads
+        self.writes += other.writes
+        self.bytes_read += other.bytes_read
+        self.bytes_written += other.bytes_written
+        self.read_time_ns += other.read_time_ns
+        self.write_time_ns += other.write_time_ns
+        for bucket, count in other.read_latency.items():
+            self.read_latency[bucket] = self.read_latency.get(bucket, 0) + count
+        for bucket, count in other.write_latency.items():
+            self.write_latency[bucket] = self.write_latency.get(bucket, 0) + count
+
+    @staticmethod
+    def percentile(histogram: Dict[int, int], fraction: float) -> int:
+        """Estimate latency percentile from a histogram.
+
+        Arguments:
+            histogram -- latency histogram (bucket index to count).
+            fraction -- percentile as a fraction (e.g., 0.99).
+
+        Returns:
+            Lower bound of the bucket containing the percentile in nanoseconds.
+        """
+        total = sum(histogram.values())
+        seen = 0
+        for bucket in sorted(histogram):
+            seen += histogram[bucket]
+            if seen >= total * fraction:
+                return latency_bucket_start(bucket)
+        return 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Convert the statistics to a dictionary.
+
+        Histograms are keyed by the lowest latency of a bucket in nanoseconds.
+        """
+        return {
+            "reads": self.reads,
+            "writes": self.writes,
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "read_time_ns": self.read_time_ns,
+            "write_time_ns": self.write_time_ns,
+            "read_latency_ns": {
+                latency_bucket_start(bucket): count
+                for bucket, count in sorted(self.read_latency.items())
+            },
+            "write_latency_ns": {
+                latency_bucket_start(bucket): count
+                for bucket, count in sorted(self.write_latency.items())
+            },
+        }
+
+
+class RegIfMetrics:
+    """Per-address access metrics of a register interface.
+
+    Enabled with `RegisterInterface.metrics_enabled`. Time of bulk operations
+    is split evenly between accessed registers and time of read-modify-write
+    operations is split evenly between the read and the write, so the total
+    access time isn't counted twice.
+    """
+
+    def __init__(self, data_bytes: int):
+        """Initialize empty metrics.
+
+        Arguments:
+            data_bytes -- register width in bytes.
+        """
+        self._data_bytes = data_bytes
+        self._stats: Dict[int, AccessStats] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        reg_addresses: Iterable[int],
+        elapsed_ns: int,
+        read: bool = False,
+        write: bool = False,
+    ) -> None:
+        """Record an access.
+
+        Arguments:
+            reg_addresses -- addresses of accessed registers.
+            elapsed_ns -- duration of the whole access in nanoseconds.
+
+        Keyword Arguments:
+            read -- the access read the registers.
+            write -- the access wrote the registers. If `read` is set as well
+                (read-modify-write), the duration is split between both.
+        """
+        reg_addresses = list(reg_addresses)
+        if len(reg_addresses) == 0:
+            return
+        latency = elapsed_ns // len(reg_addresses)
+        if read and write:
+            latency //= 2
+        bucket = latency_bucket(latency)
+        with self._lock:
+            for reg_address in reg_addresses:
+                stats = self._stats.get(reg_address)
+                if stats is None:
+                    stats = self._stats[reg_address] = AccessStats()
+                if read:
+                    stats.reads += 1
+                    stats.bytes_read += self._data_bytes
+                    stats.read_time_ns += latency
+                    stats.read_latency[bucket] = stats.read_latency.get(bucket, 0) + 1
+                if write:
+                    stats.writes += 1
+                    stats.bytes_written += self._data_bytes
+                    stats.write_time_ns += latency
+                    stats.write_latency[bucket] = stats.write_latency.get(bucket, 0) + 1
+
+    def reset(self) -> None:
+        """Clear all the collected metrics."""
+        with self._lock:
+            self._stats.clear()
+
+    def per_address(self) -> Dict[int, AccessStats]:
+        """Get a snapshot of statistics of all accessed registers."""
+        with self._lock:
+            ret: Dict[int, AccessStats] = {}
+            for reg_address, stats in self._stats.items():
+                ret[reg_address] = AccessStats()
+                ret[reg_address].merge(stats)
+            return ret
+
+    def summary(self, address_range: Optional[range] = None) -> AccessStats:
+        """Get statistics merged over a range of addresses.
+
+        Keyword Arguments:
+            address_range -- range of addresses to merge. If None all the
+                addresses are merged.
+        """
+        ret = AccessStats()
+        with self._lock:
+            for reg_address, stats in self._stats.items():
+                if address_range is None or reg_address in address_range:
+                    ret.merge(stats)
+        return ret
+
+    def as_dict(self) -> Dict[int, Dict[str, Any]]:
+        """Get statistics of all accessed registers as dictionaries."""
+        return {
+            reg_address: stats.as_dict()
+            for reg_address, stats in sorted(self.per_address().items())
+        }
+
+    def report(self, top: Optional[int] = None) -> str:
+        """Format a text report of registers ordered by total access time.
+
+        Keyword Arguments:
+            top -- number of registers to include. All if None.
+
+        Returns:
+            Report text.
+        """
+        per_address = sorted(
+            self.per_address().items(),
+            key=lambda item: item[1].total_time_ns,
+            reverse=True,
+        )
+        if top is not None:
+            per_address = per_address[:top]
+        lines: List[str] = [
+            f"{'address':>12} {'reads':>8} {'writes':>8} {'bytes':>10} "
+            f"{'time [us]':>12} {'p50 [ns]':>10} {'p99 [ns]':>10}"
+        ]
+        for reg_address, stats in per_address:
+            latency = dict(stats.read_latency)
+            for bucket, count in stats.write_latency.items():
+                latency[bucket] = latency.get(bucket, 0) + count
+            lines.append(
+                f"0x{reg_address:010X} {stats.reads:>8} {stats.writes:>8} "
+                f"{stats.bytes_read + stats.bytes_written:>10} "
+                f"{stats.total_time_ns / 1000:>12.1f} "
+                f"{AccessStats.percentile(latency, 0.5):>10} "
+                f"{AccessStats.percentile(latency, 0.99):>10}"
+            )
+        return "\n".join(lines)
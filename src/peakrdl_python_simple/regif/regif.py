@@ -1,12 +1,30 @@
 """Register interface abstraction."""
 
+# pylint: disable=too-many-lines
+
 __authors__ = ["Marek Pikuła <marek.pikula at embevity.com>"]
 
+import math
 import sys
+import threading
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .metrics import RegIfMetrics
 
 try:
     from loguru import logger
@@ -15,14 +33,34 @@ try:
 except ImportError:
     LOGURU_ACTIVE = False  # type: ignore
 
+try:
+    import numpy
 
-class RegisterInterface(ABC):
-    """Register interface abstraction.
+    NUMPY_ENABLED = True
+except ImportError:
+    NUMPY_ENABLED = False  # type: ignore
 
-    A basic register interface requires overriding `get()` and `set()`
-    functions, depending on underlying hardware configuration.
 
-    Example implementation can be found in the `impl` submodule.
+class WaitTimeoutError(TimeoutError):
+    """Register didn't reach the expected value before the timeout."""
+
+    def __init__(self, message: str, value: int):
+        """Initialize the exception.
+
+        Arguments:
+            message -- exception message.
+            value -- last read register value.
+        """
+        super().__init__(message)
+        self.value = value
+
+
+class RegisterInterfaceBase(ABC):
+    """Common base of synchronous and asynchronous register interfaces.
+
+    Holds the configuration and implements argument sanitization and
+    tracing. Not to be subclassed directly, see `RegisterInterface` and
+    `async_regif.AsyncRegisterInterface`.
     """
 
     def __init__(
@@ -71,6 +109,7 @@ class RegisterInterface(ABC):
                 raise ValueError("Address bounds need to be incremental.")
 
         self._data_width = data_width
+        self._data_bytes = data_width // 8
         self._address_bounds = address_bounds
 
         self._trace_active = False
@@ -115,6 +154,16 @@ class RegisterInterface(ABC):
                     f"register width ({self.data_width}) but at least 1."
                 )
 
+        @property
+        def mask(self) -> int:
+            """Mask of the field value (not shifted)."""
+            return (1 << self.width) - 1
+
+        @property
+        def shifted_mask(self) -> int:
+            """Mask of the field bits in the register."""
+            return self.mask << self.pos
+
     def _sanitize_field_args(
         self,
         reg_address: int,
@@ -152,6 +201,166 @@ class RegisterInterface(ABC):
                 f"register/field width ({bits})."
             )
 
+    def _sanitize_bulk_args(
+        self, reg_addresses: Sequence[int], values: Optional[Sequence[int]] = None
+    ):
+        """Bulk counterpart of `_sanitize_field_args()`.
+
+        The whole batch is validated in a single pass, by checking only the
+        extreme addresses and values.
+
+        Arguments:
+            reg_addresses -- register addresses.
+
+        Keyword Arguments:
+            values -- values to be written to the registers.
+
+        Raises:
+            ValueError: some inconsistency has been found.
+        """
+        if values is not None and len(values) != len(reg_addresses):
+            raise ValueError(
+                f"Number of values ({len(values)}) doesn't match "
+                f"number of register addresses ({len(reg_addresses)})."
+            )
+        if len(reg_addresses) == 0:
+            return
+
+        if isinstance(reg_addresses, range):
+            low, high = reg_addresses[0], reg_addresses[-1]
+        else:
+            low, high = min(reg_addresses), max(reg_addresses)
+        if low < 0:
+            raise ValueError(f"Register address {low} should be positive.")
+        if self._address_bounds is not None and (
+            low < self._address_bounds.start or high >= self._address_bounds.stop
+        ):
+            raise ValueError(
+                f"Register addresses 0x{low:X}-0x{high:X} not in register interface allowed range."
+            )
+
+        if values is not None and (min(values) < 0 or max(values) >> self.data_width):
+            raise ValueError(
+                f"Register values wider than register width ({self.data_width})."
+            )
+
+    def _sanitize_masked_args(self, reg_address: int, mask: int, value: int):
+        """Argument sanitizer for operations on masked register bits.
+
+        Arguments:
+            reg_address -- register address.
+            mask -- mask of the register bits.
+            value -- value of the masked bits (already shifted).
+
+        Raises:
+            ValueError: some inconsistency has been found.
+        """
+        self._sanitize_field_args(reg_address, value=mask)
+        if value & mask != value:
+            raise ValueError(
+                f"Register value (0x{value:X}) outside of the mask (0x{mask:X})."
+            )
+
+    def _sanitize_wait_args(  # pylint: disable=too-many-arguments
+        self, reg_address: int, mask: int, value: int, timeout: float, interval: float
+    ):
+        """Argument sanitizer for `wait_for()`.
+
+        Raises:
+            ValueError: some inconsistency has been found.
+        """
+        self._sanitize_masked_args(reg_address, mask, value)
+        if math.isnan(timeout) or math.isnan(interval):
+            raise ValueError("Wait timeout and interval can't be NaN.")
+
+    WAIT_MIN_INTERVAL: float = 1e-5
+    """Initial polling interval (in seconds) of `wait_for()` adaptive backoff."""
+
+    def _wait_timeout_error(
+        self, reg_address: int, mask: int, value: int, last_value: int
+    ) -> WaitTimeoutError:
+        """Create exception raised on `wait_for()` timeout."""
+        return WaitTimeoutError(
+            f"Timeout waiting for register 0x{reg_address:X} & 0x{mask:X} == 0x{value:X} "
+            f"(last value 0x{last_value:X}).",
+            last_value,
+        )
+
+    def _poll_delays(self, deadline: float, interval: float) -> Iterator[float]:
+        """Yield sleep durations between `_wait_for()` polls until the deadline.
+
+        The durations back off exponentially from `WAIT_MIN_INTERVAL` up to
+        `interval` and never exceed the remaining time.
+        """
+        delay = min(self.WAIT_MIN_INTERVAL, interval)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            yield min(delay, remaining)
+            delay = min(delay * 2, interval)
+
+    def _check_wait_result(
+        self, reg_address: int, mask: int, value: int, result: int
+    ) -> int:
+        """Trace result of `_wait_for()` and check if it matches the condition.
+
+        Raises:
+            WaitTimeoutError: the result doesn't match (the timeout occurred).
+        """
+        self._trace(self._Operation.GET, reg_address, result)
+        if result & mask != value:
+            raise self._wait_timeout_error(reg_address, mask, value, result)
+        return result
+
+    def _split_pairs(
+        self, pairs: Iterable[Tuple[int, int]]
+    ) -> Tuple[List[int], List[int]]:
+        """Split and validate (address, value) pairs of a bulk write.
+
+        Returns:
+            Register addresses and values.
+
+        Raises:
+            ValueError: some inconsistency has been found.
+        """
+        pairs = list(pairs)
+        reg_addresses = [reg_address for reg_address, _ in pairs]
+        values = [value for _, value in pairs]
+        self._sanitize_bulk_args(reg_addresses, values)
+        return reg_addresses, values
+
+    def _field_spec(
+        self,
+        reg_address: int,
+        field_pos: int,
+        field_width: int,
+        value: Optional[int] = None,
+    ) -> _FieldSpec:
+        """Validate field access arguments.
+
+        Returns:
+            Specification of the field.
+
+        Raises:
+            ValueError: some inconsistency has been found.
+        """
+        field = self._FieldSpec(field_pos, field_width, self.data_width)
+        self._sanitize_field_args(reg_address, field, value)
+        return field
+
+    def _decode_field(self, reg_address: int, reg_value: int, field: _FieldSpec) -> int:
+        """Extract the field value from the register value and trace the read."""
+        ret = (reg_value >> field.pos) & field.mask
+        if self._trace_active:
+            self._trace(self._Operation.GET, reg_address, reg_value)
+            self._trace(self._Operation.GET, reg_address, ret, field)
+        return ret
+
+    def _block_addresses(self, start: int, count: int) -> range:
+        """Get addresses of `count` consecutive registers starting at `start`."""
+        return range(start, start + count * self._data_bytes, self._data_bytes)
+
     class _Operation(Enum):
         """Register operation enum.
 
@@ -186,6 +395,14 @@ class RegisterInterface(ABC):
                 value,
             )
 
+    def _trace_many(
+        self, operation: _Operation, reg_addresses: Iterable[int], values: Iterable[int]
+    ) -> None:
+        """Trace a bulk operation (if tracing is active)."""
+        if self._trace_active:
+            for reg_address, value in zip(reg_addresses, values):
+                self._trace(operation, reg_address, value)
+
     @property
     def data_width(self):
         """Get register data width."""
@@ -196,6 +413,80 @@ class RegisterInterface(ABC):
         """Get address bounds of this register interface."""
         return self._address_bounds
 
+
+class RegisterInterface(RegisterInterfaceBase):
+    """Register interface abstraction.
+
+    A basic register interface requires overriding `get()` and `set()`
+    functions, depending on underlying hardware configuration.
+
+    Example implementation can be found in the `impl` submodule.
+    """
+
+    def __init__(
+        self,
+        data_width: int,
+        address_bounds: Optional[range] = None,
+        trace: bool = False,
+    ):
+        """Initialize register interface abstraction.
+
+        Arguments:
+            data_width -- width of data in bits, should be divisible by 8.
+
+        Keyword Arguments:
+            address_bounds -- address range, which is allowed by this register
+                interface. If not defined, addresses are not validated if they
+                are in range.
+            trace -- activate operation tracing (uses `loguru.trace()` under the hood).
+
+        Raises:
+            ValueError: raised if sanity check on the arguments doesn't pass.
+        """
+        super().__init__(data_width, address_bounds, trace)
+        self._transaction: Optional[RegisterTransaction] = None
+        self._rmw_locks: Optional[List[threading.Lock]] = None
+        self._metrics: Optional[RegIfMetrics] = None
+        self._field_cache: Dict[Tuple[int, int, int], CompiledField] = {}
+
+    FIELD_CACHE_SIZE: int = 4096
+    """Maximum number of field accessors cached by `get_field()`/`set_field()`."""
+
+    RMW_LOCK_STRIPES: int = 64
+    """Number of locks used for atomic read-modify-write operations."""
+
+    @property
+    def atomic_rmw_enabled(self) -> bool:
+        """Check if read-modify-write operations are atomic between threads."""
+        return self._rmw_locks is not None
+
+    @atomic_rmw_enabled.setter
+    def atomic_rmw_enabled(self, enabled: bool) -> None:
+        """Enable atomic read-modify-write operations.
+
+        Read-modify-write operations (`modify()`, `set_field()` and compiled
+        field writes) on the same register are serialized with a lock selected
+        by the register address out of `RMW_LOCK_STRIPES` locks. Operations on
+        different registers mostly don't contend.
+        """
+        if enabled and self._rmw_locks is None:
+            self._rmw_locks = [threading.Lock() for _ in range(self.RMW_LOCK_STRIPES)]
+        elif not enabled:
+            self._rmw_locks = None
+
+    def register_volatility(self, reg_address: int, volatile: bool) -> None:
+        """Declare whether register value can change without software access.
+
+        Used by caching register interfaces to decide which registers need to
+        always be accessed in hardware. Register access classes call it when
+        they are bound to the register interface. The default implementation
+        ignores the information.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            volatile -- True if the register value can change on its own.
+        """
+
     @abstractmethod
     def _get(self, reg_address: int) -> int:
         """Read register value abstraction."""
@@ -205,6 +496,182 @@ class RegisterInterface(ABC):
     def _set(self, reg_address: int, value: int) -> None:
         """Write register value abstraction."""
 
+    _METERED_METHODS: Tuple[str, ...] = (
+        "_get",
+        "_set",
+        "_modify",
+        "_get_many",
+        "_set_many",
+        "_read_block",
+        "_write_block",
+    )
+    """Register access implementation methods instrumented by metrics."""
+
+    @property
+    def metrics(self) -> Optional[RegIfMetrics]:
+        """Get access metrics collected by the register interface.
+
+        None if metrics collection is not enabled.
+        """
+        return self._metrics
+
+    @property
+    def metrics_enabled(self) -> bool:
+        """Check if access metrics collection is enabled."""
+        return self._metrics is not None
+
+    @metrics_enabled.setter
+    def metrics_enabled(self, enabled: bool) -> None:
+        """Enable access metrics collection.
+
+        Register access implementation methods (`_get()`, `_set()`, etc.) of
+        this instance are wrapped with counters and timers. Disabling removes
+        the wrappers and drops the collected metrics.
+        """
+        if enabled and self._metrics is None:
+            self._metrics = RegIfMetrics(self._data_bytes)
+            self._install_metrics_hooks(self._metrics)
+        elif not enabled and self._metrics is not None:
+            for name in self._METERED_METHODS:
+                self.__dict__.pop(name, None)
+            self._metrics = None
+
+    def _install_metrics_hooks(self, metrics: RegIfMetrics) -> None:
+        """Wrap register access implementation methods of the instance with metrics.
+
+        Only the outermost call is measured, so that default implementations
+        calling other access methods (e.g., `_read_block()` calling
+        `_get_many()`) aren't counted twice.
+        """
+        state = threading.local()
+
+        def meter(
+            method: Callable[..., Any],
+            addresses: Callable[..., Iterable[int]],
+            read: bool,
+            write: bool,
+        ) -> Callable[..., Any]:
+            def metered(*args):
+                if getattr(state, "active", False):
+                    return method(*args)
+                state.active = True
+                start = time.perf_counter_ns()
+                try:
+                    return method(*args)
+                finally:
+                    elapsed = time.perf_counter_ns() - start
+                    state.active = False
+                    metrics.record(addresses(*args), elapsed, read, write)
+
+            return metered
+
+        hooks = {
+            "_get": meter(self._get, lambda address: (address,), True, False),
+            "_set": meter(self._set, lambda address, _: (address,), False, True),
+            "_modify": meter(self._modify, lambda address, *_: (address,), True, True),
+            "_get_many": meter(
+                self._get_many, lambda addresses: addresses, True, False
+            ),
+            "_set_many": meter(
+                self._set_many, lambda addresses, _: addresses, False, True
+            ),
+            "_read_block": meter(self._read_block, self._block_addresses, True, False),
+            "_write_block": meter(
+                self._write_block,
+                lambda start, values: self._block_addresses(start, len(values)),
+                False,
+                True,
+            ),
+        }
+        for name, hook in hooks.items():
+            setattr(self, name, hook)
+
+    def _modify(self, reg_address: int, mask: int, value: int) -> int:
+        """Read-modify-write register value abstraction.
+
+        The default implementation calls `_get()` and `_set()`. Should be
+        overridden if the underlying hardware can modify a register in a
+        single operation.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            mask -- mask of the register bits to modify.
+            value -- new value of the masked bits (already shifted).
+
+        Returns:
+            New register value.
+        """
+        new_value = (self._get(reg_address) & ~mask) | value
+        self._set(reg_address, new_value)
+        return new_value
+
+    def _atomic_modify(self, reg_address: int, mask: int, value: int) -> int:
+        """Call `_modify()` holding the register lock if atomic RMW is enabled."""
+        locks = self._rmw_locks
+        if locks is None:
+            return self._modify(reg_address, mask, value)
+        with locks[(reg_address // self._data_bytes) % len(locks)]:
+            return self._modify(reg_address, mask, value)
+
+    def _wait_for(  # pylint: disable=too-many-arguments
+        self, reg_address: int, mask: int, value: int, timeout: float, interval: float
+    ) -> int:
+        """Poll register until masked bits are equal to the value.
+
+        The default implementation polls with `_get()` using exponential
+        backoff from `WAIT_MIN_INTERVAL` up to `interval`. Should be overridden
+        if the underlying hardware can poll more efficiently.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            mask -- mask of the register bits to compare.
+            value -- expected value of the masked bits (already shifted).
+            timeout -- maximum time to wait in seconds.
+            interval -- maximum polling interval in seconds.
+
+        Returns:
+            Last read register value (not matching if the timeout occurred).
+        """
+        deadline = time.monotonic() + timeout
+        current = self._get(reg_address)
+        for delay in self._poll_delays(deadline, interval):
+            if current & mask == value:
+                break
+            time.sleep(delay)
+            current = self._get(reg_address)
+        return current
+
+    def _get_many(self, reg_addresses: Sequence[int]) -> List[int]:
+        """Read multiple registers abstraction.
+
+        The default implementation calls `_get()` for each address. Should be
+        overridden if the underlying hardware can transfer a batch at once.
+        """
+        return [self._get(reg_address) for reg_address in reg_addresses]
+
+    def _set_many(self, reg_addresses: Sequence[int], values: Sequence[int]) -> None:
+        """Write multiple registers abstraction.
+
+        The default implementation calls `_set()` for each address. Should be
+        overridden if the underlying hardware can transfer a batch at once.
+        """
+        for reg_address, value in zip(reg_addresses, values):
+            self._set(reg_address, value)
+
+    def _read_block(self, start: int, count: int) -> List[int]:
+        """Read consecutive registers abstraction.
+
+        The default implementation falls back to `_get_many()`.
+        """
+        return self._get_many(self._block_addresses(start, count))
+
+    def _write_block(self, start: int, values: Sequence[int]) -> None:
+        """Write consecutive registers abstraction.
+
+        The default implementation falls back to `_set_many()`.
+        """
+        self._set_many(self._block_addresses(start, len(values)), values)
+
     def get(self, reg_address: int) -> int:
         """Read register value abstraction.
 
@@ -215,7 +682,10 @@ class RegisterInterface(ABC):
             Data from the register.
         """
         self._sanitize_field_args(reg_address)
-        ret = self._get(reg_address)
+        if self._transaction is None:
+            ret = self._get(reg_address)
+        else:
+            ret = self._transaction.read(reg_address)
         self._trace(self._Operation.GET, reg_address, ret)
         return ret
 
@@ -227,13 +697,205 @@ class RegisterInterface(ABC):
             value -- value to write to the register.
         """
         self._sanitize_field_args(reg_address, value=value)
+        if self._transaction is not None:
+            self._transaction.write(reg_address, value)
+            return
         self._trace(self._Operation.SET, reg_address, value)
         self._set(reg_address, value)
 
+    def modify(self, reg_address: int, mask: int, value: int) -> int:
+        """Read-modify-write register value abstraction.
+
+        Bits outside of `mask` keep their current value. The operation is
+        atomic between threads if `atomic_rmw_enabled` is set.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            mask -- mask of the register bits to modify.
+            value -- new value of the masked bits (already shifted).
+
+        Returns:
+            New register value.
+
+        Raises:
+            ValueError: value has bits set outside of the mask.
+        """
+        self._sanitize_masked_args(reg_address, mask, value)
+        if self._transaction is not None:
+            self._transaction.modify(
+                reg_address, ((1 << self.data_width) - 1) ^ mask, value
+            )
+            return self._transaction.read(reg_address)
+        ret = self._atomic_modify(reg_address, mask, value)
+        self._trace(self._Operation.SET, reg_address, ret)
+        return ret
+
+    def wait_for(  # pylint: disable=too-many-arguments
+        self,
+        reg_address: int,
+        mask: int,
+        value: int,
+        timeout: float = 1.0,
+        interval: float = 0.01,
+    ) -> int:
+        """Wait until masked register bits are equal to the value.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            mask -- mask of the register bits to compare.
+            value -- expected value of the masked bits (already shifted).
+
+        Keyword Arguments:
+            timeout -- maximum time to wait in seconds.
+            interval -- maximum polling interval in seconds. The polling starts
+                more often and backs off up to this interval.
+
+        Returns:
+            Register value matching the condition.
+
+        Raises:
+            ValueError: value has bits set outside of the mask or timeout or
+                interval is NaN.
+            WaitTimeoutError: the condition wasn't met before the timeout.
+        """
+        self._sanitize_wait_args(reg_address, mask, value, timeout, interval)
+        return self._check_wait_result(
+            reg_address,
+            mask,
+            value,
+            self._wait_for(reg_address, mask, value, timeout, interval),
+        )
+
+    def get_many(self, reg_addresses: Iterable[int]) -> List[int]:
+        """Read multiple registers at once.
+
+        Arguments are validated once for the whole batch.
+
+        Arguments:
+            reg_addresses -- absolute addresses of registers to read.
+
+        Returns:
+            Data from the registers in the order of `reg_addresses`.
+        """
+        reg_addresses = list(reg_addresses)
+        self._sanitize_bulk_args(reg_addresses)
+        if self._transaction is None:
+            ret = self._get_many(reg_addresses)
+        else:
+            ret = self._transaction.read_many(reg_addresses)
+        self._trace_many(self._Operation.GET, reg_addresses, ret)
+        return ret
+
+    def set_many(self, pairs: Iterable[Tuple[int, int]]) -> None:
+        """Write multiple registers at once.
+
+        Arguments are validated once for the whole batch.
+
+        Arguments:
+            pairs -- (absolute register address, value) pairs to write in order.
+        """
+        reg_addresses, values = self._split_pairs(pairs)
+        if self._transaction is not None:
+            self._transaction.write_many(reg_addresses, values)
+            return
+        self._trace_many(self._Operation.SET, reg_addresses, values)
+        self._set_many(reg_addresses, values)
+
+    def read_block(self, start: int, count: int) -> List[int]:
+        """Read a block of consecutive registers.
+
+        Arguments:
+            start -- absolute address of the first register.
+            count -- number of registers to read.
+
+        Returns:
+            Data from the registers in order of increasing address.
+        """
+        self._sanitize_bulk_args(self._block_addresses(start, count))
+        if self._transaction is None:
+            ret = self._read_block(start, count)
+        else:
+            ret = self._transaction.read_many(self._block_addresses(start, count))
+        if self._trace_active:
+            for reg_address, value in zip(self._block_addresses(start, count), ret):
+                self._trace(self._Operation.GET, reg_address, value)
+        return ret
+
+    def write_block(self, start: int, values: Sequence[int]) -> None:
+        """Write a block of consecutive registers.
+
+        Arguments:
+            start -- absolute address of the first register.
+            values -- values to write in order of increasing address.
+        """
+        reg_addresses = self._block_addresses(start, len(values))
+        self._sanitize_bulk_args(reg_addresses, values)
+        if self._transaction is not None:
+            self._transaction.write_many(reg_addresses, values)
+            return
+        if self._trace_active:
+            for reg_address, value in zip(reg_addresses, values):
+                self._trace(self._Operation.SET, reg_address, value)
+        self._write_block(start, values)
+
+    def _numpy_dtype(self) -> "numpy.dtype":
+        """Get NumPy data type of register values.
+
+        It's a little-endian unsigned integer for natively supported data
+        widths and Python object (int) otherwise.
+
+        Raises:
+            RuntimeError: NumPy is not installed.
+        """
+        if not NUMPY_ENABLED:
+            raise RuntimeError(
+                "NumPy not installed. "
+                'Reinstall with "numpy" extra (e.g., '
+                "`pip install peakrdl-python-simple[numpy]`)."
+            )
+        if self._data_bytes in (1, 2, 4, 8):
+            return numpy.dtype(f"<u{self._data_bytes}")
+        return numpy.dtype(object)
+
+    def read_array(self, start: int, count: int) -> "numpy.ndarray":
+        """Read a block of consecutive registers into a NumPy array.
+
+        The default implementation converts the result of `read_block()`.
+
+        Arguments:
+            start -- absolute address of the first register.
+            count -- number of registers to read.
+
+        Returns:
+            One-dimensional array of register values.
+
+        Raises:
+            RuntimeError: NumPy is not installed.
+        """
+        dtype = self._numpy_dtype()
+        return numpy.array(self.read_block(start, count), dtype=dtype)
+
+    def write_array(self, start: int, values: "numpy.ndarray") -> None:
+        """Write a NumPy array to a block of consecutive registers.
+
+        The default implementation uses `write_block()`.
+
+        Arguments:
+            start -- absolute address of the first register.
+            values -- array of register values. Multi-dimensional arrays are
+                written in C (row-major) order.
+
+        Raises:
+            RuntimeError: NumPy is not installed.
+        """
+        self._numpy_dtype()
+        self.write_block(start, [int(value) for value in numpy.ravel(values)])
+
     def get_field(self, reg_address: int, field_pos: int, field_width: int) -> int:
         """Read register field abstraction.
 
-        It sanitized arguments to ensure nothing is out of bounds.
+        Arguments are validated on the first access to the field, which is
+        then accessed with a cached `CompiledField` (see `compile_field()`).
 
         The default implementation can be overloaded, but
         `_sanitize_field_args()` should be called in the
@@ -247,12 +909,7 @@ class RegisterInterface(ABC):
         Returns:
             Value in given field in given register.
         """
-        field = self._FieldSpec(field_pos, field_width, self.data_width)
-        self._sanitize_field_args(reg_address, field)
-
-        ret = (self.get(reg_address) >> field_pos) & ((1 << field_width) - 1)
-        self._trace(self._Operation.GET, reg_address, ret, field)
-        return ret
+        return self._cached_field(reg_address, field_pos, field_width).read()
 
     def set_field(  # pylint: disable=too-many-arguments
         self,
@@ -264,7 +921,8 @@ class RegisterInterface(ABC):
     ) -> None:
         """Write register field abstraction.
 
-        It sanitized arguments to ensure nothing is out of bounds.
+        Arguments are validated on the first access to the field, which is
+        then accessed with a cached `CompiledField` (see `compile_field()`).
 
         The default implementation can be overloaded, but
         `_sanitize_field_args()` should be called in the
@@ -279,14 +937,264 @@ class RegisterInterface(ABC):
         Keyword Arguments:
             ignore_other_fields -- if set to True, other fields current values are ignored.
         """
-        field = self._FieldSpec(field_pos, field_width, self.data_width)
-        self._sanitize_field_args(reg_address, field, value)
-
-        field_negative_mask = ((1 << self.data_width) - 1) ^ (
-            ((1 << field_width) - 1) << field_pos
-        )
-        prev_reg_value = (
-            0 if ignore_other_fields else self.get(reg_address) & field_negative_mask
+        self._cached_field(reg_address, field_pos, field_width).write(
+            value, ignore_other_fields
         )
-        self._trace(self._Operation.SET, reg_address, value, field)
-        self.set(reg_address, prev_reg_value | (value << field_pos))
+
+    def compile_field(
+        self, reg_address: int, field_pos: int, field_width: int
+    ) -> "CompiledField":
+        """Create a precompiled accessor of a register field.
+
+        Arguments are validated and masks are computed only once, so the
+        accessor is the fastest way to repeatedly access the same field.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            field_pos -- field position in the register (counting from LSB).
+            field_width -- width of the field in bits.
+
+        Returns:
+            Field accessor bound to this register interface.
+        """
+        return CompiledField(self, reg_address, field_pos, field_width)
+
+    def _cached_field(
+        self, reg_address: int, field_pos: int, field_width: int
+    ) -> "CompiledField":
+        """Get field accessor compiled on first use, so arguments are validated once.
+
+        The cache is dropped when it reaches `FIELD_CACHE_SIZE` entries.
+        """
+        key = (reg_address, field_pos, field_width)
+        compiled = self._field_cache.get(key)
+        if compiled is None:
+            compiled = self.compile_field(reg_address, field_pos, field_width)
+            if len(self._field_cache) >= self.FIELD_CACHE_SIZE:
+                self._field_cache.clear()
+            self._field_cache[key] = compiled
+        return compiled
+
+    @contextmanager
+    def transaction(
+        self, sort_by_address: bool = False
+    ) -> Iterator["RegisterTransaction"]:
+        """Coalesce register writes into a single write per register.
+
+        Within the context all the writes are buffered and reads see the
+        buffered values. Each touched register is read from the hardware at
+        most once (for field read-modify-write) and written exactly once when
+        the context exits. If an exception is raised inside the context, the
+        buffered writes are discarded.
+
+        Nested transactions join the outermost one. The transaction is bound
+        to the register interface, so it affects all the users of it.
+
+        Keyword Arguments:
+            sort_by_address -- commit registers in the address order instead of
+                the order in which they were first touched.
+
+        Yields:
+            The active transaction.
+        """
+        if self._transaction is not None:
+            yield self._transaction
+            return
+
+        transaction = RegisterTransaction(self, sort_by_address)
+        self._transaction = transaction
+        try:
+            yield transaction
+        finally:
+            self._transaction = None
+        transaction.commit()
+
+
+class RegisterTransaction:
+    """Register write transaction.
+
+    Use `RegisterInterface.transaction()` to create it. Arguments are
+    validated by the register interface before they reach the transaction.
+    """
+
+    def __init__(self, regif: RegisterInterface, sort_by_address: bool = False):
+        """Initialize an empty transaction.
+
+        Arguments:
+            regif -- register interface to commit the writes to.
+
+        Keyword Arguments:
+            sort_by_address -- commit registers in the address order instead of
+                the order in which they were first touched.
+        """
+        self._regif = regif
+        self._sort_by_address = sort_by_address
+        self._pending: Dict[int, int] = {}
+
+    @property
+    def pending(self) -> Dict[int, int]:
+        """Get a copy of buffered register values."""
+        return dict(self._pending)
+
+    def read(self, reg_address: int) -> int:
+        """Read register value, preferring the buffered one."""
+        if reg_address in self._pending:
+            return self._pending[reg_address]
+        return self._regif._get(reg_address)  # pylint: disable=protected-access
+
+    def read_many(self, reg_addresses: Sequence[int]) -> List[int]:
+        """Read multiple register values, preferring the buffered ones."""
+        pending = self._pending
+        missing = [address for address in reg_addresses if address not in pending]
+        values = dict(pending)
+        if len(missing) > 0:
+            # pylint: disable-next=protected-access
+            values.update(zip(missing, self._regif._get_many(missing)))
+        return [values[reg_address] for reg_address in reg_addresses]
+
+    def write(self, reg_address: int, value: int) -> None:
+        """Buffer register write."""
+        self._pending[reg_address] = value
+
+    def write_many(self, reg_addresses: Sequence[int], values: Sequence[int]) -> None:
+        """Buffer multiple register writes."""
+        self._pending.update(zip(reg_addresses, values))
+
+    def modify(
+        self,
+        reg_address: int,
+        negative_mask: int,
+        bits: int,
+        ignore_other_fields: bool = False,
+    ) -> None:
+        """Buffer register read-modify-write.
+
+        The register is read from the hardware only if it hasn't been touched
+        in this transaction yet.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            negative_mask -- mask of the register bits to preserve.
+            bits -- already shifted bits to set.
+
+        Keyword Arguments:
+            ignore_other_fields -- if set to True, other fields current values are ignored.
+        """
+        prev_reg_value = 0 if ignore_other_fields else self.read(reg_address)
+        self._pending[reg_address] = (prev_reg_value & negative_mask) | bits
+
+    def commit(self) -> None:
+        """Write all the buffered registers and clear the buffer."""
+        pending = self._pending
+        self._pending = {}
+        reg_addresses = sorted(pending) if self._sort_by_address else list(pending)
+        values = [pending[reg_address] for reg_address in reg_addresses]
+        # pylint: disable=protected-access
+        if self._regif._trace_active:
+            for reg_address, value in zip(reg_addresses, values):
+                self._regif._trace(self._regif._Operation.SET, reg_address, value)
+        if len(reg_addresses) > 0:
+            self._regif._set_many(reg_addresses, values)
+
+
+class CompiledField:  # pylint: disable=too-many-instance-attributes
+    """Precompiled register field accessor.
+
+    Use `RegisterInterface.compile_field()` to create it. All the arguments
+    are validated on creation and `read()`/`write()` call the register
+    interface implementation directly.
+    """
+
+    __slots__ = (
+        "regif",
+        "reg_address",
+        "pos",
+        "width",
+        "mask",
+        "shifted_mask",
+        "negative_mask",
+        "_field",
+    )
+
+    def __init__(
+        self,
+        regif: RegisterInterface,
+        reg_address: int,
+        field_pos: int,
+        field_width: int,
+    ):
+        """Validate the field and precompute the masks.
+
+        Arguments:
+            regif -- register interface the field is accessed with.
+            reg_address -- absolute address of the register.
+            field_pos -- field position in the register (counting from LSB).
+            field_width -- width of the field in bits.
+
+        Raises:
+            ValueError: raised if sanity check on the arguments doesn't pass.
+        """
+        # pylint: disable=protected-access
+        self._field = regif._field_spec(reg_address, field_pos, field_width)
+
+        self.regif = regif
+        self.reg_address = reg_address
+        self.pos = field_pos
+        self.width = field_width
+        self.mask = self._field.mask
+        self.shifted_mask = self._field.shifted_mask
+        self.negative_mask = ((1 << regif.data_width) - 1) ^ self.shifted_mask
+
+    def read(self) -> int:
+        """Read the field value.
+
+        Returns:
+            Value of the field.
+        """
+        # pylint: disable=protected-access
+        regif = self.regif
+        if regif._transaction is None:
+            reg_value = regif._get(self.reg_address)
+        else:
+            reg_value = regif._transaction.read(self.reg_address)
+        return regif._decode_field(self.reg_address, reg_value, self._field)
+
+    def write(self, value: int, ignore_other_fields: bool = False) -> None:
+        """Write the field value.
+
+        Arguments:
+            value -- new value of the field.
+
+        Keyword Arguments:
+            ignore_other_fields -- if set to True, other fields current values are ignored.
+
+        Raises:
+            ValueError: value is wider than the field.
+        """
+        # pylint: disable=protected-access
+        if value & self.mask != value:
+            raise ValueError(
+                f"Register/field value (0x{value:X}) wider than "
+                f"register/field width ({self.width})."
+            )
+        regif = self.regif
+        if regif._transaction is not None:
+            if regif._trace_active:
+                regif._trace(regif._Operation.SET, self.reg_address, value, self._field)
+            regif._transaction.modify(
+                self.reg_address,
+                self.negative_mask,
+                value << self.pos,
+                ignore_other_fields,
+            )
+            return
+        if ignore_other_fields:
+            reg_value = value << self.pos
+            regif._set(self.reg_address, reg_value)
+        else:
+            reg_value = regif._atomic_modify(
+                self.reg_address, self.shifted_mask, value << self.pos
+            )
+        if regif._trace_active:
+            regif._trace(regif._Operation.SET, self.reg_address, value, self._field)
+            regif._trace(regif._Operation.SET, self.reg_address, reg_value)
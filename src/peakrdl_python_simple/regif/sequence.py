@@ -0,0 +1,345 @@
+"""Declarative register access sequences."""
+
+__authors__ = ["Marek Pikuła <marek.pikula at embevity.com>"]
+
+import time
+from contextlib import nullcontext
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from .regif import RegisterInterface, WaitTimeoutError
+
+
+class SequenceError(RuntimeError):
+    """Step of a register access sequence failed."""
+
+    def __init__(self, message: str, step: int, captures: Dict[str, int]):
+        """Initialize the exception.
+
+        Arguments:
+            message -- exception message.
+            step -- index of the failed step.
+            captures -- values captured before the failure.
+        """
+        super().__init__(message)
+        self.step = step
+        self.captures = captures
+
+
+class SequenceOperation(Enum):
+    """Operation performed by a sequence step."""
+
+    SET = 0
+    GET = 1
+    MODIFY = 2
+    WAIT_FOR = 3
+    DELAY = 4
+
+
+class SequenceStep(NamedTuple):
+    """Single step of a register access sequence."""
+
+    operation: SequenceOperation
+    """Operation performed by the step."""
+
+    reg_address: int = 0
+    """Absolute address of the accessed register."""
+
+    value: int = 0
+    """Written value, modified bits value or expected bits value."""
+
+    mask: int = 0
+    """Mask of modified or compared bits."""
+
+    timeout: float = 0.0
+    """Wait timeout or delay duration in seconds."""
+
+    interval: float = 0.0
+    """Maximum polling interval of the wait in seconds."""
+
+    capture: Optional[str] = None
+    """Name under which the read, modified or matched value is captured."""
+
+    condition: Optional[Tuple[str, int, int]] = None
+    """Execute the step only if (capture name, mask, value) condition is met.
+
+    The condition is met if the masked captured value is equal to the value.
+    It's not met if the capture step was skipped.
+    """
+
+
+class RegSequence:
+    """Declarative register access sequence.
+
+    A sequence is built with chained calls and executed at once, either
+    locally with `run()` or next to the hardware by a remote register
+    interface server (e.g., `SocketRegIfClient.run_sequence()`), which takes a
+    single round-trip for the whole sequence and keeps its timing independent
+    of the link latency.
+
+    Example:
+        >>> sequence = (
+        ...     RegSequence()
+        ...     .set(0x10, 1)
+        ...     .wait_for(0x14, 0x1, 0x1, timeout=0.1)
+        ...     .get(0x18, capture="status")
+        ...     .set(0x1C, 0xFF, condition=("status", 0x80, 0x80))
+        ... )
+    """
+
+    def __init__(self, steps: Iterable[SequenceStep] = ()):
+        """Initialize the sequence.
+
+        Keyword Arguments:
+            steps -- initial steps of the sequence.
+        """
+        self.steps: List[SequenceStep] = []
+        """Steps of the sequence."""
+
+        for step in steps:
+            self.append(step)
+
+    def __len__(self) -> int:
+        """Get number of steps."""
+        return len(self.steps)
+
+    def append(self, step: SequenceStep) -> "RegSequence":
+        """Append a step to the sequence.
+
+        Arguments:
+            step -- step to append.
+
+        Returns:
+            The sequence itself for chaining.
+
+        Raises:
+            ValueError: the step condition refers to an unknown capture.
+        """
+        if step.condition is not None and step.condition[0] not in {
+            previous.capture for previous in self.steps
+        }:
+            raise ValueError(
+                f'Condition refers to unknown capture "{step.condition[0]}".'
+            )
+        self.steps.append(step)
+        return self
+
+    def set(
+        self,
+        reg_address: int,
+        value: int,
+        condition: Optional[Tuple[str, int, int]] = None,
+    ) -> "RegSequence":
+        """Append register write.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            value -- value to write to the register.
+
+        Keyword Arguments:
+            condition -- (capture name, mask, value) condition of the step.
+
+        Returns:
+            The sequence itself for chaining.
+        """
+        return self.append(
+            SequenceStep(SequenceOperation.SET, reg_address, value, condition=condition)
+        )
+
+    def get(
+        self,
+        reg_address: int,
+        capture: Optional[str] = None,
+        condition: Optional[Tuple[str, int, int]] = None,
+    ) -> "RegSequence":
+        """Append register read.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+
+        Keyword Arguments:
+            capture -- name under which the read value is captured.
+            condition -- (capture name, mask, value) condition of the step.
+
+        Returns:
+            The sequence itself for chaining.
+        """
+        return self.append(
+            SequenceStep(
+                SequenceOperation.GET,
+                reg_address,
+                capture=capture,
+                condition=condition,
+            )
+        )
+
+    def modify(  # pylint: disable=too-many-arguments
+        self,
+        reg_address: int,
+        mask: int,
+        value: int,
+        capture: Optional[str] = None,
+        condition: Optional[Tuple[str, int, int]] = None,
+    ) -> "RegSequence":
+        """Append register read-modify-write.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            mask -- mask of the register bits to modify.
+            value -- new value of the masked bits (already shifted).
+
+        Keyword Arguments:
+            capture -- name under which the new register value is captured.
+            condition -- (capture name, mask, value) condition of the step.
+
+        Returns:
+            The sequence itself for chaining.
+        """
+        return self.append(
+            SequenceStep(
+                SequenceOperation.MODIFY,
+                reg_address,
+                value,
+                mask,
+                capture=capture,
+                condition=condition,
+            )
+        )
+
+    def wait_for(  # pylint: disable=too-many-arguments
+        self,
+        reg_address: int,
+        mask: int,
+        value: int,
+        timeout: float = 1.0,
+        interval: float = 0.01,
+        capture: Optional[str] = None,
+        condition: Optional[Tuple[str, int, int]] = None,
+    ) -> "RegSequence":
+        """Append waiting until masked register bits are equal to the value.
+
+        The sequence fails if the timeout occurs.
+
+        Arguments:
+            reg_address -- absolute address of the register.
+            mask -- mask of the register bits to compare.
+            value -- expected value of the masked bits (already shifted).
+
+        Keyword Arguments:
+            timeout -- maximum time to wait in seconds.
+            interval -- maximum polling interval in seconds.
+            capture -- name under which the matching register value is captured.
+            condition -- (capture name, mask, value) condition of the step.
+
+        Returns:
+            The sequence itself for chaining.
+        """
+        return self.append(
+            SequenceStep(
+                SequenceOperation.WAIT_FOR,
+                reg_address,
+                value,
+                mask,
+                timeout,
+                interval,
+                capture,
+                condition,
+            )
+        )
+
+    def delay(
+        self, seconds: float, condition: Optional[Tuple[str, int, int]] = None
+    ) -> "RegSequence":
+        """Append a delay.
+
+        Arguments:
+            seconds -- duration of the delay.
+
+        Keyword Arguments:
+            condition -- (capture name, mask, value) condition of the step.
+
+        Returns:
+            The sequence itself for chaining.
+        """
+        return self.append(
+            SequenceStep(SequenceOperation.DELAY, timeout=seconds, condition=condition)
+        )
+
+    def run(
+        self,
+        regif: RegisterInterface,
+        serialize: Optional[Callable[[int], ContextManager[Any]]] = None,
+    ) -> Dict[str, int]:
+        """Execute the sequence.
+
+        Arguments:
+            regif -- register interface to execute the sequence with.
+
+        Keyword Arguments:
+            serialize -- factory of a context manager held during access to the
+                given register address (except waits and delays). Used by
+                servers to serialize the steps with requests of other clients.
+
+        Returns:
+            Captured values.
+
+        Raises:
+            SequenceError: a step failed or a wait timed out.
+        """
+        captures: Dict[str, int] = {}
+        for index, step in enumerate(self.steps):
+            if step.condition is not None:
+                name, mask, value = step.condition
+                if name not in captures or captures[name] & mask != value:
+                    continue
+
+            lock = (
+                nullcontext()
+                if serialize is None
+                or step.operation
+                in (SequenceOperation.WAIT_FOR, SequenceOperation.DELAY)
+                else serialize(step.reg_address)
+            )
+            result: Optional[int] = None
+            try:
+                with lock:
+                    if step.operation == SequenceOperation.SET:
+                        regif.set(step.reg_address, step.value)
+                    elif step.operation == SequenceOperation.GET:
+                        result = regif.get(step.reg_address)
+                    elif step.operation == SequenceOperation.MODIFY:
+                        result = regif.modify(step.reg_address, step.mask, step.value)
+                    elif step.operation == SequenceOperation.WAIT_FOR:
+                        result = regif.wait_for(
+                            step.reg_address,
+                            step.mask,
+                            step.value,
+                            step.timeout,
+                            step.interval,
+                        )
+                    elif step.operation == SequenceOperation.DELAY:
+                        time.sleep(step.timeout)
+                    else:
+                        raise NotImplementedError(
+                            f'Operation "{step.operation}" not supported.'
+                        )
+            except (ValueError, RuntimeError, WaitTimeoutError) as exc:
+                raise SequenceError(
+                    f"Sequence step {index} ({step.operation.name}) failed: {exc}",
+                    index,
+                    captures,
+                ) from exc
+
+            if step.capture is not None and result is not None:
+                captures[step.capture] = result
+        return captures
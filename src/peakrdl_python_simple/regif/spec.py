@@ -76,6 +76,15 @@ class FieldNodeSpec(VectorNodeSpec):  # pylint: disable=too-many-instance-attrib
     #   has_aliases: bool
     #   aliases: Iterator["FieldNodeSpec"]
     encode: str
+    onread: Optional[str] = None
+    """Name of `onread` side effect (e.g., "rclr") or None if there is none."""
+    onwrite: Optional[str] = None
+    """Name of `onwrite` side effect (e.g., "woclr") or None if there is none."""
+
+    @property
+    def has_side_effects(self) -> bool:
+        """Check if software access changes the field in other way than storing."""
+        return self.onread is not None or self.onwrite is not None
 
 
 @dataclass(frozen=True)
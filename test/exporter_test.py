@@ -9,6 +9,7 @@ from systemrdl import RDLCompiler  # type: ignore
 
 from example.accelera_generic_example import SomeRegisterMapAddrmap
 from peakrdl_python_simple.exporter import PythonExporter
+from peakrdl_python_simple.regif import access
 from peakrdl_python_simple.regif.impl.dummy import DummyRegIf
 
 
@@ -65,3 +66,111 @@ def test_exporter_regif(test_regif: DummyRegIf):
     assert regmap.myRegInst.data0 == 3
     assert regmap.myRegInst.data1 == 2
     assert regmap.myRegInst.data2 == 0
+
+
+def test_exporter_lazy_children(test_regif: DummyRegIf):
+    """Child nodes are instantiated per instance and follow its regif."""
+    regmap = SomeRegisterMapAddrmap(test_regif)
+    assert "fifo_port_1" not in vars(regmap), "Children should be created lazily."
+    tail = regmap.fifo_port_1.tail  # type: ignore
+    assert regmap.fifo_port_1.tail is tail  # type: ignore
+
+    other_regif = DummyRegIf(8 * 4, range(0, 0x1000), 0)
+    other_regmap = SomeRegisterMapAddrmap(other_regif)
+    other_regmap.fifo_port_1.tail.data = 1  # type: ignore
+    tail.data = 2
+    assert other_regif.get(tail.spec.absolute_address) == 1
+    assert test_regif.get(tail.spec.absolute_address) == 2
+
+    regmap.regif = other_regif
+    assert tail.data == 1, "Instantiated children should follow the new regif."
+    regmap.fifo_port_1.regif = test_regif  # type: ignore
+    assert tail.data == 2
+    assert regmap.myRegInst.regif is other_regif
+    regmap.regif = other_regif
+    assert tail.data == 1, "Setting regif of the parent should override children."
+
+
+def test_exporter_regif_members(test_regif: DummyRegIf):
+    """Register interface reaches members attached after creation."""
+    other_regif = DummyRegIf(8 * 4, range(0, 0x1000), 0)
+    regmap = SomeRegisterMapAddrmap(test_regif)
+    extra = type(regmap.myRegInst)(
+        other_regif, specification=regmap.myRegInst.spec  # type: ignore
+    )
+    regmap.extra = extra  # type: ignore
+    regmap.regif = other_regif
+    regmap.regif = test_regif
+    assert extra.regif is test_regif, "Instance members should follow the parent."
+
+    class LateAddrmap(SomeRegisterMapAddrmap):  # pylint: disable=all
+        """Address map with a child attached after class creation."""
+
+    template = type(regmap.myRegInst)(
+        specification=regmap.myRegInst.spec  # type: ignore
+    )
+    setattr(LateAddrmap, "late", template)
+    late_regmap = LateAddrmap(test_regif)
+    other_late_regmap = LateAddrmap(other_regif)
+    assert late_regmap.late is not template  # type: ignore
+    assert late_regmap.late is not other_late_regmap.late  # type: ignore
+    assert late_regmap.late.regif is test_regif  # type: ignore
+    assert other_late_regmap.late.regif is other_regif  # type: ignore
+
+
+def test_exporter_metrics(test_regif: DummyRegIf):
+    """Access metrics rolled up by hierarchy path."""
+    regmap = SomeRegisterMapAddrmap(test_regif)
+    test_regif.metrics_enabled = True
+    regmap.myRegInst.data0 = 3
+    regmap.fifo_port_1.tail.data = 1  # type: ignore
+    assert regmap.myRegInst.data0 == 3
+
+    stats = regmap.collect_metrics()
+    assert stats["some_register_map.myRegInst"].reads == 2
+    assert stats["some_register_map.fifo_port_1.tail"].writes == 1
+    assert stats["some_register_map"].writes == 2
+
+
+def test_exporter_numpy():
+    """Register array access with NumPy arrays."""
+    numpy = pytest.importorskip("numpy")
+    test_regif = DummyRegIf(8 * 4, range(0, 0x2000), 0)
+    regmap = SomeRegisterMapAddrmap(test_regif)
+
+    values = numpy.arange(16, dtype=numpy.uint32).reshape(8, 2)
+    regmap.from_numpy(values, "vc_pkt_count")
+    assert test_regif.get(regmap.vc_pkt_count_1_0.spec.absolute_address) == 2
+    assert (regmap.to_numpy("vc_pkt_count") == values).all()
+    assert regmap.myRegInst.to_numpy().shape == (1,)
+    with pytest.raises(AttributeError):
+        regmap.to_numpy("myRegInst")
+    with pytest.raises(ValueError):
+        regmap.from_numpy(values[:4], "vc_pkt_count")
+
+
+def test_exporter_mem(tmp_path):
+    """Memories are exported as `MemAccess` members."""
+    numpy = pytest.importorskip("numpy")
+    in_path = tmp_path / "mem.rdl"
+    in_path.write_text(
+        "addrmap mem_map {\n"
+        "    reg { field { sw = rw; } data[32]; } ctrl @ 0x0;\n"
+        "    external mem { mementries = 16; memwidth = 32; } buffer @ 0x100;\n"
+        "};\n",
+        encoding="UTF-8",
+    )
+    out_path = tmp_path / "mem_map.py"
+    rdlc = RDLCompiler()
+    rdlc.compile_file(str(in_path))
+    PythonExporter().export(rdlc.elaborate(), str(out_path))  # type: ignore
+
+    namespace: dict = {}
+    exec(out_path.read_text(encoding="UTF-8"), namespace)  # pylint: disable=exec-used
+    test_regif = DummyRegIf(8 * 4, range(0, 0x1000), 0)
+    regmap = namespace["MemMapAddrmap"](test_regif)
+    assert isinstance(regmap.buffer, access.MemAccess)
+
+    regmap.buffer.from_numpy(numpy.arange(16, dtype=numpy.uint32))
+    assert test_regif.get(0x10C) == 3
+    assert list(regmap.buffer.to_numpy()) == list(range(16))
@@ -0,0 +1,91 @@
+"""Asynchronous register interface tests."""
+
+__authors__ = ["Marek Pikuła <marek.pikula at embevity.com>"]
+
+import asyncio
+import threading
+
+import pytest
+
+from peakrdl_python_simple.regif import __main__ as test_classes
+from peakrdl_python_simple.regif.impl.async_socket import AsyncSocketRegIfClient
+from peakrdl_python_simple.regif.impl.dummy import DummyRegIf
+from peakrdl_python_simple.regif.impl.socket import SocketRegIfServer
+
+
+@pytest.fixture
+def server_regif() -> DummyRegIf:
+    """Create register interface published by the server."""
+    return DummyRegIf(8 * 4, range(0, 0x1000))
+
+
+@pytest.fixture
+def server_address(server_regif: DummyRegIf):
+    """Start a socket server in background."""
+    server = SocketRegIfServer(server_regif)
+    address = server.listen(("localhost", 0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield address
+    server.shutdown()
+    thread.join()
+
+
+def test_async_client(server_address, server_regif: DummyRegIf):
+    """Many requests in flight over a single connection."""
+
+    async def scenario():
+        async with await AsyncSocketRegIfClient.connect(
+            server_address, 8 * 4, range(0, 0x1000)
+        ) as regif:
+            await asyncio.gather(*(regif.set(0x100 + 4 * i, i) for i in range(32)))
+            values = await asyncio.gather(
+                *(regif.get(0x100 + 4 * i) for i in range(32))
+            )
+            assert values == list(range(32))
+            await regif.set_field(0x10, 4, 4, 0xA)
+            assert await regif.get_field(0x10, 4, 4) == 0xA
+            assert await regif.get_many([0x10, 0x104]) == [0xA0, 1]
+
+    asyncio.run(scenario())
+    assert server_regif.get(0x17C) == 31
+
+
+def test_async_reg_access(server_address, server_regif: DummyRegIf):
+    """Register access with asynchronous register interface."""
+
+    async def scenario():
+        async with await AsyncSocketRegIfClient.connect(server_address, 8 * 4) as regif:
+            test_reg = test_classes.TestReg(regif)
+            await test_reg.write_field("test_field", test_classes.TestEnum.VALUE_2)
+            assert (
+                await test_reg.read_field("test_field") == test_classes.TestEnum.VALUE_2
+            )
+            assert await test_reg.read() == 2 << 10
+            value = await test_reg.modify(test_field=test_classes.TestEnum.VALUE_1)
+            assert value.test_field == test_classes.TestEnum.VALUE_1
+            await test_reg.write(0)
+            with pytest.raises(TypeError):
+                test_reg.test_field  # pylint: disable=pointless-statement
+
+    asyncio.run(scenario())
+    assert server_regif.get(0) == 0
+
+
+def test_async_send_error(server_address, monkeypatch):
+    """Requests failing to be sent don't stay pending."""
+
+    async def scenario():
+        async with await AsyncSocketRegIfClient.connect(server_address, 8 * 4) as regif:
+
+            async def send(request):
+                raise ConnectionResetError("Send failed.")
+
+            monkeypatch.setattr(regif, "_send", send)
+            with pytest.raises(ConnectionResetError):
+                await regif.get(0x10)
+            assert not regif._pending
+            monkeypatch.undo()
+            assert await regif.get(0x10) == 0
+
+    asyncio.run(scenario())
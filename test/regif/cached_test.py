@@ -0,0 +1,117 @@
+"""Cached register interface tests."""
+
+__authors__ = ["Marek Pikuła <marek.pikula at embevity.com>"]
+
+from dataclasses import replace
+from typing import List
+
+import pytest
+
+from peakrdl_python_simple.regif import __main__ as test_classes
+from peakrdl_python_simple.regif.access import FieldAccess
+from peakrdl_python_simple.regif.impl.cached import CachedRegIf
+from peakrdl_python_simple.regif.impl.dummy import DummyRegIf
+
+
+class CountingRegIf(DummyRegIf):
+    """Dummy register interface recording hardware reads."""
+
+    def __init__(self):
+        """Initialize the register interface."""
+        super().__init__(8 * 4, range(0, 0x1000))
+        self.reads: List[int] = []
+
+    def _get(self, reg_address: int) -> int:
+        self.reads.append(reg_address)
+        return super()._get(reg_address)
+
+    def _get_many(self, reg_addresses):
+        self.reads.extend(reg_addresses)
+        return super()._get_many(reg_addresses)
+
+
+@pytest.fixture
+def hw_regif() -> CountingRegIf:
+    """Create the underlying register interface."""
+    return CountingRegIf()
+
+
+@pytest.fixture
+def test_regif(hw_regif: CountingRegIf) -> CachedRegIf:
+    """Create the cached register interface."""
+    return CachedRegIf(hw_regif)
+
+
+def test_non_volatile_cached(test_regif: CachedRegIf, hw_regif: CountingRegIf):
+    """Non-volatile registers are read from hardware only once."""
+    test_regif.register_volatility(0x10, False)
+    test_regif.set_field(0x10, 0, 4, 3)
+    test_regif.set_field(0x10, 4, 4, 5)
+    assert test_regif.get(0x10) == 0x53
+    assert hw_regif.reads == [0x10]
+    assert hw_regif.get(0x10) == 0x53, "Writes should go through to hardware."
+
+    hw_regif.set(0x10, 0x77)
+    assert test_regif.get(0x10) == 0x53
+    test_regif.sync()
+    assert test_regif.get(0x10) == 0x77
+    test_regif.invalidate(range(0x10, 0x14))
+    assert test_regif.get_many([0x10, 0x14]) == [0x77, 0]
+    assert hw_regif.reads == [0x10, 0x10, 0x10, 0x10, 0x14]
+
+
+def test_volatile_not_cached(test_regif: CachedRegIf, hw_regif: CountingRegIf):
+    """Volatile and unknown registers always go to hardware."""
+    test_regif.register_volatility(0x10, True)
+    test_regif.get(0x10)
+    test_regif.get(0x10)
+    test_regif.get(0x14)
+    test_regif.get(0x14)
+    assert hw_regif.reads == [0x10, 0x10, 0x14, 0x14]
+
+
+def test_access_registers_volatility(test_regif: CachedRegIf, hw_regif: CountingRegIf):
+    """Register access classes declare volatility of their registers."""
+    test_reg = test_classes.TestReg(test_regif)
+    test_reg.test_field = test_classes.TestEnum.VALUE_2
+    assert test_reg.test_field == test_classes.TestEnum.VALUE_2
+    assert hw_regif.reads == [], "Single-field register should never be read."
+
+
+class VolatileReg(test_classes.TestReg):
+    """Test register with a volatile field."""
+
+    test_field = FieldAccess(
+        replace(vars(test_classes.TestReg)["test_field"].spec, is_volatile=True),
+        test_classes.TestEnum,
+    )
+
+
+def test_read_registers_volatility(hw_regif: CountingRegIf):
+    """Whole register access declares volatility before the first access."""
+    test_regif = CachedRegIf(hw_regif, default_volatile=False)
+    test_reg = VolatileReg(test_regif)
+    hw_regif.set(0, 1 << 10)
+    assert test_reg.read().test_field == test_classes.TestEnum.VALUE_1
+    hw_regif.set(0, 2 << 10)
+    assert test_reg.read().test_field == test_classes.TestEnum.VALUE_2
+    assert hw_regif.reads == [0, 0], "Volatile register should always be read."
+
+
+class ClearOnWriteReg(test_classes.TestReg):
+    """Test register with a write one to clear field."""
+
+    test_field = FieldAccess(
+        replace(vars(test_classes.TestReg)["test_field"].spec, onwrite="woclr"),
+        test_classes.TestEnum,
+    )
+
+
+def test_side_effects_not_cached(hw_regif: CountingRegIf):
+    """Registers with side effects of software access are never cached."""
+    test_regif = CachedRegIf(hw_regif, default_volatile=False)
+    test_reg = ClearOnWriteReg(test_regif)
+    assert test_reg.is_volatile
+    test_reg.read()
+    test_reg.read()
+    assert hw_regif.reads == [0, 0]
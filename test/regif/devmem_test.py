@@ -0,0 +1,87 @@
+"""Devmem register interface tests."""
+
+__authors__ = ["Marek Pikuła <marek.pikula at embevity.com>"]
+
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+
+from peakrdl_python_simple.regif.impl.devmem import DevmemRegIf
+
+FAKE_DEVMEM = """#!/bin/sh
+# Fake devmem keeping register values in files.
+[ "$1" = "--help" ] && exit 0
+[ "$1" = "0xBAD" ] && exit 1
+echo "devmem: accessing $1" >&2
+[ "$1" = "0xE0" ] && echo "garbage" && exit 0
+echo "$1" >> "{root}/calls"
+if [ $# -eq 3 ]; then
+    echo "$3" > "{root}/$1"
+elif [ -f "{root}/$1" ]; then
+    cat "{root}/$1"
+else
+    echo 0x0
+fi
+"""
+
+
+@pytest.fixture
+def devmem(tmp_path: Path) -> List[str]:
+    """Create fake devmem command."""
+    command = tmp_path / "devmem"
+    command.write_text(FAKE_DEVMEM.format(root=tmp_path), encoding="UTF-8")
+    command.chmod(0o755)
+    return [str(command)]
+
+
+@pytest.fixture(params=[False, True], ids=["spawn", "persistent"])
+def test_regif(request, devmem: List[str]) -> Iterator[DevmemRegIf]:
+    """Create register interface in both modes."""
+    regif = DevmemRegIf(8 * 4, range(0, 0x1000), devmem, persistent=request.param)
+    yield regif
+    regif.close()
+
+
+def test_read_write(test_regif: DevmemRegIf):
+    """Single and bulk register access."""
+    test_regif.set(0x10, 0x1234)
+    assert test_regif.get(0x10) == 0x1234
+    test_regif.write_block(0x100, [1, 2, 3])
+    assert test_regif.get_many([0x104, 0x10, 0x20]) == [2, 0x1234, 0]
+
+
+def test_error(test_regif: DevmemRegIf):
+    """Failing command is reported and the interface stays usable."""
+    with pytest.raises(RuntimeError):
+        test_regif.get(0xBAD)
+    with pytest.raises(RuntimeError):
+        test_regif.get_many([0x10, 0xBAD, 0x20])
+    test_regif.set(0x10, 1)
+    assert test_regif.get(0x10) == 1
+
+
+def test_unexpected_output(test_regif: DevmemRegIf):
+    """Messages on standard error are ignored and invalid output is reported."""
+    assert test_regif.get_many([0x10, 0x20]) == [0, 0]
+    with pytest.raises(RuntimeError, match="garbage"):
+        test_regif.get(0xE0)
+    with pytest.raises(RuntimeError, match="garbage"):
+        test_regif.get_many([0x10, 0xE0])
+    test_regif.set(0x10, 1)
+    assert test_regif.get(0x10) == 1
+
+
+def test_persistent_shell(devmem: List[str], tmp_path: Path):
+    """The coprocess is started once and restarted after close."""
+    regif = DevmemRegIf(8 * 4, range(0, 0x1000), devmem, persistent=True)
+    regif.set(0x10, 5)
+    process = regif._process
+    assert process is not None
+    assert regif.get_many([0x10, 0x10]) == [5, 5]
+    assert regif._process is process
+    regif.close()
+    assert process.poll() is not None
+    assert regif.get(0x10) == 5
+    regif.close()
+    assert (tmp_path / "calls").read_text().split() == ["0x10"] * 4
@@ -0,0 +1,141 @@
+"""Memory mapped register interface tests."""
+
+__authors__ = ["Marek Pikuła <marek.pikula at embevity.com>"]
+
+import gc
+import math
+import mmap
+import threading
+import time
+from array import array
+from pathlib import Path
+
+import pytest
+
+from peakrdl_python_simple.regif.impl.mmap import MmapRegIf, WindowedMmapRegIf
+from peakrdl_python_simple.regif.regif import WaitTimeoutError
+
+
+@pytest.fixture
+def test_regif(tmp_path: Path) -> MmapRegIf:
+    """Create register interface backed by a regular file."""
+    device = tmp_path / "mem"
+    device.write_bytes(bytes(0x3000))
+    return MmapRegIf(device, 8 * 4, range(0x1000, 0x3000))
+
+
+def test_read_write(test_regif: MmapRegIf):
+    """Single register access."""
+    test_regif.set(0x1004, 0xDEADBEEF)
+    assert test_regif.get(0x1004) == 0xDEADBEEF
+    assert test_regif.get(0x1000) == 0
+
+
+def test_bulk_access(test_regif: MmapRegIf):
+    """Bulk register access matches single register access."""
+    test_regif.write_block(0x1100, [1, 2, 3, 0xFFFFFFFF])
+    assert test_regif.read_block(0x1100, 4) == [1, 2, 3, 0xFFFFFFFF]
+    assert test_regif.get(0x110C) == 0xFFFFFFFF
+
+    test_regif.set_many([(0x2000, 7), (0x1000, 8)])
+    assert test_regif.get_many([0x1000, 0x2000, 0x1104]) == [8, 7, 2]
+
+
+def test_wait_for(test_regif: MmapRegIf):
+    """Busy-polling sees writes from other threads."""
+    timer = threading.Timer(0.02, test_regif.set, (0x1010, 0x80000000))
+    timer.start()
+    assert test_regif.wait_for(0x1010, 0x80000000, 0x80000000, timeout=5) == 0x80000000
+    timer.join()
+    with pytest.raises(WaitTimeoutError):
+        test_regif.wait_for(0x1010, 0x1, 0x1, timeout=0.01)
+
+    # Long waits back off to the polling interval instead of busy-polling.
+    start = time.thread_time()
+    with pytest.raises(WaitTimeoutError):
+        test_regif.wait_for(0x1010, 0x1, 0x1, timeout=0.3, interval=0.05)
+    assert time.thread_time() - start < 0.1
+    with pytest.raises(ValueError):
+        test_regif.wait_for(0x1010, 0x1, 0x1, timeout=math.nan)
+
+
+def test_buffer_block_access(test_regif: MmapRegIf):
+    """Block copies into and from caller-provided buffers."""
+    test_regif.write_block_from(0x1200, array("I", [1, 2, 0xFFFFFFFF]))
+    assert test_regif.read_block(0x1200, 3) == [1, 2, 0xFFFFFFFF]
+
+    buffer = array("I", [0] * 2)
+    assert test_regif.read_block_into(0x1204, buffer) == 2
+    assert list(buffer) == [2, 0xFFFFFFFF]
+
+    with pytest.raises(ValueError):
+        test_regif.read_block_into(0x2FFC, bytearray(8))
+    with pytest.raises(ValueError):
+        test_regif.write_block_from(0x1200, b"\x00")
+
+
+def test_as_array(test_regif: MmapRegIf):
+    """Arrays alias the mapped memory."""
+    numpy = pytest.importorskip("numpy")
+    array_view = test_regif.as_array(0x1400, 4)
+    array_view[:] = [1, 2, 3, 0xFFFFFFFF]
+    assert test_regif.read_block(0x1400, 4) == [1, 2, 3, 0xFFFFFFFF]
+    test_regif.set(0x1404, 5)
+    assert array_view[1] == 5
+    assert test_regif.as_array(0x1400, 2, numpy.uint64)[0] == (5 << 32) | 1
+
+    test_regif.write_array(0x1500, numpy.arange(8).reshape(2, 4))
+    assert list(test_regif.read_array(0x1500, 8)) == list(range(8))
+    with pytest.raises(ValueError):
+        test_regif.write_array(0x1500, numpy.array([1 << 32]))
+    with pytest.raises(ValueError):
+        test_regif.as_array(0x2FFC, 2)
+
+
+def test_as_array_outlives_regif(tmp_path: Path):
+    """Arrays keep the mapping alive after the register interface is dropped."""
+    pytest.importorskip("numpy")
+    device = tmp_path / "mem"
+    device.write_bytes(bytes(0x3000))
+    regif = MmapRegIf(device, 8 * 4, range(0x1000, 0x3000))
+    regif.set(0x1400, 7)
+    array_view = regif.as_array(0x1400, 4)
+    del regif
+    gc.collect()
+    assert array_view[0] == 7
+    array_view[1] = 9
+    assert device.read_bytes()[0x1404] == 9
+
+
+def test_unaligned_bounds(tmp_path: Path):
+    """Address bounds don't need to be page-aligned."""
+    device = tmp_path / "mem"
+    device.write_bytes(bytes(0x3000))
+    regif = MmapRegIf(device, 8 * 4, range(0x1010, 0x3000))
+    regif.set(0x1010, 0x1234)
+    assert regif.get(0x1010) == 0x1234
+    assert device.read_bytes()[0x1010:0x1014] == bytes([0x34, 0x12, 0, 0])
+
+
+def test_windowed(tmp_path: Path):
+    """Windows are mapped on first access and the mapped size is capped."""
+    device = tmp_path / "mem"
+    device.write_bytes(bytes(0x5000))
+    granularity = mmap.ALLOCATIONGRANULARITY
+    regif = WindowedMmapRegIf(
+        device,
+        8 * 4,
+        range(0x10, 4 * granularity),
+        window_size=granularity,
+        max_mapped_bytes=2 * granularity,
+    )
+    assert regif.mapped_bytes == 0
+    regif.set(0x10, 1)
+    regif.set(2 * granularity, 2)
+    regif.write_block(granularity - 4, [3, 4])  # Crosses window boundary.
+    assert regif.mapped_bytes <= 2 * granularity
+    assert regif.get(0x10) == 1
+    assert regif.get(2 * granularity) == 2
+    assert regif.read_block(granularity - 4, 2) == [3, 4]
+    assert regif.mapped_bytes <= 2 * granularity
+    assert regif.wait_for(granularity, 0xF, 4, timeout=0.01) == 4
@@ -0,0 +1,119 @@
+"""Multi-region register interface tests."""
+
+__authors__ = ["Marek Pikuła <marek.pikula at embevity.com>"]
+
+import threading
+from typing import List, Sequence
+
+import pytest
+
+from peakrdl_python_simple.regif.impl.dummy import DummyRegIf
+from peakrdl_python_simple.regif.impl.multiregion import MultiRegionRegIf
+
+
+class BarrierRegIf(DummyRegIf):
+    """Dummy register interface waiting for concurrent batch reads."""
+
+    def __init__(self, address_bounds: range, barrier: threading.Barrier):
+        """Initialize the register interface."""
+        super().__init__(8 * 4, address_bounds)
+        self.barrier = barrier
+
+    def _get_many(self, reg_addresses: Sequence[int]) -> List[int]:
+        self.barrier.wait()
+        return super()._get_many(reg_addresses)
+
+
+@pytest.fixture
+def sub_regions() -> List[DummyRegIf]:
+    """Create sub-regions in unsorted order with a gap at 0x200-0x300."""
+    return [
+        DummyRegIf(8 * 4, range(0x300, 0x400)),
+        DummyRegIf(8 * 4, range(0x0, 0x100)),
+        DummyRegIf(8 * 4, range(0x100, 0x200)),
+    ]
+
+
+@pytest.fixture
+def test_regif(sub_regions: List[DummyRegIf]) -> MultiRegionRegIf:
+    """Create the multi-region register interface."""
+    return MultiRegionRegIf(sub_regions)
+
+
+def test_dispatch(test_regif: MultiRegionRegIf, sub_regions: List[DummyRegIf]):
+    """Accesses are dispatched to the sub-region containing the address."""
+    for address in (0x0, 0xFC, 0x100, 0x1FC, 0x300, 0x3FC, 0x4, 0x304):
+        test_regif.set(address, address + 1)
+    assert sub_regions[1].get(0xFC) == 0xFD
+    assert sub_regions[2].get(0x100) == 0x101
+    assert sub_regions[0].get(0x3FC) == 0x3FD
+    assert test_regif.get(0x1FC) == 0x1FD
+    assert test_regif.modify(0x304, 0xF0, 0x20) == 0x325
+    assert test_regif.wait_for(0x304, 0xF0, 0x20, timeout=0) == 0x325
+
+    with pytest.raises(ValueError):
+        test_regif.get(0x200)
+
+
+def test_overlap_detection():
+    """Overlapping sub-regions, including fully contained ones, are rejected."""
+    with pytest.raises(ValueError):
+        MultiRegionRegIf(
+            [
+                DummyRegIf(8 * 4, range(0x0, 0x400)),
+                DummyRegIf(8 * 4, range(0x100, 0x200)),
+            ]
+        )
+    with pytest.raises(ValueError):
+        MultiRegionRegIf(
+            [
+                DummyRegIf(8 * 4, range(0x100, 0x200)),
+                DummyRegIf(8 * 4, range(0x0, 0x400)),
+            ]
+        )
+    with pytest.raises(ValueError):
+        MultiRegionRegIf(
+            [
+                DummyRegIf(8 * 4, range(0x0, 0x104)),
+                DummyRegIf(8 * 4, range(0x100, 0x200)),
+            ]
+        )
+    MultiRegionRegIf(
+        [DummyRegIf(8 * 4, range(0x100, 0x200)), DummyRegIf(8 * 4, range(0x0, 0x100))]
+    )
+
+
+def test_bulk_split(test_regif: MultiRegionRegIf, sub_regions: List[DummyRegIf]):
+    """Batches are split per sub-region and merged back in the caller's order."""
+    addresses = [0x304, 0x0, 0x104, 0x4, 0x300, 0x108]
+    test_regif.set_many((address, address + 1) for address in addresses)
+    assert sub_regions[1].get_many([0x0, 0x4]) == [0x1, 0x5]
+    assert test_regif.get_many(addresses) == [address + 1 for address in addresses]
+
+    test_regif.write_block(0xF8, [1, 2, 3, 4])
+    assert sub_regions[2].get_many([0x100, 0x104]) == [3, 4]
+    assert test_regif.read_block(0xF8, 4) == [1, 2, 3, 4]
+
+    with pytest.raises(ValueError):
+        test_regif.write_block(0x1FC, [5, 6])
+    assert test_regif.get(0x1FC) == 0, "Nothing should be written on failure."
+
+
+def test_concurrent_batches():
+    """Batches spanning multiple sub-regions are transferred concurrently."""
+    barrier = threading.Barrier(3, timeout=5)
+    regions = [
+        BarrierRegIf(range(0x200, 0x300), barrier),
+        BarrierRegIf(range(0x0, 0x100), barrier),
+        BarrierRegIf(range(0x100, 0x200), barrier),
+    ]
+    test_regif = MultiRegionRegIf(regions, max_workers=8)
+    addresses = [0x204, 0x0, 0x104, 0x4, 0x200, 0x108]
+    test_regif.set_many((address, address + 1) for address in addresses)
+    assert test_regif.get_many(addresses) == [address + 1 for address in addresses]
+
+    test_regif.write_block(0x1FC, [1, 2])
+    assert regions[0].get(0x200) == 2
+    values = test_regif.read_block(0xFC, 67)
+    assert values[:3] == [0, 0, 0x105] and values[-3:] == [1, 2, 0x205]
+    test_regif.close()
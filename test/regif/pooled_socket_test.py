@@ -0,0 +1,128 @@
+"""Pooled socket register interface client tests."""
+
+__authors__ = ["Marek Pikuła <marek.pikula at embevity.com>"]
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue
+from typing import Iterator
+
+import pytest
+
+from peakrdl_python_simple.regif.impl.dummy import DummyRegIf
+from peakrdl_python_simple.regif.impl.pooled_socket import PooledSocketRegIfClient
+from peakrdl_python_simple.regif.impl.socket import SocketRegIfServer
+from peakrdl_python_simple.regif.impl.socket_transport import SocketAddress
+
+
+@pytest.fixture
+def server_regif() -> DummyRegIf:
+    """Create register interface published by the server."""
+    return DummyRegIf(8 * 4, range(0, 0x1000))
+
+
+@pytest.fixture
+def server_address(server_regif: DummyRegIf) -> Iterator[SocketAddress]:
+    """Start a socket server in background."""
+    server = SocketRegIfServer(server_regif)
+    address = server.listen(("localhost", 0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield address
+    server.shutdown()
+    thread.join()
+
+
+@pytest.mark.parametrize("per_thread", [False, True])
+def test_parallel_access(
+    server_address: SocketAddress, server_regif: DummyRegIf, per_thread: bool
+):
+    """Threads share a limited number of connections."""
+    regif = PooledSocketRegIfClient(
+        server_address,
+        8 * 4,
+        range(0, 0x1000),
+        max_connections=3,
+        per_thread=per_thread,
+    )
+    assert regif.connection_count == 0
+    with ThreadPoolExecutor(3) as executor:
+        list(executor.map(lambda i: regif.set(4 * i, i), range(64)))
+        assert list(executor.map(lambda i: regif.get(4 * i), range(64))) == list(
+            range(64)
+        )
+    assert 1 <= regif.connection_count <= 3
+    assert server_regif.read_block(0, 64) == list(range(64))
+    assert regif.modify(0, 0xF0, 0x50) == 0x50
+    assert regif.get_many([4, 8]) == [1, 2]
+    regif.close()
+
+
+def test_reconnect(server_address: SocketAddress):
+    """Broken idle connections are replaced transparently."""
+    regif = PooledSocketRegIfClient(
+        server_address, 8 * 4, range(0, 0x1000), idle_check_interval=0
+    )
+    regif.set(0x10, 5)
+    assert regif.connection_count == 1
+    client, _ = regif._idle[0]
+    client.close()
+    assert regif.get(0x10) == 5
+    assert regif.connection_count == 1
+    assert regif._idle[0][0] is not client
+    assert regif._idle[0][0].ping()
+    regif.close()
+    assert regif.connection_count == 0
+
+
+def test_subscribe(server_address: SocketAddress, server_regif: DummyRegIf):
+    """Subscription callbacks can use the pool while the subscription holds a connection."""
+    regif = PooledSocketRegIfClient(
+        server_address, 8 * 4, range(0, 0x1000), max_connections=2
+    )
+    values: "Queue[int]" = Queue()
+    subscription = regif.subscribe(
+        [0x10], 0.005, lambda change: values.put(regif.get(0x20))
+    )
+    assert regif.connection_count == 1
+    assert len(regif._idle) == 0
+    server_regif.set(0x20, 7)
+    server_regif.set(0x10, 1)
+    assert values.get(timeout=5) == 7
+    assert regif.connection_count == 2
+    subscription.close()
+    assert len(regif._idle) == 2
+    regif.close()
+    assert regif.connection_count == 0
+
+
+def test_close_per_thread(server_address: SocketAddress):
+    """Closing the pool closes connections held by threads."""
+    regif = PooledSocketRegIfClient(
+        server_address, 8 * 4, range(0, 0x1000), per_thread=True
+    )
+    regif.set(0x10, 5)
+    client = regif._local.held.client
+    regif.close()
+    assert not client.connected
+    assert regif.get(0x10) == 5
+    assert regif._local.held.client is not client
+    assert regif.connection_count == 1
+
+
+def test_per_thread_exhausted(server_address: SocketAddress):
+    """Threads beyond the connection limit fail instead of waiting forever."""
+    regif = PooledSocketRegIfClient(
+        server_address,
+        8 * 4,
+        range(0, 0x1000),
+        max_connections=1,
+        per_thread=True,
+        checkout_timeout=0.1,
+    )
+    regif.set(0x10, 5)
+    with ThreadPoolExecutor(1) as executor:
+        with pytest.raises(RuntimeError, match="held by threads"):
+            executor.submit(regif.get, 0x10).result(5)
+    assert regif.get(0x10) == 5
+    regif.close()
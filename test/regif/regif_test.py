@@ -2,10 +2,17 @@
 
 __authors__ = ["Marek Pikuła <marek.pikula at embevity.com>"]
 
+import threading
+import time
+from dataclasses import replace
+
 import pytest
 
 from peakrdl_python_simple.regif import __main__ as test_classes
+from peakrdl_python_simple.regif.access import FieldAccess
 from peakrdl_python_simple.regif.impl.dummy import DummyRegIf
+from peakrdl_python_simple.regif.metrics import RegIfMetrics
+from peakrdl_python_simple.regif.regif import WaitTimeoutError
 
 
 @pytest.fixture
@@ -53,3 +60,254 @@ def test_write_wrong_int(test_reg: test_classes.TestReg):
     """Passing wrong value to the field."""
     with pytest.raises(ValueError):
         test_reg.test_field = 3  # type: ignore
+
+
+def test_bulk_access(test_regif: DummyRegIf):
+    """Bulk register reads and writes."""
+    test_regif.set_many([(0x10, 1), (0x20, 2), (0x14, 3)])
+    assert test_regif.get_many([0x20, 0x10, 0x14, 0x18]) == [2, 1, 3, 0]
+
+    test_regif.write_block(0x100, [5, 6, 7])
+    assert test_regif.read_block(0x100, 3) == [5, 6, 7]
+    assert test_regif.get(0x104) == 6
+    assert test_regif.read_block(0x100, 0) == []
+
+
+def test_bulk_access_validation(test_regif: DummyRegIf):
+    """Bulk access arguments are validated for the whole batch."""
+    with pytest.raises(ValueError):
+        test_regif.get_many([0x10, 0x1000])
+    with pytest.raises(ValueError):
+        test_regif.read_block(0xFF8, 3)
+    with pytest.raises(ValueError):
+        test_regif.set_many([(0x10, 1), (0x14, 1 << 32)])
+    assert test_regif.get(0x10) == 0, "Nothing should be written on failed validation."
+
+
+def test_compiled_field(test_regif: DummyRegIf):
+    """Precompiled field accessor keeps other fields intact."""
+    test_regif.set(0x10, 0xF00F)
+    field = test_regif.compile_field(0x10, 4, 4)
+    assert field.read() == 0
+    field.write(0xA)
+    assert field.read() == 0xA
+    assert test_regif.get(0x10) == 0xF0AF
+    assert test_regif.get_field(0x10, 4, 4) == 0xA
+
+    with pytest.raises(ValueError):
+        field.write(0x10)
+    with pytest.raises(ValueError):
+        test_regif.set_field(0x10, 4, 4, 0x10)
+    assert test_regif._cached_field(0x10, 4, 4) is test_regif._cached_field(
+        0x10, 4, 4
+    ), "Field accessors of get_field()/set_field() should be cached."
+    with pytest.raises(ValueError):
+        test_regif.compile_field(0x1000, 0, 1)
+    with pytest.raises(ValueError):
+        test_regif.compile_field(0x10, 32, 1)
+
+
+def test_field_regif_change(test_reg: test_classes.TestReg):
+    """Field accessors follow register interface change of the register."""
+    test_reg.test_field = test_classes.TestEnum.VALUE_1
+    other_regif = DummyRegIf(8 * 4, range(0, 0x1000), 4 << 10)
+    test_reg.regif = other_regif
+    assert test_reg.test_field == test_classes.TestEnum.VALUE_4
+    test_reg.test_field = test_classes.TestEnum.VALUE_2
+    assert other_regif.get(0) == 2 << 10
+
+    other_regif.set(0, 3 << 10)
+    with pytest.raises(ValueError):
+        _ = test_reg.test_field
+    # Python < 3.12 wraps exceptions of `__set_name__()` in RuntimeError.
+    with pytest.raises((TypeError, RuntimeError)):
+        type("Register", (), {"field": test_classes.TestReg.test_field})
+
+
+def test_transaction(test_regif: DummyRegIf):
+    """Field writes in a transaction are coalesced into a single register write."""
+    writes = []
+    set_many = test_regif._set_many
+
+    def spy_set_many(reg_addresses, values):
+        writes.extend(zip(reg_addresses, values))
+        set_many(reg_addresses, values)
+
+    test_regif._set_many = spy_set_many  # type: ignore
+    test_regif.set(0x10, 0xF000)
+    with test_regif.transaction(sort_by_address=True):
+        test_regif.set_field(0x10, 0, 4, 1)
+        test_regif.set_field(0x10, 4, 4, 2)
+        test_regif.set(0x8, 3)
+        assert test_regif.get_field(0x10, 4, 4) == 2, "Pending write should be visible."
+        assert test_regif.get(0x10) == 0xF021, "Pending write should be visible."
+        assert writes == [], "Nothing should be written yet."
+    assert writes == [(0x8, 3), (0x10, 0xF021)]
+
+    with pytest.raises(KeyError):
+        with test_regif.transaction():
+            test_regif.set(0x10, 0)
+            raise KeyError()
+    assert test_regif.get(0x10) == 0xF021, "Failed transaction should be discarded."
+
+
+def test_reg_transaction(test_reg: test_classes.TestReg, test_regif: DummyRegIf):
+    """Transaction used through the register access interface."""
+    with test_reg.transaction():
+        test_reg.test_field = test_classes.TestEnum.VALUE_4
+        assert test_reg.test_field == test_classes.TestEnum.VALUE_4
+        assert test_regif._get(0) == 0, "Nothing should be written yet."
+    assert test_regif.get(0) == 4 << 10
+
+
+def test_field_by_name(test_reg: test_classes.TestReg, test_regif: DummyRegIf):
+    """Field and whole register access by name with synchronous interface."""
+    test_reg.write_field("test_field", 1)
+    assert test_reg.read_field("test_field") == test_classes.TestEnum.VALUE_1
+    assert test_reg.read() == 1 << 10
+    test_reg.write(0)
+    assert test_regif.get(0) == 0
+    with pytest.raises(AttributeError):
+        test_reg.read_field("no_such_field")
+
+
+def test_reg_value(test_reg: test_classes.TestReg, test_regif: DummyRegIf):
+    """Whole register snapshot, write and read-modify-write with field values."""
+    test_regif.set(0, 0x800F)
+    value = test_reg.read()
+    assert value == 0x800F
+    assert value.test_field == test_classes.TestEnum.VALUE_0
+    assert isinstance(value.test_field, test_classes.TestEnum)
+    assert value._asdict() == {"test_field": test_classes.TestEnum.VALUE_0}
+    assert repr(value) == "TestRegValue(0x800F, test_field=<TestEnum.VALUE_0: 0>)"
+    with pytest.raises(AttributeError):
+        value.test_field = 1  # type: ignore
+
+    test_reg.write(0x800F, test_field=test_classes.TestEnum.VALUE_2)
+    assert test_regif.get(0) == 0x880F
+    assert test_reg.modify(test_field=test_classes.TestEnum.VALUE_4) == 0x900F
+    assert test_reg.read().test_field == test_classes.TestEnum.VALUE_4
+    test_reg.write(test_field=1)
+    assert test_regif.get(0) == 1 << 10
+
+    with pytest.raises(ValueError):
+        test_reg.modify(test_field=3)
+    with pytest.raises(AttributeError):
+        test_reg.write(no_such_field=1)
+
+
+class ControlNamesReg(test_classes.TestReg):
+    """Register with fields named like control arguments of register methods."""
+
+    _spec = replace(test_classes.TestReg._spec, field_count=3)
+
+    value = FieldAccess(
+        replace(
+            vars(test_classes.TestReg)["test_field"].spec,
+            inst_name="value",
+            msb=3,
+            lsb=0,
+            high=3,
+            low=0,
+            width=4,
+        ),
+        int,
+    )
+
+    timeout = FieldAccess(
+        replace(value.spec, inst_name="timeout", msb=7, lsb=4, high=7, low=4), int
+    )
+
+
+def test_control_field_names(test_regif: DummyRegIf):
+    """Fields can be named like control arguments of register methods."""
+    test_reg = ControlNamesReg(test_regif)
+    test_reg.write(0x8000, value=0x5, timeout=0x3)
+    assert test_regif.get(0) == 0x8035
+    assert test_reg.modify(value=0x6) == 0x8036
+    assert test_reg.read().value == 0x6
+    assert test_reg.wait_until(value=0x6, timeout=0x3, _timeout=0.01) == 0x8036
+    with pytest.raises(WaitTimeoutError):
+        test_reg.wait_until(_timeout=0.01, value=0x7)
+
+
+def test_modify(test_regif: DummyRegIf):
+    """Read-modify-write of masked register bits."""
+    test_regif.set(0x10, 0xFF00)
+    assert test_regif.modify(0x10, 0x0FF0, 0x0AB0) == 0xFAB0
+    assert test_regif.get(0x10) == 0xFAB0
+    with pytest.raises(ValueError):
+        test_regif.modify(0x10, 0x00F0, 0x0100)
+
+
+def test_wait_for(test_reg: test_classes.TestReg, test_regif: DummyRegIf):
+    """Polling register until the masked value matches."""
+    timer = threading.Timer(0.02, test_regif.set, (0, 0x2 << 10))
+    timer.start()
+    assert test_regif.wait_for(0, 0x7 << 10, 0x2 << 10, timeout=5) == 0x2 << 10
+    timer.join()
+    assert test_reg.wait_until(test_field=test_classes.TestEnum.VALUE_2) == 0x2 << 10
+
+    with pytest.raises(WaitTimeoutError) as exc_info:
+        test_reg.wait_until(_timeout=0.01, test_field=1)
+    assert exc_info.value.value == 0x2 << 10
+    with pytest.raises(ValueError):
+        test_regif.wait_for(0, 0x00F0, 0x0100)
+
+
+def test_atomic_rmw(test_regif: DummyRegIf):
+    """Concurrent field writes to the same register don't lose updates."""
+    get = test_regif._get
+
+    def slow_get(reg_address: int) -> int:
+        value = get(reg_address)
+        time.sleep(0.001)
+        return value
+
+    test_regif._get = slow_get  # type: ignore
+    test_regif.atomic_rmw_enabled = True
+    fields = [test_regif.compile_field(0x10, bit, 1) for bit in range(16)]
+    threads = [
+        threading.Thread(target=lambda field=field: [field.write(1) for _ in range(5)])
+        for field in fields
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert test_regif.get(0x10) == 0xFFFF
+
+
+def test_metrics(test_regif: DummyRegIf):
+    """Access metrics are collected per address."""
+    assert test_regif.metrics is None
+    test_regif.metrics_enabled = True
+    test_regif.set(0x10, 1)
+    test_regif.get(0x10)
+    test_regif.set_field(0x10, 4, 4, 2)
+    test_regif.read_block(0x20, 4)
+
+    metrics = test_regif.metrics
+    assert metrics is not None
+    stats = metrics.as_dict()
+    assert stats[0x10]["reads"] == 2
+    assert stats[0x10]["writes"] == 2
+    assert stats[0x10]["bytes_written"] == 8
+    assert stats[0x2C]["reads"] == 1, "Block read should be counted only once."
+    assert sum(stats[0x10]["read_latency_ns"].values()) == 2
+    assert metrics.summary(range(0x20, 0x30)).reads == 4
+    assert len(metrics.report(top=2).splitlines()) == 3
+
+    test_regif.metrics_enabled = False
+    assert "_get" not in test_regif.__dict__
+
+
+def test_metrics_modify():
+    """Read-modify-write time is counted only once."""
+    metrics = RegIfMetrics(4)
+    metrics.record([0x10], 1000, read=True, write=True)
+    metrics.record([0x10], 300, read=True)
+    stats = metrics.summary()
+    assert (stats.reads, stats.writes) == (2, 1)
+    assert (stats.read_time_ns, stats.write_time_ns) == (800, 500)
+    assert stats.total_time_ns == 1300
@@ -0,0 +1,56 @@
+"""Register access sequence tests."""
+
+__authors__ = ["Marek Pikuła <marek.pikula at embevity.com>"]
+
+import threading
+
+import pytest
+
+from peakrdl_python_simple.regif.impl.dummy import DummyRegIf
+from peakrdl_python_simple.regif.sequence import RegSequence, SequenceError
+
+
+@pytest.fixture
+def test_regif() -> DummyRegIf:
+    """Create register interface to run sequences with."""
+    return DummyRegIf(8 * 4, range(0, 0x1000))
+
+
+def test_run(test_regif: DummyRegIf):
+    """Steps are executed in order and values are captured."""
+    test_regif.set(0x14, 0x81)
+    timer = threading.Timer(0.02, test_regif.set, (0x18, 0x3))
+    timer.start()
+    captures = (
+        RegSequence()
+        .set(0x10, 0xF0)
+        .modify(0x10, 0x0F, 0x05, capture="modified")
+        .get(0x14, capture="status")
+        .set(0x20, 1, condition=("status", 0x80, 0x80))
+        .set(0x24, 1, condition=("status", 0x80, 0x00))
+        .wait_for(0x18, 0x2, 0x2, timeout=5, capture="ready")
+        .delay(0.001)
+        .run(test_regif)
+    )
+    timer.join()
+    assert captures == {"modified": 0xF5, "status": 0x81, "ready": 0x3}
+    assert test_regif.get(0x20) == 1
+    assert test_regif.get(0x24) == 0
+
+
+def test_errors(test_regif: DummyRegIf):
+    """Failed steps are reported with their index."""
+    with pytest.raises(ValueError):
+        RegSequence().set(0x10, 1, condition=("unknown", 1, 1))
+
+    sequence = (
+        RegSequence()
+        .get(0x10, capture="before")
+        .wait_for(0x10, 0x1, 0x1, timeout=0.01)
+        .set(0x10, 1)
+    )
+    with pytest.raises(SequenceError) as exc_info:
+        sequence.run(test_regif)
+    assert exc_info.value.step == 1
+    assert exc_info.value.captures == {"before": 0}
+    assert test_regif.get(0x10) == 0
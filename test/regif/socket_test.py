@@ -0,0 +1,565 @@
+"""Socket register interface tests."""
+
+__authors__ = ["Marek Pikuła <marek.pikula at embevity.com>"]
+
+import math
+import mmap
+import struct
+import threading
+import time
+from multiprocessing.connection import Listener
+from pathlib import Path
+from typing import Iterator, List
+
+import pytest
+
+from peakrdl_python_simple.regif.impl.dummy import DummyRegIf
+from peakrdl_python_simple.regif.impl.shared_memory import (
+    SHARED_MEMORY_ENABLED,
+    SharedRing,
+)
+from peakrdl_python_simple.regif.impl.socket import (
+    PROTOCOL_VERSION,
+    SocketRegIfClient,
+    SocketRegIfPacket,
+    SocketRegIfServer,
+    decode_packet,
+    encode_packet,
+)
+from peakrdl_python_simple.regif.impl.socket_transport import SHARED_MEMORY_PREFIX
+from peakrdl_python_simple.regif.regif import WaitTimeoutError
+from peakrdl_python_simple.regif.sequence import RegSequence
+
+
+@pytest.fixture
+def server_regif() -> DummyRegIf:
+    """Create register interface published by the server."""
+    return DummyRegIf(8 * 4, range(0, 0x1000))
+
+
+@pytest.fixture
+def test_regif(server_regif: DummyRegIf) -> Iterator[SocketRegIfClient]:
+    """Start a socket server in background and connect to it."""
+    server = SocketRegIfServer(server_regif)
+    address = server.listen(("localhost", 0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield SocketRegIfClient(address, 8 * 4, range(0, 0x1000))
+    server.shutdown()
+    thread.join()
+
+
+def test_read_write(test_regif: SocketRegIfClient, server_regif: DummyRegIf):
+    """Single register access."""
+    test_regif.set(0x10, 0x1234)
+    assert server_regif.get(0x10) == 0x1234
+    assert test_regif.get(0x10) == 0x1234
+
+
+def test_bulk_access(test_regif: SocketRegIfClient, server_regif: DummyRegIf):
+    """Bulk register access in a single round-trip."""
+    test_regif.write_block(0x100, [1, 2, 3])
+    assert server_regif.read_block(0x100, 3) == [1, 2, 3]
+    test_regif.set_many([(0x20, 5), (0x10, 6)])
+    assert test_regif.get_many([0x10, 0x20, 0x104]) == [6, 5, 2]
+
+
+def test_modify(test_regif: SocketRegIfClient, server_regif: DummyRegIf):
+    """Field write uses server-side read-modify-write."""
+    server_regif.set(0x10, 0xF00F)
+    test_regif.set_field(0x10, 4, 8, 0xAB)
+    assert server_regif.get(0x10) == 0xFABF
+    assert test_regif.modify(0x10, 0xF000, 0) == 0x0ABF
+
+
+def test_wait_for(test_regif: SocketRegIfClient, server_regif: DummyRegIf):
+    """Polling is done on the server side."""
+    timer = threading.Timer(0.02, server_regif.set, (0x10, 0x100))
+    timer.start()
+    assert test_regif.wait_for(0x10, 0xF00, 0x100, timeout=5) == 0x100
+    timer.join()
+    with pytest.raises(WaitTimeoutError):
+        test_regif.wait_for(0x10, 0xF00, 0x200, timeout=0.01)
+
+
+def test_pipelining(test_regif: SocketRegIfClient, server_regif: DummyRegIf):
+    """Many requests in flight are matched with their responses."""
+    server_regif.write_block(0, list(range(100)))
+    writes = [test_regif.set_async(0x200 + 4 * i, i) for i in range(100)]
+    reads = [test_regif.get_async(4 * i) for i in range(100)]
+    assert [read.result(5) for read in reads] == list(range(100))
+    for write in writes:
+        write.result(5)
+    assert server_regif.read_block(0x200, 100) == list(range(100))
+
+    test_regif.close()
+    with pytest.raises(RuntimeError):
+        test_regif.get(0)
+
+
+def test_batch(test_regif: SocketRegIfClient, server_regif: DummyRegIf):
+    """Mixed operations executed in a single round-trip."""
+    Op = SocketRegIfPacket.Operation
+    BatchOp = SocketRegIfPacket.BatchOp
+    OK = SocketRegIfPacket.Status.RESPONSE_OK
+    server_regif.set(0x10, 0xF00F)
+    operations = [
+        BatchOp(Op.SET, 0x20, 1),
+        BatchOp(Op.SET, 0x24, 2),
+        BatchOp(Op.GET, 0x20),
+        BatchOp(Op.GET, 0x24),
+        BatchOp(Op.MODIFY, 0x10, 0xAB0, 0xFF0),
+        BatchOp(Op.GET, 0x2000),
+        BatchOp(Op.GET, 0x10),
+    ]
+    # Address out of the server range is allowed by the client.
+    test_regif._address_bounds = None
+
+    results = test_regif.batch(operations)
+    assert [result.status for result in results[:5]] == [OK] * 5
+    assert [result.value for result in results[:5]] == [None, None, 1, 2, 0xFABF]
+    assert len(results) == 6
+    assert results[5].status == SocketRegIfPacket.Status.RESPONSE_ERROR
+
+    results = test_regif.batch(operations, continue_on_error=True)
+    assert len(results) == 7
+    assert results[6] == (OK, 0xFABF, None)
+
+
+def test_batch_bulk_error(test_regif: SocketRegIfClient, server_regif: DummyRegIf):
+    """Invalid operations split bulk runs and failed bulk runs aren't replayed."""
+    Op = SocketRegIfPacket.Operation
+    BatchOp = SocketRegIfPacket.BatchOp
+    OK = SocketRegIfPacket.Status.RESPONSE_OK
+    ERROR = SocketRegIfPacket.Status.RESPONSE_ERROR
+    test_regif._address_bounds = None
+    results = test_regif.batch(
+        [
+            BatchOp(Op.SET, 0x20, 1),
+            BatchOp(Op.SET, 0x2000, 2),
+            BatchOp(Op.SET, 0x24, 3),
+        ],
+        continue_on_error=True,
+    )
+    assert [result.status for result in results] == [OK, ERROR, OK]
+    assert server_regif.get_many([0x20, 0x24]) == [1, 3]
+
+    def failing_get_many(reg_addresses):
+        raise RuntimeError("Bus error")
+
+    gets: List[int] = []
+    server_regif._get_many = failing_get_many  # type: ignore
+    server_regif._get = gets.append  # type: ignore
+    results = test_regif.batch(
+        [BatchOp(Op.GET, 0x20), BatchOp(Op.GET, 0x24), BatchOp(Op.SET, 0x28, 1)]
+    )
+    assert [result.status for result in results] == [ERROR, ERROR]
+    assert "Bus error" in str(results[0].message)
+    assert gets == [], "Failed bulk operation shouldn't be replayed."
+
+
+def test_negotiation(
+    test_regif: SocketRegIfClient, server_regif: DummyRegIf, monkeypatch
+):
+    """Operations missing in older protocol versions are emulated."""
+    assert test_regif.protocol_version == PROTOCOL_VERSION
+    old_response = SocketRegIfPacket(
+        4,
+        (SocketRegIfPacket.Operation.GET, 0),
+        (SocketRegIfPacket.Status.RESPONSE_ERROR, "Unsupported protocol version"),
+        0,
+        None,
+    )
+    assert SocketRegIfClient._negotiated_version(old_response) == 4
+    test_regif.close()
+
+    # Pickle wire format of protocol version 1 needs to be allowed on both sides.
+    server = SocketRegIfServer(server_regif, allow_pickle=True)
+    address = server.listen(("localhost", 0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        SocketRegIfClient, "_negotiated_version", staticmethod(lambda response: 1)
+    )
+    old_client = SocketRegIfClient(address, 8 * 4, range(0, 0x1000), allow_pickle=True)
+    assert old_client.protocol_version == 1
+    with pytest.raises(RuntimeError, match="not supported in protocol version"):
+        old_client._request(SocketRegIfPacket.Operation.GET_MANY, reg_addresses=[0])
+    server_regif.set(0x10, 0xF00F)
+    assert old_client.modify(0x10, 0xFF0, 0xAB0) == 0xFABF
+    old_client.set_many([(0x20, 5), (0x24, 6)])
+    assert old_client.get_many([0x20, 0x24]) == [5, 6]
+    assert old_client.wait_for(0x20, 0xF, 5) == 5
+    results = old_client.batch(
+        [
+            SocketRegIfPacket.BatchOp(SocketRegIfPacket.Operation.GET, 0x10),
+            SocketRegIfPacket.BatchOp(SocketRegIfPacket.Operation.SET, 0x10, 0),
+        ]
+    )
+    assert [result.value for result in results] == [0xFABF, None]
+    assert server_regif.get(0x10) == 0
+    old_client.close()
+    server.shutdown()
+    thread.join()
+
+
+@pytest.mark.parametrize("value_bytes", [4, 3])
+def test_binary_format(value_bytes: int):
+    """Binary wire format round-trip."""
+    Op = SocketRegIfPacket.Operation
+    Status = SocketRegIfPacket.Status
+    packet = SocketRegIfPacket(
+        PROTOCOL_VERSION,
+        (Op.BATCH, 1234),
+        (Status.RESPONSE_ERROR, "Error message"),
+        0x10,
+        0xABCDEF,
+        [0, 4, 8],
+        [1, 2, 0xFFFFFF],
+        0xFF00,
+        0.5,
+        0.01,
+        [SocketRegIfPacket.BatchOp(Op.MODIFY, 0x20, 1, 3)],
+        [SocketRegIfPacket.BatchResult(Status.RESPONSE_ERROR, None, "Failed")],
+        continue_on_error=True,
+    )
+    data = encode_packet(packet, True, value_bytes)
+    assert decode_packet(data, allow_pickle=False) == packet
+    assert (
+        len(
+            encode_packet(
+                SocketRegIfPacket(6, (Op.GET, 1), (Status.REQUEST, None), 0x10, None),
+                True,
+            )
+        )
+        < 32
+    )
+
+    with pytest.raises(ValueError):
+        decode_packet(data[:-1])
+    with pytest.raises(ValueError):
+        decode_packet(encode_packet(packet), allow_pickle=False)
+
+
+@pytest.mark.parametrize("client_pickle", [True, False])
+def test_pickle_disabled(server_regif: DummyRegIf, client_pickle: bool):
+    """Server not accepting pickle makes the client switch to binary format."""
+    server = SocketRegIfServer(server_regif)
+    address = server.listen(("localhost", 0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    client = SocketRegIfClient(
+        address, 8 * 4, range(0, 0x1000), allow_pickle=client_pickle
+    )
+    assert client.protocol_version == PROTOCOL_VERSION
+    client.set(0x10, 0x1234)
+    assert client.get_many([0x10, 0x14]) == [0x1234, 0]
+    client.close()
+    server.shutdown()
+    thread.join()
+
+
+def test_unexpected_error(server_regif: DummyRegIf, monkeypatch):
+    """Unexpected server errors don't leave the connection hanging."""
+    server = SocketRegIfServer(server_regif)
+    address = server.listen(("localhost", 0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    client = SocketRegIfClient(address, 8 * 4, range(0, 0x1000))
+    other_client = SocketRegIfClient(address, 8 * 4, range(0, 0x1000))
+
+    def process_message(*args, **kwargs):
+        raise KeyError("unexpected")
+
+    monkeypatch.setattr(server, "_process_message", process_message)
+    with pytest.raises(RuntimeError, match="unexpected"):
+        client.get(0x10)
+    monkeypatch.undo()
+    assert client.get(0x10) == 0
+    assert other_client.get(0x10) == 0
+    client.close()
+    other_client.close()
+    server.shutdown()
+    thread.join()
+
+
+def test_oversized_values(server_regif: DummyRegIf):
+    """Values not fitting the server data width are answered with an error."""
+    server = SocketRegIfServer(server_regif)
+    address = server.listen(("localhost", 0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    client = SocketRegIfClient(address, 8 * 8, range(0, 0x1000))
+    with pytest.raises(RuntimeError, match="Response error"):
+        client.batch(
+            [SocketRegIfPacket.BatchOp(SocketRegIfPacket.Operation.SET, 0x10, 1 << 40)]
+        )
+    assert client.get(0x10) == 0
+    client.close()
+    server.shutdown()
+    thread.join()
+
+
+def test_pickled_response_rejected():
+    """Client doesn't unpickle responses once binary format is negotiated."""
+    listener = Listener(("localhost", 0))
+
+    def serve():
+        with listener.accept() as conn:
+            request = decode_packet(conn.recv_bytes())
+            request.value = PROTOCOL_VERSION
+            request.status = (SocketRegIfPacket.Status.RESPONSE_OK, None)
+            conn.send_bytes(encode_packet(request, True))
+            request = decode_packet(conn.recv_bytes(), allow_pickle=False)
+            request.value = 0
+            request.status = (SocketRegIfPacket.Status.RESPONSE_OK, None)
+            conn.send_bytes(encode_packet(request, False))
+            # Wait for closing by the client.
+            conn.poll(5)
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    client = SocketRegIfClient(
+        listener.address, 8 * 4, range(0, 0x1000), allow_pickle=True
+    )
+    with pytest.raises(RuntimeError):
+        client.get(0x10)
+    client.close()
+    thread.join(5)
+    listener.close()
+
+
+def test_duration_limits(server_regif: DummyRegIf):
+    """Too long waits and sequences are rejected before execution."""
+    server = SocketRegIfServer(server_regif, max_wait=0.5, max_sequence_duration=1.0)
+    address = server.listen(("localhost", 0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    client = SocketRegIfClient(address, 8 * 4, range(0, 0x1000))
+    with pytest.raises(RuntimeError, match="server limit"):
+        client.wait_for(0x10, 0x1, 0x1, timeout=5)
+    with pytest.raises(RuntimeError, match="server limit"):
+        client.run_sequence(RegSequence().set(0x10, 1).delay(5))
+    with pytest.raises(RuntimeError, match="server limit"):
+        client.run_sequence(RegSequence().set(0x10, 1).delay(0.4).delay(0.4).delay(0.4))
+    assert server_regif.get(0x10) == 0, "Rejected sequence shouldn't be executed."
+    with pytest.raises(RuntimeError, match="server limit"):
+        client.run_sequence(
+            RegSequence()
+            .get(0x10, "flag")
+            .delay(0.4)
+            .delay(0.4)
+            .delay(0.4, ("flag", 0x1, 0x1))
+        )
+    with pytest.raises(RuntimeError, match="not allowed"):
+        client.run_sequence(RegSequence().delay(0.4).delay(0.4).delay(-0.5))
+    with pytest.raises(RuntimeError, match="not allowed"):
+        client.run_sequence(RegSequence().wait_for(0x10, 0x1, 0x1, timeout=math.nan))
+    with pytest.raises(ValueError):
+        client.wait_for(0x10, 0x1, 0x1, timeout=math.nan)
+    with pytest.raises(RuntimeError, match="not allowed"):
+        client.wait_for(0x10, 0x1, 0x1, timeout=0.1, interval=math.inf)
+    assert server_regif.get(0x10) == 0, "Rejected sequence shouldn't be executed."
+    assert client.run_sequence(RegSequence().set(0x10, 1).delay(0.001)) == {}
+    assert server_regif.get(0x10) == 1
+    client.close()
+    server.shutdown()
+    thread.join()
+
+
+def test_multiple_clients(server_regif: DummyRegIf):
+    """Clients are served concurrently and modifications stay atomic."""
+    server = SocketRegIfServer(server_regif, max_connections=3)
+    address = server.listen(("localhost", 0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    clients = [SocketRegIfClient(address, 8 * 4, range(0, 0x1000)) for _ in range(3)]
+
+    # A waiting client doesn't block the one it's waiting for.
+    waiting = clients[0].get_async(0)
+    wait_value = threading.Thread(
+        target=clients[0].wait_for, args=(0x10, 0x1, 0x1), kwargs={"timeout": 5}
+    )
+    wait_value.start()
+    clients[1].set(0x10, 1)
+    wait_value.join()
+    assert waiting.result(5) == 0
+
+    def set_bits(client: SocketRegIfClient, first_bit: int):
+        for bit in range(first_bit, 30, 3):
+            client.modify(0x20, 1 << bit, 1 << bit)
+
+    workers = [
+        threading.Thread(target=set_bits, args=(client, i))
+        for i, client in enumerate(clients)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert server_regif.get(0x20) == (1 << 30) - 1
+
+    with pytest.raises(RuntimeError, match="negotiation"):
+        SocketRegIfClient(address, 8 * 4, range(0, 0x1000))
+    assert server.connection_count == 3
+
+    for client in clients:
+        client.close()
+    server.shutdown()
+    thread.join()
+
+
+def test_sequence(test_regif: SocketRegIfClient, server_regif: DummyRegIf):
+    """Sequences are executed on the server side."""
+    server_regif.set(0x14, 0x81)
+    sequence = (
+        RegSequence()
+        .set(0x10, 0xF0)
+        .modify(0x10, 0x0F, 0x05, capture="modified")
+        .get(0x14, capture="status")
+        .set(0x20, 1, condition=("status", 0x80, 0x80))
+        .wait_for(0x20, 0x1, 0x1, capture="ready")
+        .delay(0.001)
+    )
+    expected = {"modified": 0xF5, "status": 0x81, "ready": 0x1}
+    assert test_regif.run_sequence(sequence) == expected
+
+    packet = SocketRegIfPacket(
+        PROTOCOL_VERSION,
+        (SocketRegIfPacket.Operation.SEQUENCE, 1),
+        (SocketRegIfPacket.Status.RESPONSE_OK, None),
+        0,
+        None,
+        sequence=sequence.steps,
+        captures=expected,
+    )
+    assert decode_packet(encode_packet(packet, True, 4)) == packet
+
+    with pytest.raises(RuntimeError, match="step 1"):
+        test_regif.run_sequence(
+            RegSequence().get(0x10).wait_for(0x10, 0x1, 0x0, timeout=0.01)
+        )
+
+    # Older servers get the sequence executed step by step.
+    test_regif._protocol_version = 6
+    server_regif.set(0x20, 0)
+    assert test_regif.run_sequence(sequence) == expected
+
+
+def test_subscribe(server_regif: DummyRegIf):
+    """Changes of subscribed registers are pushed from a coalesced sampled set."""
+    server = SocketRegIfServer(server_regif)
+    address = server.listen(("localhost", 0))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    clients = [SocketRegIfClient(address, 8 * 4) for _ in range(2)]
+    server_regif.set(0x10, 1)
+
+    received: List[SocketRegIfPacket.Change] = []
+    first = clients[0].subscribe([0x10, 0x14], 0.005)
+    second = clients[1].subscribe([0x14, 0x10], 0.005, received.append)
+    assert first.values == {0x10: 1, 0x14: 0}
+    assert len(server._sampled) == 1
+
+    server_regif.set(0x14, 2)
+    change = first.get(timeout=5)
+    assert change is not None
+    assert (change.reg_address, change.old, change.new) == (0x14, 0, 2)
+    assert first.values == {0x10: 1, 0x14: 2}
+    first.close()
+    assert first.get() is None
+
+    server_regif.set(0x10, 3)
+    deadline = time.monotonic() + 5
+    while len(received) < 2 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert [(change.reg_address, change.new) for change in received] == [
+        (0x14, 2),
+        (0x10, 3),
+    ]
+
+    # Older servers are polled by the client.
+    clients[0]._protocol_version = 7
+    with clients[0].subscribe([0x20], 0.005) as polled:
+        server_regif.set(0x20, 4)
+        change = polled.get(timeout=5)
+        assert change is not None and change.new == 4
+
+    clients[1].close()
+    assert list(second) == []
+    deadline = time.monotonic() + 5
+    while server._sampled and time.monotonic() < deadline:
+        time.sleep(0.005)
+    assert not server._sampled
+    clients[0].close()
+    server.shutdown()
+    thread.join()
+
+
+@pytest.mark.parametrize(
+    "prefix",
+    [
+        "",
+        pytest.param(
+            SHARED_MEMORY_PREFIX,
+            marks=pytest.mark.skipif(
+                not SHARED_MEMORY_ENABLED, reason="Shared memory not supported."
+            ),
+        ),
+    ],
+)
+def test_local_transport(server_regif: DummyRegIf, tmp_path: Path, prefix: str):
+    """Local clients connect over Unix domain socket or shared memory."""
+    server = SocketRegIfServer(server_regif, channel_capacity=256)
+    path = server.listen(str(tmp_path / "regif.sock"), 0o666)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    client = SocketRegIfClient(f"{prefix}{path}", 8 * 4, range(0, 0x1000))
+
+    client.set(0x10, 0x1234)
+    assert server_regif.get(0x10) == 0x1234
+    assert client.get(0x10) == 0x1234
+
+    # Messages larger than the ring and many requests in flight.
+    client.write_block(0x100, list(range(200)))
+    assert client.read_block(0x100, 200) == list(range(200))
+    reads = [client.get_async(0x100 + 4 * i) for i in range(200)]
+    assert [read.result(5) for read in reads] == list(range(200))
+
+    client.close()
+    assert not client.connected
+    server.shutdown()
+    thread.join()
+    assert not tmp_path.joinpath("regif.sock").exists()
+
+
+@pytest.mark.skipif(not SHARED_MEMORY_ENABLED, reason="Shared memory not supported.")
+def test_corrupted_channel(server_regif: DummyRegIf, tmp_path: Path):
+    """Corrupted shared memory ring closes only the connection of its client."""
+    memory = mmap.mmap(-1, SharedRing.size(16))
+    ring = SharedRing(memory, 0, 16)
+    struct.pack_into("=Q", memory, 0, 1000)
+    with pytest.raises(OSError):
+        ring.read()
+
+    server = SocketRegIfServer(server_regif, channel_capacity=256)
+    path = server.listen(str(tmp_path / "regif.sock"), 0o666)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    client = SocketRegIfClient(f"{SHARED_MEMORY_PREFIX}{path}", 8 * 4, range(0, 0x1000))
+    other_client = SocketRegIfClient(
+        f"{SHARED_MEMORY_PREFIX}{path}", 8 * 4, range(0, 0x1000)
+    )
+    client.set(0x10, 1)
+
+    # Read position of the responses past the written ones.
+    responses = client._conn._channel._incoming  # type: ignore
+    struct.pack_into("=Q", responses._memory, responses._offset + 8, 1 << 40)
+    with pytest.raises(RuntimeError):
+        client.get(0x10)
+    assert thread.is_alive()
+    assert other_client.get(0x10) == 1
+
+    other_client.close()
+    server.shutdown()
+    thread.join()